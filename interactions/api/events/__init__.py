@@ -76,6 +76,7 @@ from .internal import (
     AutocompleteError,
     ButtonPressed,
     CallbackAdded,
+    ClusterMessage,
     CommandCompletion,
     CommandError,
     Component,
@@ -84,6 +85,8 @@ from .internal import (
     Connect,
     Disconnect,
     Error,
+    EventLoopBlocked,
+    EventLoopLag,
     ExtensionCommandParse,
     ExtensionLoad,
     ExtensionUnload,
@@ -95,7 +98,11 @@ from .internal import (
     Select,
     ShardConnect,
     ShardDisconnect,
+    ShardHealthy,
+    ShardRestart,
+    ShardUnhealthy,
     Startup,
+    TaskLimitExceeded,
     WebsocketReady,
 )
 from .base import BaseEvent, GuildEvent, RawGatewayEvent
@@ -119,6 +126,7 @@ __all__ = (
     "ChannelDelete",
     "ChannelPinsUpdate",
     "ChannelUpdate",
+    "ClusterMessage",
     "CommandCompletion",
     "CommandError",
     "Component",
@@ -130,6 +138,8 @@ __all__ = (
     "EntitlementDelete",
     "EntitlementUpdate",
     "Error",
+    "EventLoopBlocked",
+    "EventLoopLag",
     "ExtensionCommandParse",
     "ExtensionLoad",
     "ExtensionUnload",
@@ -181,10 +191,14 @@ __all__ = (
     "Select",
     "ShardConnect",
     "ShardDisconnect",
+    "ShardHealthy",
+    "ShardRestart",
+    "ShardUnhealthy",
     "StageInstanceCreate",
     "StageInstanceDelete",
     "StageInstanceUpdate",
     "Startup",
+    "TaskLimitExceeded",
     "ThreadCreate",
     "ThreadDelete",
     "ThreadListSync",
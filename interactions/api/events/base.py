@@ -1,4 +1,6 @@
+import functools
 import re
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
 import attrs
@@ -17,6 +19,14 @@ __all__ = ("BaseEvent", "GuildEvent", "RawGatewayEvent")
 
 _event_reg = re.compile("(?<!^)(?=[A-Z])")
 
+# the data of the gateway dispatch being processed, which listener filters are checked against
+_dispatch_payload: ContextVar[dict | None] = ContextVar("_dispatch_payload", default=None)
+
+
+@functools.cache
+def _resolve_event_name(name: str) -> str:
+    return _event_reg.sub("_", name).lower()
+
 
 @attrs.define(eq=False, order=False, hash=False, slots=False, kw_only=False)
 class BaseEvent:
@@ -35,8 +45,7 @@ class BaseEvent:
     @property
     def resolved_name(self) -> str:
         """The name of the event, defaults to the class name if not overridden."""
-        name = self.override_name or self.__class__.__name__
-        return _event_reg.sub("_", name).lower()
+        return _resolve_event_name(self.override_name or self.__class__.__name__)
 
     @classmethod
     def listen(cls, coro: AsyncCallable, client: "Client") -> "models.Listener":
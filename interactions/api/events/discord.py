@@ -20,13 +20,14 @@ These are events dispatched by Discord. This is intended as a reference so you k
 
 """
 
-from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+import copy
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
 
 import attrs
 
 import interactions.models
 from interactions.api.events.base import BaseEvent, GuildEvent
-from interactions.client.const import Absent
+from interactions.client.const import MISSING, Absent
 from interactions.client.utils.attr_utils import docs
 from interactions.models.discord.snowflake import to_snowflake
 
@@ -129,6 +130,36 @@ if TYPE_CHECKING:
     from interactions.models.discord.voice_state import VoiceState
 
 
+class _ChangedFields:
+    """
+    Builds an update event's `before` from the fields the update changed.
+
+    Rather than copying the cached object before every update, the cache records the old values of the fields that
+    changed. `before` is built the first time it's read, as a shallow copy of `after` with those values restored. If the
+    object is updated again first, `before` is built just before that update, so it doesn't leak into this event.
+    """
+
+    def __attrs_post_init__(self) -> None:
+        if self._before is MISSING and self.changes is not None:
+            # noinspection PyProtectedMember
+            if not self.after._defer_before(self):
+                self._build_before()
+
+    def _get_before(self) -> Any:
+        if self._before is MISSING and self.changes is not None:
+            self._build_before()
+        return self._before
+
+    def _build_before(self) -> None:
+        if self._before is not MISSING:
+            return
+        before = copy.copy(self.after)
+        for key, value in self.changes.items():
+            # bypasses converters and validators, the old values were already processed
+            object.__setattr__(before, key, value)
+        self._before = before
+
+
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
 class AutoModExec(BaseEvent):
     """Dispatched when an auto modation action is executed"""
@@ -182,17 +213,27 @@ class ChannelCreate(BaseEvent):
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
-class ChannelUpdate(BaseEvent):
+class ChannelUpdate(_ChangedFields, BaseEvent):
     """Dispatched when a channel is updated."""
 
-    before: "TYPE_ALL_CHANNEL" = attrs.field(
+    _before: "TYPE_ALL_CHANNEL" = attrs.field(
         repr=False,
     )
-    """Channel before this event. MISSING if it was not cached before"""
     after: "TYPE_ALL_CHANNEL" = attrs.field(
         repr=False,
     )
     """Channel after this event"""
+    changes: Optional[Dict[str, Any]] = attrs.field(repr=False, default=None)
+    """The old values of the channel's fields that changed. None if it was not cached before"""
+
+    @property
+    def before(self) -> "TYPE_ALL_CHANNEL":
+        """Channel before this event. MISSING if it was not cached before"""
+        return self._get_before()
+
+    @before.setter
+    def before(self, value: "TYPE_ALL_CHANNEL") -> None:
+        self._before = value
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
@@ -301,17 +342,27 @@ class GuildJoin(GuildEvent):
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
-class GuildUpdate(BaseEvent):
+class GuildUpdate(_ChangedFields, BaseEvent):
     """Dispatched when a guild is updated."""
 
-    before: "Guild" = attrs.field(
+    _before: "Guild" = attrs.field(
         repr=False,
     )
-    """Guild before this event"""
     after: "Guild" = attrs.field(
         repr=False,
     )
     """Guild after this event"""
+    changes: Optional[Dict[str, Any]] = attrs.field(repr=False, default=None)
+    """The old values of the guild's fields that changed. None if it was not cached before"""
+
+    @property
+    def before(self) -> "Guild":
+        """Guild before this event"""
+        return self._get_before()
+
+    @before.setter
+    def before(self, value: "Guild") -> None:
+        self._before = value
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
@@ -383,17 +434,27 @@ class MemberRemove(MemberAdd):
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
-class MemberUpdate(GuildEvent):
+class MemberUpdate(_ChangedFields, GuildEvent):
     """Dispatched when a member is updated."""
 
-    before: "Member" = attrs.field(
+    _before: "Member" = attrs.field(
         repr=False,
     )
-    """The state of the member before this event"""
     after: "Member" = attrs.field(
         repr=False,
     )
     """The state of the member after this event"""
+    changes: Optional[Dict[str, Any]] = attrs.field(repr=False, default=None)
+    """The old values of the member's fields that changed. None if it was not cached before"""
+
+    @property
+    def before(self) -> "Member":
+        """The state of the member before this event"""
+        return self._get_before()
+
+    @before.setter
+    def before(self, value: "Member") -> None:
+        self._before = value
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
@@ -514,17 +575,27 @@ class MessageCreate(BaseEvent):
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
-class MessageUpdate(BaseEvent):
+class MessageUpdate(_ChangedFields, BaseEvent):
     """Dispatched when a message is edited."""
 
-    before: "Message" = attrs.field(
+    _before: "Message" = attrs.field(
         repr=False,
     )
-    """The message before this event was created"""
     after: "Message" = attrs.field(
         repr=False,
     )
     """The message after this event was created"""
+    changes: Optional[Dict[str, Any]] = attrs.field(repr=False, default=None)
+    """The old values of the message's fields that changed. None if it was not cached before"""
+
+    @property
+    def before(self) -> "Message":
+        """The message before this event was created"""
+        return self._get_before()
+
+    @before.setter
+    def before(self, value: "Message") -> None:
+        self._before = value
 
 
 @attrs.define(eq=False, order=False, hash=False, kw_only=False)
@@ -40,6 +40,12 @@ __all__ = (
     "Error",
     "ShardConnect",
     "ShardDisconnect",
+    "ShardHealthy",
+    "ShardRestart",
+    "ShardUnhealthy",
+    "EventLoopBlocked",
+    "EventLoopLag",
+    "TaskLimitExceeded",
     "Login",
     "Ready",
     "Resume",
@@ -58,6 +64,7 @@ __all__ = (
     "ExtensionUnload",
     "ExtensionCommandParse",
     "CallbackAdded",
+    "ClusterMessage",
 )
 
 
@@ -262,3 +269,79 @@ class CallbackAdded(BaseEvent):
     """The callback that was added"""
     extension: "Extension | None" = attrs.field(repr=False, default=None)
     """The extension that the command was added from, if any"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class ClusterMessage(BaseEvent):
+    """Dispatched when a message is broadcast to this cluster. See `interactions.client.cluster`."""
+
+    data: Any = attrs.field(repr=False)
+    """The data that was broadcast"""
+    cluster_id: int = attrs.field(repr=True)
+    """The ID of the cluster that sent the message, or -1 if it was sent by the supervisor"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class ShardUnhealthy(BaseEvent):
+    """Dispatched when a shard stops meeting its health thresholds. See `interactions.client.supervisor`."""
+
+    shard_id: int = attrs.field(repr=True)
+    """The ID of the shard"""
+    reasons: list[str] = attrs.field(repr=True, factory=list)
+    """Why the shard is unhealthy"""
+    health: dict = attrs.field(repr=False, factory=dict)
+    """The health metrics of the shard"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class ShardHealthy(BaseEvent):
+    """Dispatched when an unhealthy shard meets its health thresholds again. See `interactions.client.supervisor`."""
+
+    shard_id: int = attrs.field(repr=True)
+    """The ID of the shard"""
+    health: dict = attrs.field(repr=False, factory=dict)
+    """The health metrics of the shard"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class ShardRestart(BaseEvent):
+    """Dispatched when an unhealthy shard is restarted. See `interactions.client.supervisor`."""
+
+    shard_id: int = attrs.field(repr=True)
+    """The ID of the shard"""
+    reasons: list[str] = attrs.field(repr=True, factory=list)
+    """Why the shard is being restarted"""
+    attempt: int = attrs.field(repr=True, default=1)
+    """How many times the shard has been restarted in a row"""
+    delay: float = attrs.field(repr=False, default=0)
+    """How long the shard waits before reconnecting (seconds)"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class EventLoopLag(BaseEvent):
+    """Dispatched when the event loop's lag is above its limit. See `interactions.client.loop_monitor`."""
+
+    lag: float = attrs.field(repr=True)
+    """How late the loop ran a sleeping task (seconds)"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class EventLoopBlocked(BaseEvent):
+    """Dispatched once the event loop recovers from being blocked. See `interactions.client.loop_monitor`."""
+
+    duration: float = attrs.field(repr=True)
+    """Roughly how long the loop was blocked for (seconds)"""
+    task_name: str | None = attrs.field(repr=True, default=None)
+    """The name of the task that blocked the loop, if it was caught in the act"""
+    stack: str = attrs.field(repr=False, default="")
+    """The stack of the blocking code, if it was caught in the act"""
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class TaskLimitExceeded(BaseEvent):
+    """Dispatched when more tasks are pending than the limit. See `interactions.client.loop_monitor`."""
+
+    total: int = attrs.field(repr=True)
+    """The number of pending tasks"""
+    census: dict[str, int] = attrs.field(repr=False, factory=dict)
+    """The number of pending tasks, by name"""
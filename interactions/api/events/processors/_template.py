@@ -9,6 +9,7 @@ from interactions.models.discord.user import ClientUser
 if TYPE_CHECKING:
     from interactions.client.smart_cache import GlobalCache
     from interactions.api.events.internal import BaseEvent
+    from interactions.api.events.base import RawGatewayEvent
 
 __all__ = ("Processor", "EventMixinTemplate")
 
@@ -16,13 +17,18 @@ __all__ = ("Processor", "EventMixinTemplate")
 class Processor:
     callback: AsyncCallable
     event_name: str
+    produces: tuple[str, ...]
+    """The names of the events this processor dispatches, so its work can be skipped if nothing listens for them"""
 
-    def __init__(self, callback: AsyncCallable, name: str) -> None:
+    def __init__(self, callback: AsyncCallable, name: str, produces: tuple[str, ...] = ()) -> None:
         self.callback = callback
         self.event_name = name
+        self.produces = produces
 
     @classmethod
-    def define(cls, event_name: Absent[str] = MISSING) -> Callable[[AsyncCallable], "Processor"]:
+    def define(
+        cls, event_name: Absent[str] = MISSING, *, produces: tuple[str, ...] = ()
+    ) -> Callable[[AsyncCallable], "Processor"]:
         def wrapper(coro: AsyncCallable) -> "Processor":
             name = event_name
             if name is MISSING:
@@ -30,7 +36,7 @@ class Processor:
             name = name.lstrip("_")
             name = name.removeprefix("on_")
 
-            return cls(coro, name)
+            return cls(coro, name, produces)
 
         return wrapper
 
@@ -44,8 +50,11 @@ class EventMixinTemplate:
     synchronise_interactions: Callable[[], Coroutine]
     _user: ClientUser
     _guild_event: asyncio.Event
+    is_demanded: Callable[["RawGatewayEvent"], bool]
 
     def __init__(self) -> None:
         for call in inspect.getmembers(self):
             if isinstance(call[1], Processor):
-                self.add_event_processor(call[1].event_name)(functools.partial(call[1].callback, self))
+                self.add_event_processor(call[1].event_name, produces=call[1].produces)(
+                    functools.partial(call[1].callback, self)
+                )
@@ -6,9 +6,12 @@ from interactions.client.const import Absent, AsyncCallable
 class Processor:
     callback: AsyncCallable
     event_name: str
-    def __init__(self, callback: AsyncCallable, name: str) -> None: ...
+    produces: tuple[str, ...]
+    def __init__(self, callback: AsyncCallable, name: str, produces: tuple[str, ...] = ...) -> None: ...
     @classmethod
-    def define(cls, event_name: Absent[str] = ...) -> Callable[[AsyncCallable], "Processor"]: ...
+    def define(
+        cls, event_name: Absent[str] = ..., *, produces: tuple[str, ...] = ...
+    ) -> Callable[[AsyncCallable], "Processor"]: ...
 
 class EventMixinTemplate(Client):
     def __init__(self) -> None: ...
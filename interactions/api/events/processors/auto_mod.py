@@ -12,8 +12,10 @@ __all__ = ("AutoModEvents",)
 
 
 class AutoModEvents(EventMixinTemplate):
-    @Processor.define()
+    @Processor.define(produces=("auto_mod_exec",))
     async def _raw_auto_moderation_action_execution(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         action = AutoModerationAction.from_dict(event.data.copy(), self)
         channel = self.get_channel(event.data.get("channel_id"))
         guild = self.get_guild(event.data["guild_id"])
@@ -1,4 +1,3 @@
-import copy
 from typing import TYPE_CHECKING
 
 import interactions.api.events as events
@@ -29,19 +28,34 @@ class ChannelEvents(EventMixinTemplate):
 
     @Processor.define()
     async def _on_raw_channel_update(self, event: "RawGatewayEvent") -> None:
-        before = copy.copy(self.cache.get_channel(event.data.get("id")))
-        self.dispatch(events.ChannelUpdate(before=before or MISSING, after=self.cache.place_channel_data(event.data)))
-
-    @Processor.define()
+        changes = {}
+        before = self.cache.get_channel(event.data.get("id"))
+        after = self.cache.place_channel_data(event.data, changes)
+        if before is after:
+            self.dispatch(events.ChannelUpdate(before=MISSING, after=after, changes=changes))
+        else:
+            # the channel's type changed, so it was replaced rather than updated
+            self.dispatch(events.ChannelUpdate(before=before or MISSING, after=after))
+
+    @Processor.define(produces=("channel_pins_update",))
     async def _on_raw_channel_pins_update(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            if channel := self.cache.get_channel(event.data.get("channel_id")):
+                channel.last_pin_timestamp = event.data.get("last_pin_timestamp")
+            return
+
         channel = await self.cache.fetch_channel(event.data.get("channel_id"))
         channel.last_pin_timestamp = event.data.get("last_pin_timestamp")
         self.dispatch(events.ChannelPinsUpdate(channel, channel.last_pin_timestamp))
 
-    @Processor.define()
+    @Processor.define(produces=("invite_create",))
     async def _on_raw_invite_create(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         self.dispatch(events.InviteCreate(Invite.from_dict(event.data, self)))  # type: ignore
 
-    @Processor.define()
+    @Processor.define(produces=("invite_delete",))
     async def _on_raw_invite_delete(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         self.dispatch(events.InviteDelete(Invite.from_dict(event.data, self)))  # type: ignore
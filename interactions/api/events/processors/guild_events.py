@@ -34,15 +34,26 @@ class GuildEvents(EventMixinTemplate):
 
         """
         new_guild = not self.cache.get_guild(event.data["id"])
-        guild = self.cache.place_guild_data(event.data)
+        if self.guild_hydration_budget is not None:
+            guild = await self.cache.hydrate_guild_data(event.data, time_budget=self.guild_hydration_budget)
+            if not self.cache.get_guild(guild.id):
+                # the guild was deleted before it finished hydrating
+                return
+        else:
+            guild = self.cache.place_guild_data(event.data)
 
         self._user._guild_ids.add(to_snowflake(event.data.get("id")))
+        if (shard := self.get_guild_shard(guild.id)) is not None:
+            shard.guild_ids.add(guild.id)
 
         self._guild_event.set()
 
         if self.fetch_members and not guild.chunked.is_set():
-            # delays events until chunking has completed
-            await guild.chunk()
+            if self.chunk_in_background and (scheduler := self.get_guild_websocket(guild.id).state.chunk_scheduler):
+                scheduler.add(guild)
+            else:
+                # delays events until chunking has completed
+                await guild.chunk()
 
         if new_guild:
             self.dispatch(events.GuildJoin(guild.id))
@@ -51,8 +62,13 @@ class GuildEvents(EventMixinTemplate):
 
     @Processor.define()
     async def _on_raw_guild_update(self, event: "RawGatewayEvent") -> None:
-        before = copy.copy(await self.cache.fetch_guild(event.data.get("id")))
-        self.dispatch(events.GuildUpdate(before or MISSING, self.cache.place_guild_data(event.data)))
+        changes = {}
+        before = await self.cache.fetch_guild(event.data.get("id"))
+        after = self.cache.place_guild_data(event.data, changes)
+        if before is after:
+            self.dispatch(events.GuildUpdate(MISSING, after, changes))
+        else:
+            self.dispatch(events.GuildUpdate(before or MISSING, after))
 
     @Processor.define()
     async def _on_raw_guild_delete(self, event: "RawGatewayEvent") -> None:
@@ -64,6 +80,8 @@ class GuildEvents(EventMixinTemplate):
             if guild_id in self._user._guild_ids:
                 # noinspection PyProtectedMember
                 self._user._guild_ids.remove(guild_id)
+            if (shard := self.get_guild_shard(guild_id)) is not None:
+                shard.guild_ids.discard(guild_id)
 
             # get the guild right before deleting it
             guild = self.cache.get_guild(guild_id)
@@ -1,4 +1,3 @@
-import copy
 from typing import TYPE_CHECKING
 
 import interactions.api.events as events
@@ -35,5 +34,7 @@ class MemberEvents(EventMixinTemplate):
     @Processor.define()
     async def _on_raw_guild_member_update(self, event: "RawGatewayEvent") -> None:
         g_id = event.data.pop("guild_id")
-        before = copy.copy(self.cache.get_member(g_id, event.data["user"]["id"])) or MISSING
-        self.dispatch(events.MemberUpdate(g_id, before, self.cache.place_member_data(g_id, event.data)))
+        changes = {}
+        before = self.cache.get_member(g_id, event.data["user"]["id"])
+        after = self.cache.place_member_data(g_id, event.data, changes)
+        self.dispatch(events.MemberUpdate(g_id, MISSING, after, changes if before is not None else None))
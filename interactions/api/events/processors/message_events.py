@@ -1,7 +1,7 @@
-import copy
 from typing import TYPE_CHECKING
 
 import interactions.api.events as events
+from interactions.client.const import MISSING
 from interactions.models import to_snowflake, BaseMessage
 from ._template import EventMixinTemplate, Processor
 
@@ -62,10 +62,14 @@ class MessageEvents(EventMixinTemplate):
             event: raw message update event
 
         """
-        # a copy is made because the cache will update the original object in memory
-        before = copy.copy(self.cache.get_message(event.data.get("channel_id"), event.data.get("id")))
-        after = self.cache.place_message_data(event.data)
-        self.dispatch(events.MessageUpdate(before=before, after=after))
+        # the cache updates the original object in memory, so only the old values of changed fields are kept
+        changes = {}
+        before = self.cache.get_message(event.data.get("channel_id"), event.data.get("id"))
+        after = self.cache.place_message_data(event.data, changes)
+        if before is None:
+            self.dispatch(events.MessageUpdate(before=None, after=after))
+        else:
+            self.dispatch(events.MessageUpdate(before=MISSING, after=after, changes=changes))
 
     @Processor.define()
     async def _on_raw_message_delete_bulk(self, event: "RawGatewayEvent") -> None:
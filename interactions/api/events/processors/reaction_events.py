@@ -1,20 +1,57 @@
 from typing import TYPE_CHECKING
 
 import interactions.api.events as events
-from interactions.models import PartialEmoji, Reaction
+from interactions.models import PartialEmoji, Reaction, to_snowflake
 
 from ._template import EventMixinTemplate, Processor
 
 if TYPE_CHECKING:
     from interactions.api.events import RawGatewayEvent
+    from interactions.models import Message
 
 __all__ = ("ReactionEvents",)
 
 
 class ReactionEvents(EventMixinTemplate):
+    def _update_cached_reactions(
+        self, event: "RawGatewayEvent", message: "Message", emoji: PartialEmoji, add: bool
+    ) -> Reaction | None:
+        """Update the reaction counts of a cached message, returning the reaction that changed."""
+        for i in range(len(message.reactions)):
+            r = message.reactions[i]
+            if r.emoji == emoji:
+                if add:
+                    r.count += 1
+                else:
+                    r.count -= 1
+
+                if r.count <= 0:
+                    message.reactions.pop(i)
+                else:
+                    message.reactions[i] = r
+                reaction = r
+                break
+        else:
+            reaction = Reaction.from_dict(
+                {
+                    "count": 1,
+                    "me": to_snowflake(event.data.get("user_id")) == self.user.id,
+                    "emoji": emoji.to_dict(),
+                    "message_id": message.id,
+                    "channel_id": message._channel_id,
+                },
+                self,  # type: ignore
+            )
+            message.reactions.append(reaction)
+        return reaction
+
     async def _handle_message_reaction_change(self, event: "RawGatewayEvent", add: bool) -> None:
+        # without listeners, only the reactions of cached messages are updated
+        demanded = self.is_demanded(event)
         if member := event.data.get("member"):
             author = self.cache.place_member_data(event.data.get("guild_id"), member)
+        elif not demanded:
+            author = None
         elif guild_id := event.data.get("guild_id"):
             author = await self.cache.fetch_member(guild_id, event.data.get("user_id"))
         else:
@@ -25,56 +62,35 @@ class ReactionEvents(EventMixinTemplate):
         reaction = None
 
         if message:
-            for i in range(len(message.reactions)):
-                r = message.reactions[i]
-                if r.emoji == emoji:
-                    if add:
-                        r.count += 1
-                    else:
-                        r.count -= 1
-
-                    if r.count <= 0:
-                        message.reactions.pop(i)
-                    else:
-                        message.reactions[i] = r
-                    reaction = r
-                    break
-            else:
-                reaction = Reaction.from_dict(
-                    {
-                        "count": 1,
-                        "me": author.id == self.user.id,  # type: ignore
-                        "emoji": emoji.to_dict(),
-                        "message_id": message.id,
-                        "channel_id": message._channel_id,
-                    },
-                    self,  # type: ignore
-                )
-                message.reactions.append(reaction)
-
-        else:
+            reaction = self._update_cached_reactions(event, message, emoji, add)
+        elif demanded:
             message = await self.cache.fetch_message(event.data.get("channel_id"), event.data.get("message_id"))
             for r in message.reactions:
                 if r.emoji == emoji:
                     reaction = r
                     break
+
+        if not demanded:
+            return
         if add:
             self.dispatch(events.MessageReactionAdd(message=message, emoji=emoji, author=author, reaction=reaction))
         else:
             self.dispatch(events.MessageReactionRemove(message=message, emoji=emoji, author=author, reaction=reaction))
 
-    @Processor.define()
+    @Processor.define(produces=("message_reaction_add",))
     async def _on_raw_message_reaction_add(self, event: "RawGatewayEvent") -> None:
         await self._handle_message_reaction_change(event, add=True)
 
-    @Processor.define()
+    @Processor.define(produces=("message_reaction_remove",))
     async def _on_raw_message_reaction_remove(self, event: "RawGatewayEvent") -> None:
         await self._handle_message_reaction_change(event, add=False)
 
-    @Processor.define()
+    @Processor.define(produces=("message_reaction_remove_all",))
     async def _on_raw_message_reaction_remove_all(self, event: "RawGatewayEvent") -> None:
         if message := self.cache.get_message(event.data["channel_id"], event.data["message_id"]):
             message.reactions = []
+        if not self.is_demanded(event):
+            return
         self.dispatch(
             events.MessageReactionRemoveAll(
                 event.data.get("guild_id"),
@@ -82,7 +98,7 @@ class ReactionEvents(EventMixinTemplate):
             )
         )
 
-    @Processor.define()
+    @Processor.define(produces=("message_reaction_remove_emoji",))
     async def _on_raw_message_reaction_remove_emoji(self, event: "RawGatewayEvent") -> None:
         emoji = PartialEmoji.from_dict(event.data.get("emoji"))
         message = self.cache.get_message(event.data.get("channel_id"), event.data.get("message_id"))
@@ -92,6 +108,8 @@ class ReactionEvents(EventMixinTemplate):
                 if reaction.emoji == emoji:
                     message.reactions.pop(i)
                     break
+        elif not self.is_demanded(event):
+            return
         else:
             message = await self.cache.fetch_message(event.data.get("channel_id"), event.data.get("message_id"))
 
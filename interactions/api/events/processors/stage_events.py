@@ -11,14 +11,20 @@ __all__ = ("StageEvents",)
 
 
 class StageEvents(EventMixinTemplate):
-    @Processor.define()
+    @Processor.define(produces=("stage_instance_create",))
     async def _on_raw_stage_instance_create(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         self.dispatch(events.StageInstanceCreate(StageInstance.from_dict(event.data, self)))  # type: ignore
 
-    @Processor.define()
+    @Processor.define(produces=("stage_instance_update",))
     async def _on_raw_stage_instance_update(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         self.dispatch(events.StageInstanceUpdate(StageInstance.from_dict(event.data, self)))  # type: ignore
 
-    @Processor.define()
+    @Processor.define(produces=("stage_instance_delete",))
     async def _on_raw_stage_instance_delete(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         self.dispatch(events.StageInstanceDelete(StageInstance.from_dict(event.data, self)))  # type: ignore
@@ -38,8 +38,10 @@ class ThreadEvents(EventMixinTemplate):
 
         self.dispatch(events.ThreadListSync(channel_ids, threads, members))
 
-    @Processor.define()
+    @Processor.define(produces=("thread_members_update",))
     async def _on_raw_thread_members_update(self, event: "RawGatewayEvent") -> None:
+        if not self.is_demanded(event):
+            return
         g_id = event.data.get("guild_id")
         self.dispatch(
             events.ThreadMembersUpdate(
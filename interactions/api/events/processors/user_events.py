@@ -12,7 +12,7 @@ __all__ = ("UserEvents",)
 
 
 class UserEvents(EventMixinTemplate):
-    @Processor.define()
+    @Processor.define(produces=("typing_start",))
     async def _on_raw_typing_start(self, event: "RawGatewayEvent") -> None:
         """
         Process raw typing start and dispatch a processed typing event.
@@ -27,7 +27,11 @@ class UserEvents(EventMixinTemplate):
 
         if member := event.data.get("member"):
             author = self.cache.place_member_data(event.data.get("guild_id"), member)
+            if not self.is_demanded(event):
+                return
             guild = await self.cache.fetch_guild(event.data.get("guild_id"))
+        elif not self.is_demanded(event):
+            return
         else:
             author = await self.cache.fetch_user(event.data.get("user_id"))
 
@@ -42,7 +46,7 @@ class UserEvents(EventMixinTemplate):
             )
         )
 
-    @Processor.define()
+    @Processor.define(produces=("presence_update",))
     async def _on_raw_presence_update(self, event: "RawGatewayEvent") -> None:
         """
         Process raw presence update and dispatch a processed presence update event.
@@ -55,6 +59,8 @@ class UserEvents(EventMixinTemplate):
         if user := self.cache.get_user(event.data["user"]["id"]):
             user.status = Status[event.data["status"].upper()]
             user.activities = Activity.from_list(event.data.get("activities"))
+            if not self.is_demanded(event):
+                return
 
             self.dispatch(
                 events.PresenceUpdate(user, user.status, user.activities, event.data.get("client_status", None), g_id)
@@ -1,4 +1,10 @@
+from . import chunking
 from . import gateway
+from . import identify
+from . import pipeline
+from . import recorder
+from . import session
 from . import state
+from . import telemetry
 
-__all__ = ("gateway", "state")
+__all__ = ("chunking", "gateway", "identify", "pipeline", "recorder", "session", "state", "telemetry")
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Literal
+
+from interactions.models.discord.snowflake import to_snowflake
+
+if TYPE_CHECKING:
+    from interactions.models.discord.guild import Guild
+    from interactions.models.discord.snowflake import Snowflake_Type
+    from .state import ConnectionState
+
+__all__ = ("ChunkScheduler",)
+
+
+class ChunkScheduler:
+    """
+    Chunks the members of a shard's guilds over the gateway, in the background.
+
+    Requests are sent as fast as the gateway's send limit allows, starting with the largest or most active guilds.
+    Guilds whose members were all sent in GUILD_CREATE are marked as chunked without a request.
+
+    Args:
+        state: The shard to chunk guilds for
+        priority: Chunk the largest guilds first (`size`), or those with the most events (`activity`)
+        guild_filter: Only chunk guilds this returns True for
+        on_demand: Only chunk a guild once an event is received for it
+        presences: Request the presences of members
+        max_in_flight: The maximum number of guilds being chunked at once
+        timeout: How long to wait for a guild's chunks before giving up on it (seconds)
+
+    """
+
+    def __init__(
+        self,
+        state: "ConnectionState",
+        *,
+        priority: Literal["size", "activity"] = "size",
+        guild_filter: Callable[["Guild"], bool] | None = None,
+        on_demand: bool = False,
+        presences: bool = False,
+        max_in_flight: int = 10,
+        timeout: float = 30,
+    ) -> None:
+        self.state = state
+        self.priority = priority
+        self.guild_filter = guild_filter
+        self.on_demand = on_demand
+        self.presences = presences
+        self.timeout = timeout
+
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+
+        self._pending: dict["Snowflake_Type", int] = {}
+        self._deferred: set["Snowflake_Type"] = set()
+        self._activity: Counter = Counter()
+        self._in_flight: set["Snowflake_Type"] = set()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+        self._started_at: float | None = None
+
+    @property
+    def tracking(self) -> bool:
+        """Whether events should be reported to this scheduler with `record_activity`."""
+        return bool(self._deferred) or (self.priority == "activity" and bool(self._pending))
+
+    @property
+    def progress(self) -> dict:
+        """The progress of this shard's chunking."""
+        return {
+            "pending": len(self._pending),
+            "deferred": len(self._deferred),
+            "in_flight": len(self._in_flight),
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "elapsed": time.perf_counter() - self._started_at if self._started_at else 0.0,
+        }
+
+    def add(self, guild: "Guild") -> None:
+        """
+        Schedule a guild to be chunked.
+
+        Args:
+            guild: The guild to chunk
+
+        """
+        if guild.chunked.is_set() or guild.id in self._in_flight:
+            return
+        if self.guild_filter is not None and not self.guild_filter(guild):
+            self.skipped += 1
+            return
+        if guild.member_count and len(guild._member_ids) >= guild.member_count:
+            # discord already sent every member in GUILD_CREATE
+            guild.chunked.set()
+            self.completed += 1
+            return
+
+        if self.on_demand:
+            self._deferred.add(guild.id)
+            return
+        self._queue(guild)
+
+    def _queue(self, guild: "Guild") -> None:
+        self._pending[guild.id] = guild.member_count or 0
+        self._idle.clear()
+        self._wakeup.set()
+
+    def record_activity(self, guild_id: "Snowflake_Type | None") -> None:
+        """
+        Record that an event was received for a guild.
+
+        Args:
+            guild_id: The ID of the guild the event belongs to
+
+        """
+        if guild_id is None:
+            return
+        guild_id = to_snowflake(guild_id)
+        if guild_id in self._deferred:
+            self._deferred.discard(guild_id)
+            if guild := self.state.client.cache.get_guild(guild_id):
+                self._queue(guild)
+        elif guild_id in self._pending:
+            self._activity[guild_id] += 1
+
+    def _next(self) -> "Snowflake_Type":
+        if self.priority == "activity":
+            guild_id = max(self._pending, key=lambda g_id: (self._activity[g_id], self._pending[g_id]))
+        else:
+            guild_id = max(self._pending, key=self._pending.__getitem__)
+        del self._pending[guild_id]
+        self._activity.pop(guild_id, None)
+        return guild_id
+
+    def start(self) -> None:
+        """Start sending chunk requests."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=f"interactions:: chunk scheduler {self.state.shard_id}")
+
+    def stop(self) -> None:
+        """Stop sending chunk requests."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def wait_until_complete(self) -> None:
+        """Wait until every scheduled guild has been chunked."""
+        await self._idle.wait()
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                if not self._in_flight:
+                    self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            gateway = self.state.gateway
+            if not gateway or not gateway._ready.is_set():
+                # wait for the shard to (re)connect
+                await asyncio.sleep(1)
+                continue
+
+            await self._slots.acquire()
+            if not self._pending:
+                self._slots.release()
+                continue
+
+            guild_id = self._next()
+            guild = self.state.client.cache.get_guild(guild_id)
+            if guild is None or guild.chunked.is_set():
+                self._slots.release()
+                continue
+
+            if self._started_at is None:
+                self._started_at = time.perf_counter()
+            self._in_flight.add(guild_id)
+            try:
+                # this waits for the gateway's send limit, so requests go out as fast as discord allows
+                await gateway.request_member_chunks(guild_id, limit=0, presences=self.presences)
+            except Exception as e:
+                self.state.wrapped_logger(logging.ERROR, f"Failed to request members of {guild_id}: {e!r}")
+                self._finish(guild_id, success=False)
+                continue
+            _ = asyncio.create_task(self._wait_for_chunks(guild))  # noqa: RUF006
+
+    async def _wait_for_chunks(self, guild: "Guild") -> None:
+        try:
+            await asyncio.wait_for(guild.chunked.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            self.state.wrapped_logger(logging.WARNING, f"Timed out waiting for members of {guild.id}")
+            self._finish(guild.id, success=False)
+        else:
+            self._finish(guild.id, success=True)
+
+    def _finish(self, guild_id: "Snowflake_Type", *, success: bool) -> None:
+        self._in_flight.discard(guild_id)
+        self._slots.release()
+        if success:
+            self.completed += 1
+        else:
+            self.failed += 1
+
+        if not self._pending and not self._in_flight:
+            self._idle.set()
+            self.state.wrapped_logger(
+                logging.INFO,
+                f"Chunked {self.completed} guilds in {self.progress['elapsed']:.2f}s ({self.failed} failed)",
+            )
+        elif (self.completed + self.failed) % 100 == 0:
+            self.state.wrapped_logger(logging.DEBUG, "Chunking progress: %s", self.progress)
@@ -1,15 +1,19 @@
 """Outlines the interaction between interactions and Discord's Gateway API."""
 
 import asyncio
+import contextlib
 import logging
 import sys
 import time
+import uuid
 import zlib
 from asyncio import Task
 from types import TracebackType
 from typing import TypeVar, TYPE_CHECKING
 
 from interactions.api import events
+from interactions.api.events.base import _dispatch_payload
+from interactions.client import tracing
 from interactions.client.const import MISSING, __api_version__
 from interactions.client.utils.input_utils import FastJson
 from interactions.client.utils.serializer import dict_filter_none
@@ -17,17 +21,23 @@ from interactions.models.discord.enums import Status
 from interactions.models.discord.enums import WebSocketOPCode as OPCODE
 from interactions.models.discord.snowflake import to_snowflake
 from interactions.models.internal.cooldowns import CooldownSystem
+from .pipeline import DispatchPipeline
+from .session import GatewaySession
 from .websocket import WebsocketClient
 
 if TYPE_CHECKING:
     from .state import ConnectionState
     from interactions.models.discord.snowflake import Snowflake_Type
+    from interactions.models.discord.user import Member
 
 __all__ = ("GatewayClient",)
 
 
 SELF = TypeVar("SELF", bound="WebsocketClient")
 
+# how long a closing connection waits for its queued dispatches to be processed (seconds)
+_PIPELINE_DRAIN_TIMEOUT = 5
+
 
 class GatewayRateLimit:
     def __init__(self) -> None:
@@ -53,15 +63,20 @@ class GatewayClient(WebsocketClient):
     Attributes:
         sequence: The sequence of this connection
         session_id: The session ID of this connection
+        dispatch_pipeline: The bounded dispatch pipeline of this connection, if enabled
+        resumed_session: Whether this connection was started by resuming a persisted session
+        telemetry: The counters and timings of this shard, shared by every connection the shard makes
 
     """
 
-    def __init__(self, state: "ConnectionState", shard: tuple[int, int]) -> None:
+    def __init__(self, state: "ConnectionState", shard: tuple[int, int], session: GatewaySession | None = None) -> None:
         super().__init__(state)
 
         self.shard = shard
 
         self.chunk_cache = {}
+        # member requests awaiting their chunks, keyed by nonce
+        self._member_requests: dict[str, tuple[list, list, asyncio.Future]] = {}
 
         self._trace = []
         self.sequence = None
@@ -70,6 +85,25 @@ class GatewayClient(WebsocketClient):
         self.ws_url = state.gateway_url
         self.ws_resume_url = MISSING
 
+        self.telemetry = state.telemetry
+
+        self.resumed_session = False
+        # the last sequence number of a resumed session, and the dispatches up to it that weren't processed
+        self._replay: tuple[int, frozenset[int]] | None = None
+        # the dispatches of this connection that weren't processed before it closed
+        self._unprocessed: list[int] = []
+        if session is not None:
+            self.sequence = session.sequence
+            self.session_id = session.session_id
+            self.ws_resume_url = session.resume_url
+            if session.unprocessed and session.sequence is not None:
+                # resume from before the dispatches that weren't processed, so discord sends them again
+                self.sequence = min(session.unprocessed) - 1
+                self._replay = (session.sequence, frozenset(session.unprocessed))
+
+        # the close code used when leaving the gateway, discord invalidates the session if this is 1000 or 1001
+        self._close_code = 1000
+
         # This lock needs to be held to send something over the gateway, but is also held when
         # reconnecting. That way there's no race conditions between sending and reconnecting.
         self._race_lock = asyncio.Lock()
@@ -85,6 +119,12 @@ class GatewayClient(WebsocketClient):
         self._ready = asyncio.Event()
         self._close_gateway = asyncio.Event()
 
+        self.dispatch_pipeline: DispatchPipeline | None = None
+        if state.client.dispatch_workers:
+            self.dispatch_pipeline = DispatchPipeline(
+                self, state.client.dispatch_workers, state.client.dispatch_queue_size
+            )
+
         # Sanity check, it is extremely important that an instance isn't reused.
         self._entered = False
 
@@ -95,7 +135,10 @@ class GatewayClient(WebsocketClient):
         self._entered = True
         self._zlib = zlib.decompressobj()
 
-        self.ws = await self.state.client.http.websocket_connect(self.state.gateway_url)
+        resume = self.session_id is not None and bool(self.ws_resume_url)
+        self.ws = await self.state.client.http.websocket_connect(
+            self.ws_resume_url if resume else self.state.gateway_url
+        )
 
         hello = await self.receive(force=True)
         self.heartbeat_interval = hello["d"]["heartbeat_interval"] / 1000
@@ -103,7 +146,12 @@ class GatewayClient(WebsocketClient):
 
         self._keep_alive = asyncio.create_task(self.run_bee_gees())
 
-        await self._identify()
+        if resume:
+            # if discord no longer recognises this session, it will invalidate it and we will identify instead
+            self.resumed_session = True
+            await self._resume_connection()
+        else:
+            await self._identify()
 
         return self
 
@@ -116,6 +164,10 @@ class GatewayClient(WebsocketClient):
         # Technically should not be possible in any way, but might as well be safe worst-case.
         self._close_gateway.set()
 
+        if self.dispatch_pipeline is not None:
+            await self.dispatch_pipeline.stop(timeout=_PIPELINE_DRAIN_TIMEOUT)
+            self._unprocessed = self.dispatch_pipeline.unprocessed
+
         try:
             if self._keep_alive is not None:
                 self._kill_bee_gees.set()
@@ -130,12 +182,15 @@ class GatewayClient(WebsocketClient):
                 # We could be cancelled here, it is extremely important that we close the
                 # WebSocket either way, hence the try/except.
                 try:
-                    await self.ws.close(code=1000)
+                    await self.ws.close(code=self._close_code)
                 finally:
                     self.ws = None
 
     async def run(self) -> None:
         """Start receiving events from the websocket."""
+        if self.dispatch_pipeline is not None:
+            self.dispatch_pipeline.start()
+
         while True:
             if self._stopping is None:
                 self._stopping = asyncio.create_task(self._close_gateway.wait())
@@ -162,7 +217,22 @@ class GatewayClient(WebsocketClient):
                 self.sequence = seq
 
             if op == OPCODE.DISPATCH:
-                _ = asyncio.create_task(self.dispatch_event(data, seq, event))  # noqa: RUF006
+                if self._replay is not None and self._is_processed_replay(seq, event):
+                    continue
+                self.telemetry.record_dispatch(event)
+                if (scheduler := self.state.chunk_scheduler) is not None and scheduler.tracking:
+                    scheduler.record_activity(data.get("guild_id") if data else None)
+                if (dispatch_filter := self.state.dispatch_filter) is not None and not dispatch_filter(
+                    self, seq, event, data
+                ):
+                    continue
+                if self.state.client.gateway_recorder is not None:
+                    self.state.client.gateway_recorder.record(self.shard[0], seq, event, data)
+                if self.dispatch_pipeline is not None and event not in ("READY", "RESUMED"):
+                    # this will block if the pipeline is saturated, applying backpressure to the websocket
+                    await self.dispatch_pipeline.put(data, seq, event)
+                else:
+                    _ = asyncio.create_task(self.dispatch_event(data, seq, event))  # noqa: RUF006
                 continue
 
             # This may try to reconnect the connection so it is best to wait
@@ -191,30 +261,24 @@ class GatewayClient(WebsocketClient):
 
             case OPCODE.RECONNECT:
                 self.state.wrapped_logger(logging.DEBUG, "Gateway requested reconnect. Reconnecting...")
-                return await self.reconnect(resume=True, url=self.ws_resume_url)
+                return await self.reconnect(resume=True, url=self.ws_resume_url, reason="requested by gateway")
 
             case OPCODE.INVALIDATE_SESSION:
                 self.state.wrapped_logger(logging.WARNING, "Gateway invalidated session. Reconnecting...")
-                return await self.reconnect()
+                self.resumed_session = False
+                return await self.reconnect(reason="session invalidated")
 
             case _:
                 return self.state.wrapped_logger(logging.DEBUG, f"Unhandled OPCODE: {op} = {OPCODE(op).name}")
 
-    async def dispatch_event(self, data, seq, event) -> None:
+    async def dispatch_event(self, data, seq, event, queue_lag: float | None = None) -> None:
         match event:
             case "READY":
-                self._ready.set()
-                self._trace = data.get("_trace", [])
-                self.sequence = seq
-                self.session_id = data["session_id"]
-                self.ws_resume_url = (
-                    f"{data['resume_gateway_url']}?encoding=json&v={__api_version__}&compress=zlib-stream"
-                )
-                self.state.wrapped_logger(logging.INFO, "Gateway connection established")
-                self.state.wrapped_logger(logging.DEBUG, f"Session ID: {self.session_id} Trace: {self._trace}")
+                self.process_ready(data, seq)
                 return self.state.client.dispatch(events.WebsocketReady(data))
 
             case "RESUMED":
+                self.telemetry.record_resume()
                 self.state._shard_ready.set()
                 self.state.wrapped_logger(
                     logging.INFO, f"Successfully resumed connection! Session_ID: {self.session_id}"
@@ -223,34 +287,122 @@ class GatewayClient(WebsocketClient):
                 return None
 
             case "GUILD_MEMBERS_CHUNK":
-                _ = asyncio.create_task(self._process_member_chunk(data.copy()))  # noqa: RUF006
+                if data.get("nonce") in self._member_requests:
+                    self._process_member_request_chunk(data)
+                else:
+                    _ = asyncio.create_task(self._process_member_chunk(data.copy()))  # noqa: RUF006
 
             case _:
                 # the above events are "special", and are handled by the gateway itself, the rest can be dispatched
                 event_name = f"raw_{event.lower()}"
                 if processor := self.state.client.processors.get(event_name):
-                    try:
-                        _ = asyncio.create_task(  # noqa: RUF006
-                            processor(events.RawGatewayEvent(data.copy(), override_name=event_name))
-                        )
-                    except Exception as ex:
-                        self.state.wrapped_logger(
-                            logging.ERROR, f"Failed to run event processor for {event_name}: {ex}"
+                    # the processor's task inherits the payload, so listener filters can be checked against it
+                    token = _dispatch_payload.set(data)
+                    # each traced dispatch starts a trace, which the processor's task continues
+                    if (tracer := self.state.client.tracer) is not None:
+                        span = tracer.start_span(
+                            f"gateway {event}",
+                            {"event": event, "shard_id": self.shard[0], "seq": seq, "queue_lag": queue_lag},
+                            root=True,
                         )
+                    else:
+                        span = contextlib.nullcontext()
+                    with span:
+                        try:
+                            coro = processor(events.RawGatewayEvent(data.copy(), override_name=event_name))
+                            if tracer is not None:
+                                coro = tracing.traced(f"processor {event_name}", coro)
+                            if self.dispatch_pipeline is not None:
+                                # the pipeline relies on the processor completing before the next event is processed
+                                await coro
+                            else:
+                                _ = asyncio.create_task(coro)  # noqa: RUF006
+                        except Exception as ex:
+                            self.state.wrapped_logger(
+                                logging.ERROR, f"Failed to run event processor for {event_name}: {ex}"
+                            )
+                        finally:
+                            _dispatch_payload.reset(token)
                 else:
-                    self.state.wrapped_logger(logging.DEBUG, f"No processor for `{event_name}`")
+                    self.state.wrapped_logger(logging.DEBUG, "No processor for `%s`", event_name)
 
         self.state.client.dispatch(events.RawGatewayEvent(data.copy(), override_name="raw_gateway_event"))
         self.state.client.dispatch(events.RawGatewayEvent(data.copy(), override_name=f"raw_{event.lower()}"))
 
-    def close(self) -> None:
-        """Shutdown the websocket connection."""
+    def process_ready(self, data: dict, seq: int | None) -> None:
+        """
+        Store the session of a READY dispatch, without dispatching it to the client.
+
+        Args:
+            data: The data of the READY dispatch
+            seq: The sequence number of the READY dispatch
+
+        """
+        self._ready.set()
+        self._trace = data.get("_trace", [])
+        self.sequence = seq
+        # this is a new session, so nothing will be replayed
+        self._replay = None
+        self.session_id = data["session_id"]
+        self.ws_resume_url = f"{data['resume_gateway_url']}?encoding=json&v={__api_version__}&compress=zlib-stream"
+        self.state.wrapped_logger(logging.INFO, "Gateway connection established")
+        self.state.wrapped_logger(logging.DEBUG, f"Session ID: {self.session_id} Trace: {self._trace}")
+
+    def close(self, *, resumable: bool = False) -> None:
+        """
+        Shutdown the websocket connection.
+
+        Args:
+            resumable: Whether discord should keep the session alive, so it can be resumed later
+
+        """
+        if resumable:
+            self._close_code = 4000
         self._close_gateway.set()
 
+    def _is_processed_replay(self, seq: int | None, event: str) -> bool:
+        """Check if a dispatch replayed by a resume was processed before the session was persisted."""
+        last, unprocessed = self._replay
+        if seq is None or event in ("READY", "RESUMED"):
+            return False
+        if seq > last:
+            # the replay is over
+            self._replay = None
+            return False
+        return seq not in unprocessed
+
+    def get_session(self) -> GatewaySession | None:
+        """
+        Get the resumable state of this connection.
+
+        Returns:
+            The session of this connection, or None if there is no session to resume
+
+        """
+        if self.session_id is None or not self.ws_resume_url:
+            return None
+        sequence = self.sequence
+        unprocessed = list(self._unprocessed)
+        if self._replay is not None:
+            # the replay was cut short, so the dispatches it hadn't reached are still needed
+            sequence, replayed = self._replay
+            unprocessed += sorted(seq for seq in replayed if self.sequence is None or seq > self.sequence)
+        return GatewaySession(
+            shard_id=self.shard[0],
+            total_shards=self.shard[1],
+            session_id=self.session_id,
+            sequence=sequence,
+            unprocessed=unprocessed,
+            resume_url=self.ws_resume_url,
+        )
+
     async def _identify(self) -> None:
         """Send an identify payload to the gateway."""
         if self.ws is None:
             raise RuntimeError
+        if self.state.client.identify_gate is not None:
+            await self.state.client.identify_gate(self.shard[0])
+
         payload = {
             "op": OPCODE.IDENTIFY,
             "d": {
@@ -275,10 +427,14 @@ class GatewayClient(WebsocketClient):
             logging.DEBUG, f"Identification payload sent to gateway, requesting intents: {self.state.intents}"
         )
 
-    async def reconnect(self, *, resume: bool = False, code: int = 1012, url: str | None = None) -> None:
+    async def reconnect(
+        self, *, resume: bool = False, code: int = 1012, url: str | None = None, reason: str = "unknown"
+    ) -> None:
+        self.state.wrapped_logger(logging.DEBUG, f"Reconnecting: {reason}")
+        self.telemetry.record_reconnect(reason, resume)
         self.state.clear_ready()
         self._ready.clear()
-        await super().reconnect(resume=resume, code=code, url=url)
+        await super().reconnect(resume=resume, code=code, url=url, reason=reason)
 
     async def _resume_connection(self) -> None:
         """Send a resume payload to the gateway."""
@@ -344,6 +500,43 @@ class GatewayClient(WebsocketClient):
         }
         await self.send_json(payload)
 
+    async def request_members(
+        self, guild_id: "Snowflake_Type", user_ids: list["Snowflake_Type"], *, timeout: float = 10
+    ) -> tuple[list["Member"], list["Snowflake_Type"]]:
+        """
+        Request specific members of a guild, and wait for discord to send them.
+
+        Args:
+            guild_id: The ID of the guild
+            user_ids: The IDs of the members to request, up to 100
+            timeout: How long to wait for the members (seconds)
+
+        Returns:
+            The members that were found, and the IDs of those that weren't
+
+        Raises:
+            asyncio.TimeoutError: If discord doesn't respond in time
+
+        """
+        nonce = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self._member_requests[nonce] = ([], [], future)
+        try:
+            await self.request_member_chunks(guild_id, None, limit=None, user_ids=list(user_ids), nonce=nonce)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._member_requests.pop(nonce, None)
+
+    def _process_member_request_chunk(self, chunk: dict) -> None:
+        members, not_found, future = self._member_requests[chunk["nonce"]]
+        guild_id = to_snowflake(chunk["guild_id"])
+        cache = self.state.client.cache
+        members.extend(cache.place_member_data(guild_id, member) for member in chunk.get("members", []))
+        not_found.extend(to_snowflake(user_id) for user_id in chunk.get("not_found", []))
+
+        if chunk.get("chunk_index", 0) >= chunk.get("chunk_count", 1) - 1 and not future.done():
+            future.set_result((members, not_found))
+
     async def _process_member_chunk(self, chunk: dict) -> Task[None]:
         if guild := self.state.client.cache.get_guild(to_snowflake(chunk.get("guild_id"))):
             return asyncio.create_task(guild.process_member_chunk(chunk))
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Iterable
+
+__all__ = ("IdentifyScheduler",)
+
+
+class IdentifyScheduler:
+    """
+    Paces IDENTIFY payloads according to discord's session start limit.
+
+    Shards are grouped into rate limit keys by `shard_id % max_concurrency`. Each key may identify once per window,
+    and all keys identify in parallel, so `max_concurrency` shards can identify every window.
+
+    Attributes:
+        max_concurrency: The number of rate limit keys, as reported by discord
+        interval: The length of the rate limit window (seconds)
+        identify_count: The number of identifies this scheduler has allowed
+
+    """
+
+    def __init__(self, max_concurrency: int = 1, *, interval: float = 5.1) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        # a little over discord's 5 second window, to allow for clock jitter
+        self.interval = interval
+
+        self.identify_count = 0
+        self._locks: dict[int, asyncio.Lock] = {}
+        self._last_identify: dict[int, float] = {}
+        self._first: float | None = None
+        self._last: float | None = None
+
+    def get_key(self, shard_id: int) -> int:
+        """
+        Get the rate limit key of a shard.
+
+        Args:
+            shard_id: The ID of the shard
+
+        Returns:
+            The rate limit key
+
+        """
+        return shard_id % self.max_concurrency
+
+    async def acquire(self, shard_id: int) -> None:
+        """
+        Wait until the given shard may identify.
+
+        Only shards that share a rate limit key wait on each other.
+
+        Args:
+            shard_id: The ID of the shard that wants to identify
+
+        """
+        key = self.get_key(shard_id)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if (last := self._last_identify.get(key)) is not None:
+                if (wait := last + self.interval - time.monotonic()) > 0:
+                    await asyncio.sleep(wait)
+
+            now = time.monotonic()
+            self._last_identify[key] = now
+            if self._first is None:
+                self._first = now
+            self._last = now
+            self.identify_count += 1
+
+    def expected_duration(self, shard_ids: Iterable[int]) -> float:
+        """
+        Get the minimum time it takes for the given shards to identify.
+
+        Args:
+            shard_ids: The IDs of the shards that will identify
+
+        Returns:
+            The time between the first and last identify (seconds)
+
+        """
+        per_key = Counter(self.get_key(shard_id) for shard_id in shard_ids)
+        if not per_key:
+            return 0.0
+        return (max(per_key.values()) - 1) * self.interval
+
+    @property
+    def actual_duration(self) -> float:
+        """The time between the first and last identify this scheduler allowed (seconds)."""
+        if self._first is None:
+            return 0.0
+        return self._last - self._first
@@ -0,0 +1,197 @@
+import asyncio
+import collections
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .gateway import GatewayClient
+
+__all__ = ("DispatchPipeline",)
+
+# events where the guild's ID is stored in `id`, rather than `guild_id`
+_GUILD_ID_EVENTS = frozenset({"GUILD_CREATE", "GUILD_UPDATE", "GUILD_DELETE"})
+
+
+class DispatchPipeline:
+    """
+    A bounded queue of gateway dispatches for a single shard.
+
+    Dispatches are partitioned by guild (or by channel, for DMs) across a pool of workers. Each worker processes its
+    partition serially, so events for the same guild are processed in the order they were received, while different
+    guilds are processed in parallel. Once the queues are full, `put` blocks, which applies backpressure to the
+    websocket reader.
+
+    The sequence numbers of dispatches that haven't been processed are tracked, so a session that is stopped with
+    dispatches still queued can be resumed from before them, rather than losing them. Dispatches for other partitions
+    that were processed in the meantime are skipped when they're replayed, see `GatewaySession.unprocessed`.
+
+    Attributes:
+        worker_count: The number of workers in this pipeline
+        max_size: The total number of dispatches that may be queued across all workers
+        processed: The number of dispatches processed by this pipeline
+        saturated: The number of times the websocket reader had to wait for space in the queue
+
+    """
+
+    def __init__(self, gateway: "GatewayClient", workers: int, max_size: int) -> None:
+        if workers < 1:
+            raise ValueError("A dispatch pipeline requires at least one worker")
+
+        self.gateway = gateway
+        self.worker_count = workers
+        self.max_size = max_size
+
+        per_worker = max(1, max_size // workers)
+        self._queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=per_worker) for _ in range(workers)]
+        self._workers: list[asyncio.Task] = []
+        self._lag = collections.deque(maxlen=100)
+        self._unprocessed: set[int] = set()
+
+        self.processed = 0
+        self.saturated = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers of this pipeline are running."""
+        return bool(self._workers)
+
+    @property
+    def depth(self) -> int:
+        """The number of dispatches currently waiting to be processed."""
+        return sum(queue.qsize() for queue in self._queues)
+
+    @property
+    def oldest_unprocessed(self) -> int | None:
+        """The sequence number of the oldest dispatch that was queued but not processed, if any."""
+        return min(self._unprocessed, default=None)
+
+    @property
+    def unprocessed(self) -> list[int]:
+        """The sequence numbers of the dispatches that were queued but not processed, in order."""
+        return sorted(self._unprocessed)
+
+    @property
+    def lag(self) -> float:
+        """The time the most recently processed dispatch spent in the queue (seconds)."""
+        return self._lag[-1] if self._lag else 0.0
+
+    @property
+    def average_lag(self) -> float:
+        """The average time recent dispatches spent in the queue (seconds)."""
+        if self._lag:
+            return sum(self._lag) / len(self._lag)
+        return 0.0
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """A snapshot of the metrics of this pipeline."""
+        return {
+            "workers": self.worker_count,
+            "depth": self.depth,
+            "max_size": self.max_size,
+            "lag": self.lag,
+            "average_lag": self.average_lag,
+            "processed": self.processed,
+            "saturated": self.saturated,
+        }
+
+    def start(self) -> None:
+        """Start the workers of this pipeline."""
+        if self._workers:
+            return
+        self._unprocessed.clear()
+        shard_id = self.gateway.shard[0]
+        self._workers = [
+            asyncio.create_task(self._work(queue), name=f"interactions:: dispatch worker {shard_id}:{i}")
+            for i, queue in enumerate(self._queues)
+        ]
+
+    async def stop(self, timeout: float = 0) -> None:
+        """
+        Stop the workers of this pipeline.
+
+        Anything still queued once the timeout expires is discarded, and remains in `oldest_unprocessed`.
+
+        Args:
+            timeout: How long to wait for the queued dispatches to be processed (seconds)
+
+        """
+        if self._workers and timeout > 0:
+            try:
+                await asyncio.wait_for(self.join(), timeout)
+            except asyncio.TimeoutError:
+                self.gateway.state.wrapped_logger(
+                    logging.WARNING, f"Discarding {self.depth} dispatches that weren't processed before stopping"
+                )
+
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        for queue in self._queues:
+            while not queue.empty():
+                queue.get_nowait()
+                queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until everything currently queued has been processed."""
+        await asyncio.gather(*(queue.join() for queue in self._queues))
+
+    def _get_queue(self, event: str, data: Any) -> asyncio.Queue:
+        if self.worker_count == 1 or not isinstance(data, dict):
+            return self._queues[0]
+
+        if event in _GUILD_ID_EVENTS:
+            key = data.get("id")
+        else:
+            key = data.get("guild_id") or data.get("channel_id")
+
+        if key is None:
+            # events without a guild or channel are kept in order with each other on the first worker
+            return self._queues[0]
+        return self._queues[hash(key) % self.worker_count]
+
+    async def put(self, data: Any, seq: int | None, event: str) -> None:
+        """
+        Queue a dispatch for processing.
+
+        If the queue for this dispatch's partition is full, this waits until space is available.
+
+        Args:
+            data: The data of the dispatch
+            seq: The sequence number of the dispatch
+            event: The name of the dispatched event
+
+        """
+        queue = self._get_queue(event, data)
+        item = (time.perf_counter(), data, seq, event)
+        if seq is not None:
+            self._unprocessed.add(seq)
+
+        if queue.full():
+            self.saturated += 1
+            self.gateway.state.wrapped_logger(
+                logging.DEBUG, f"Dispatch queue is saturated ({self.depth}/{self.max_size}), applying backpressure"
+            )
+            await queue.put(item)
+        else:
+            queue.put_nowait(item)
+
+    async def _work(self, queue: asyncio.Queue) -> None:
+        while True:
+            queued_at, data, seq, event = await queue.get()
+            lag = time.perf_counter() - queued_at
+            self._lag.append(lag)
+            try:
+                await self.gateway.dispatch_event(data, seq, event, queue_lag=lag)
+            except asyncio.CancelledError:
+                # the dispatch is left unprocessed, so a resumed session receives it again
+                queue.task_done()
+                raise
+            except Exception as e:
+                self.gateway.state.wrapped_logger(logging.ERROR, f"Failed to process dispatch {event}: {e!r}")
+            self.processed += 1
+            self._unprocessed.discard(seq)
+            queue.task_done()
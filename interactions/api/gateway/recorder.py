@@ -0,0 +1,287 @@
+"""Record gateway traffic to a file, and replay it into a client without connecting to discord."""
+
+import asyncio
+import gzip
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+import attrs
+
+from interactions.client.const import MISSING, __api_version__, get_logger
+from interactions.client.utils.input_utils import FastJson
+from interactions.models.discord.user import ClientUser
+from .gateway import GatewayClient
+from .state import ConnectionState
+
+if TYPE_CHECKING:
+    from interactions.client import Client
+
+__all__ = ("RECORDING_VERSION", "GatewayRecorder", "GatewayReplayer", "ReplayStats")
+
+RECORDING_VERSION = 1
+"""The version of the recording format"""
+
+
+class GatewayRecorder:
+    """
+    Records the dispatches received by a client's gateway connections.
+
+    Each dispatch is written as a json line, with the time since recording started, to a gzip compressed file.
+    Pass this to the client as `gateway_recorder` to start recording.
+
+    Dispatches are serialized as they're recorded, as processing may modify them, but the lines are buffered, and
+    compressed and written to the file in a background thread.
+
+    Args:
+        path: The file to record to
+        compresslevel: The gzip compression level
+        buffer_size: How much serialized data to buffer before writing it (bytes)
+
+    """
+
+    def __init__(self, path: str | Path, *, compresslevel: int = 5, buffer_size: int = 256 * 1024) -> None:
+        self.path = Path(path)
+        self.compresslevel = compresslevel
+        self.buffer_size = buffer_size
+
+        self.frame_count = 0
+        self._file: gzip.GzipFile | None = None
+        self._start: float = 0
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        # a single thread, so chunks are written in order
+        self._writer: ThreadPoolExecutor | None = None
+
+    @property
+    def recording(self) -> bool:
+        """Whether this recorder is open."""
+        return self._file is not None
+
+    def open(self) -> None:
+        """Open the recording file, overwriting any previous recording."""
+        if self._file is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self.path, "wb", compresslevel=self.compresslevel)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="interactions-recorder")
+        self._start = time.perf_counter()
+        self._write({"version": RECORDING_VERSION, "api_version": __api_version__, "started_at": time.time()})
+
+    def close(self) -> None:
+        """Write anything buffered, and close the recording file."""
+        if self._file is not None:
+            self.flush()
+            self._writer.shutdown(wait=True)
+            self._writer = None
+            self._file.close()
+            self._file = None
+
+    def flush(self) -> None:
+        """Write the buffered dispatches to the file in the background."""
+        if self._buffer:
+            chunk = b"".join(self._buffer)
+            self._buffer = []
+            self._buffered = 0
+            self._writer.submit(self._file.write, chunk)
+
+    def _write(self, payload: dict) -> None:
+        line = FastJson.dumps(payload).encode("utf-8") + b"\n"
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if self._buffered >= self.buffer_size:
+            self.flush()
+
+    def record(self, shard_id: int, seq: int | None, event: str, data: Any) -> None:
+        """
+        Record a dispatch.
+
+        This must be called before the dispatch is processed, as processing may modify the data.
+
+        Args:
+            shard_id: The ID of the shard that received the dispatch
+            seq: The sequence number of the dispatch
+            event: The name of the dispatched event
+            data: The data of the dispatch
+
+        """
+        if self._file is None:
+            self.open()
+        self._write({"t": time.perf_counter() - self._start, "s": shard_id, "q": seq, "e": event, "d": data})
+        self.frame_count += 1
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class ReplayStats:
+    """The results of a replay."""
+
+    frames: int = attrs.field(repr=True, default=0)
+    """The number of dispatches replayed"""
+    duration: float = attrs.field(repr=True, default=0)
+    """How long the replay took (seconds)"""
+    recorded_duration: float = attrs.field(repr=False, default=0)
+    """How long the recording took (seconds)"""
+    events: Counter = attrs.field(repr=False, factory=Counter)
+    """The number of dispatches replayed of each event type"""
+    max_rss: int | None = attrs.field(repr=False, default=None)
+    """The peak resident memory of this process after the replay (kilobytes), if available"""
+
+    @property
+    def events_per_second(self) -> float:
+        """The number of dispatches replayed per second."""
+        return self.frames / self.duration if self.duration else 0.0
+
+
+class GatewayReplayer:
+    """
+    Replays a recording made by `GatewayRecorder` into a client.
+
+    Dispatches are fed through the client's usual processors and dispatch path, as if they were received from
+    discord. The client does not need to be logged in; the bot's user is taken from the recorded READY.
+
+    !!! note
+        Interactions are not synchronised, and `Startup` is not dispatched during a replay.
+
+    Args:
+        client: The client to replay into
+        path: The recording to replay
+        speed: The speed to replay at, relative to the recording. `None` replays as fast as possible
+        drain_timeout: How long to wait for the tasks started by the replay, ie processors and listeners, to finish once every dispatch has been fed (seconds)
+
+    """
+
+    def __init__(
+        self, client: "Client", path: str | Path, *, speed: float | None = 1.0, drain_timeout: float = 30
+    ) -> None:
+        self.client = client
+        self.path = Path(path)
+        self.speed = speed
+        self.drain_timeout = drain_timeout
+
+        self._gateways: dict[int, GatewayClient] = {}
+        self.logger = get_logger()
+
+    def read(self) -> Iterator[dict]:
+        """
+        Read the frames of the recording.
+
+        Returns:
+            An iterator of frames, excluding the header
+
+        """
+        with gzip.open(self.path, "rb") as f:
+            header = FastJson.loads(f.readline())
+            if header.get("version") != RECORDING_VERSION:
+                raise ValueError(f"Unsupported recording version: {header.get('version')}")
+            for line in f:
+                yield FastJson.loads(line)
+
+    def _get_gateway(self, shard_id: int) -> GatewayClient:
+        if (gateway := self._gateways.get(shard_id)) is None:
+            state = self.client._connection_state
+            if state is None:
+                # sharded clients create their connection states when logging in
+                state = ConnectionState(self.client, self.client.intents, shard_id)
+                self.client._add_connection_state(state)
+
+            gateway = GatewayClient(state, (shard_id, self.client.total_shards))
+            state.gateway = gateway
+            if gateway.dispatch_pipeline is not None:
+                gateway.dispatch_pipeline.start()
+            self._gateways[shard_id] = gateway
+        return gateway
+
+    def _prepare(self, frame: dict) -> None:
+        if self.client._user is MISSING and frame["e"] == "READY":
+            # the client hasn't logged in, so gather its callbacks and take the user from READY instead
+            self.client._gather_callbacks()
+            self.client._user = ClientUser.from_dict(frame["d"]["user"], self.client)
+            self.client.cache.place_user_data(frame["d"]["user"])
+            # avoid syncing interactions, which needs the api
+            self.client._startup = True
+
+    async def _drain(self, tasks: set[asyncio.Task]) -> None:
+        deadline = time.perf_counter() + self.drain_timeout
+        while tasks and (remaining := deadline - time.perf_counter()) > 0:
+            # tasks may start more tasks as they finish, which are added to the set
+            await asyncio.wait(set(tasks), timeout=remaining)
+        if tasks:
+            self.logger.warning(
+                f"{len(tasks)} tasks started by the replay were still running after {self.drain_timeout}s"
+            )
+
+    async def run(self) -> ReplayStats:
+        """
+        Replay the recording.
+
+        The replay finishes once every task started by the replayed dispatches has finished, so the duration includes
+        the processors and listeners they ran.
+
+        Returns:
+            The stats of the replay
+
+        """
+        loop = asyncio.get_running_loop()
+        previous_factory = loop.get_task_factory()
+        tasks: set[asyncio.Task] = set()
+
+        def track_task(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs) -> asyncio.Task:
+            if previous_factory is not None:
+                task = previous_factory(loop, coro, **kwargs)
+            else:
+                task = asyncio.Task(coro, loop=loop, **kwargs)
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            return task
+
+        loop.set_task_factory(track_task)
+        try:
+            stats = await self._replay(tasks)
+        finally:
+            loop.set_task_factory(previous_factory)
+
+        try:
+            import resource
+
+            stats.max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        except ImportError:
+            pass
+
+        self.logger.info(
+            f"Replayed {stats.frames} dispatches in {stats.duration:.2f}s ({stats.events_per_second:.0f} events/s)"
+        )
+        return stats
+
+    async def _replay(self, tasks: set[asyncio.Task]) -> ReplayStats:
+        stats = ReplayStats()
+        start = time.perf_counter()
+
+        for frame in self.read():
+            if self.speed:
+                if (delay := frame["t"] / self.speed - (time.perf_counter() - start)) > 0:
+                    await asyncio.sleep(delay)
+            else:
+                # let the dispatched events run
+                await asyncio.sleep(0)
+
+            self._prepare(frame)
+            gateway = self._get_gateway(frame["s"])
+            if gateway.dispatch_pipeline is not None and frame["e"] not in ("READY", "RESUMED"):
+                await gateway.dispatch_pipeline.put(frame["d"], frame["q"], frame["e"])
+            else:
+                _ = asyncio.create_task(gateway.dispatch_event(frame["d"], frame["q"], frame["e"]))  # noqa: RUF006
+
+            stats.frames += 1
+            stats.events[frame["e"]] += 1
+            stats.recorded_duration = frame["t"]
+
+        for gateway in self._gateways.values():
+            if gateway.dispatch_pipeline is not None:
+                await gateway.dispatch_pipeline.join()
+                await gateway.dispatch_pipeline.stop()
+        await self._drain(tasks)
+
+        stats.duration = time.perf_counter() - start
+        return stats
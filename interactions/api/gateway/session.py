@@ -0,0 +1,168 @@
+"""Persistence of gateway sessions, allowing a restarted process to RESUME rather than IDENTIFY."""
+
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import attrs
+
+from interactions.client.utils.input_utils import FastJson
+
+__all__ = ("GatewaySession", "SessionStore", "FileSessionStore")
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class GatewaySession:
+    """The state required to resume a gateway session."""
+
+    shard_id: int = attrs.field(repr=True)
+    """The ID of the shard this session belongs to"""
+    total_shards: int = attrs.field(repr=True)
+    """The total number of shards when this session was created"""
+    session_id: str = attrs.field(repr=True)
+    """The ID of the session"""
+    sequence: int | None = attrs.field(repr=False, default=None)
+    """The last sequence number received in this session"""
+    unprocessed: list[int] = attrs.field(repr=False, factory=list)
+    """The dispatches up to `sequence` that weren't processed. The session resumes from before them, skipping the rest"""
+    resume_url: str = attrs.field(repr=False)
+    """The URL that must be used to resume this session"""
+    saved_at: float = attrs.field(repr=False, factory=time.time)
+    """The unix timestamp this session was saved at"""
+
+    def is_expired(self, max_age: float) -> bool:
+        """
+        Check if this session is too old to be resumed.
+
+        Args:
+            max_age: The maximum age of a resumable session (seconds)
+
+        Returns:
+            True if the session has expired, False otherwise.
+
+        """
+        return time.time() - self.saved_at > max_age
+
+    def to_dict(self) -> dict:
+        return attrs.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GatewaySession":
+        return cls(**data)
+
+
+class SessionStore(ABC):
+    """
+    Base class for gateway session stores.
+
+    A session store is given the session of each shard when the client shuts down, and is asked for it again when
+    the shard next starts. Subclass this to persist sessions somewhere other than the local filesystem.
+
+    Attributes:
+        max_age: The maximum age of a session that will be resumed (seconds). Discord only keeps disconnected sessions alive for a short time
+
+    """
+
+    def __init__(self, *, max_age: float = 120) -> None:
+        self.max_age = max_age
+
+    @abstractmethod
+    async def save(self, session: GatewaySession) -> None:
+        """
+        Persist a session.
+
+        Args:
+            session: The session to persist
+
+        """
+        ...
+
+    @abstractmethod
+    async def load(self, shard_id: int, total_shards: int) -> GatewaySession | None:
+        """
+        Load the persisted session of a shard.
+
+        Args:
+            shard_id: The ID of the shard
+            total_shards: The total number of shards
+
+        Returns:
+            The persisted session, if one exists
+
+        """
+        ...
+
+    @abstractmethod
+    async def clear(self, shard_id: int, total_shards: int) -> None:
+        """
+        Remove the persisted session of a shard.
+
+        Args:
+            shard_id: The ID of the shard
+            total_shards: The total number of shards
+
+        """
+        ...
+
+    async def pop(self, shard_id: int, total_shards: int) -> GatewaySession | None:
+        """
+        Load and remove the persisted session of a shard, if it is still resumable.
+
+        Sessions are removed once loaded, so a session is never resumed twice.
+
+        Args:
+            shard_id: The ID of the shard
+            total_shards: The total number of shards
+
+        Returns:
+            The persisted session, if one exists and hasn't expired
+
+        """
+        session = await self.load(shard_id, total_shards)
+        if session is not None:
+            await self.clear(shard_id, total_shards)
+            if session.is_expired(self.max_age):
+                return None
+        return session
+
+
+class FileSessionStore(SessionStore):
+    """
+    A session store that persists sessions as json files within a directory.
+
+    Each shard is stored in its own file, so multiple processes may share a directory.
+
+    Args:
+        path: The directory to store sessions in
+        max_age: The maximum age of a session that will be resumed (seconds)
+
+    """
+
+    def __init__(self, path: str | Path, *, max_age: float = 120) -> None:
+        super().__init__(max_age=max_age)
+        self.path = Path(path)
+
+    def _get_path(self, shard_id: int, total_shards: int) -> Path:
+        return self.path / f"session-{shard_id}-{total_shards}.json"
+
+    async def save(self, session: GatewaySession) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(session.shard_id, session.total_shards)
+
+        # write to a temporary file first, so a crash mid-write can't leave a corrupt session behind
+        temp = path.with_suffix(".tmp")
+        temp.write_text(FastJson.dumps(session.to_dict()))
+        temp.replace(path)
+
+    async def load(self, shard_id: int, total_shards: int) -> GatewaySession | None:
+        path = self._get_path(shard_id, total_shards)
+        try:
+            return GatewaySession.from_dict(FastJson.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError):
+            # corrupt or outdated session, it can't be resumed anyway
+            return None
+
+    async def clear(self, shard_id: int, total_shards: int) -> None:
+        self._get_path(shard_id, total_shards).unlink(missing_ok=True)
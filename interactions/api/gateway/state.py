@@ -3,17 +3,20 @@ import logging
 import traceback
 from datetime import datetime
 from logging import Logger
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 import attrs
 
 import interactions
 from interactions.api import events
-from interactions.client.const import Absent, MISSING, get_logger
+from interactions.client.const import Absent, MISSING, __api_version__, get_logger
 from interactions.client.errors import LibraryException, WebSocketClosed
 from interactions.models.discord.activity import Activity
 from interactions.models.discord.enums import Intents, Status, ActivityType
+from .chunking import ChunkScheduler
 from .gateway import GatewayClient
+from .session import GatewaySession
+from .telemetry import GatewayTelemetry
 
 if TYPE_CHECKING:
     from interactions import Client, Snowflake_Type
@@ -41,16 +44,34 @@ class ConnectionState:
     gateway_url: str = MISSING
     """The URL that the gateway should connect to."""
 
-    gateway_started: asyncio.Event = asyncio.Event()
+    gateway_started: asyncio.Event = attrs.field(repr=False, factory=asyncio.Event)
     """Event to check if the gateway has been started."""
 
+    telemetry: GatewayTelemetry = attrs.field(repr=False, factory=GatewayTelemetry)
+    """The counters and timings of this shard's gateway connections"""
+    chunk_scheduler: ChunkScheduler | None = attrs.field(repr=False, default=None)
+    """Chunks this shard's guilds in the background, if `chunk_in_background` is enabled"""
+    dispatch_filter: Callable[[GatewayClient, int | None, str, dict], bool] | None = attrs.field(
+        repr=False, default=None
+    )
+    """Called with each dispatch before it is processed, the dispatch is dropped if this returns False"""
+    _total_shards: int | None = attrs.field(repr=False, default=None)
+    guild_ids: set["Snowflake_Type"] = attrs.field(repr=False, factory=set)
+    """The IDs of the guilds this shard has received"""
+
     _shard_task: asyncio.Task | None = None
+    _session: GatewaySession | None = None
 
     logger: Logger = attrs.field(repr=False, init=False, factory=get_logger)
 
     def __attrs_post_init__(self, *args, **kwargs) -> None:
         self._shard_ready = asyncio.Event()
 
+    @property
+    def total_shards(self) -> int:
+        """The total number of shards this shard belongs to, usually the client's."""
+        return self._total_shards or self.client.total_shards
+
     @property
     def latency(self) -> float:
         """Returns the latency of the websocket connection (seconds)."""
@@ -61,6 +82,13 @@ class ConnectionState:
         """Returns the average latency of the websocket connection (seconds)."""
         return self.gateway.average_latency
 
+    @property
+    def dispatch_metrics(self) -> dict | None:
+        """Returns the metrics of this shard's dispatch pipeline, if enabled."""
+        if self.gateway and self.gateway.dispatch_pipeline is not None:
+            return self.gateway.dispatch_pipeline.metrics
+        return None
+
     @property
     def presence(self) -> dict:
         """Returns the presence of the bot."""
@@ -71,10 +99,23 @@ class ConnectionState:
 
     async def start(self) -> None:
         """Connect to the Discord Gateway."""
-        self.gateway_url = await self.client.http.get_gateway()
+        if self.client.gateway_url:
+            self.gateway_url = f"{self.client.gateway_url}?encoding=json&v={__api_version__}&compress=zlib-stream"
+        else:
+            self.gateway_url = await self.client.http.get_gateway()
 
         self.wrapped_logger(logging.INFO, "Starting Shard")
         self.start_time = datetime.now()
+        self._session = await self._load_session()
+        if self.client.fetch_members and self.client.chunk_in_background:
+            if self.chunk_scheduler is None:
+                self.chunk_scheduler = ChunkScheduler(
+                    self,
+                    priority=self.client.chunk_priority,
+                    guild_filter=self.client.chunk_filter,
+                    on_demand=self.client.chunk_on_demand,
+                )
+            self.chunk_scheduler.start()
         self._shard_task = asyncio.create_task(self._ws_connect())
 
         self.gateway_started.set()
@@ -83,19 +124,59 @@ class ConnectionState:
         # so we need to wait for the task to exit.
         await self._shard_task
 
-    async def stop(self) -> None:
-        """Disconnect from the Discord Gateway."""
+    async def stop(self, *, save_session: bool = True) -> None:
+        """
+        Disconnect from the Discord Gateway.
+
+        Args:
+            save_session: Whether to persist the session to the client's session store, if it has one
+
+        """
         self.wrapped_logger(logging.INFO, "Stopping Shard")
-        if self.gateway is not None:
-            self.gateway.close()
+        gateway = self.gateway
+        store = self.client.session_store if save_session else None
+        if gateway is not None:
+            gateway.close(resumable=store is not None)
             self.gateway = None
+        if self.chunk_scheduler is not None:
+            self.chunk_scheduler.stop()
 
         if self._shard_task is not None:
             await self._shard_task
             self._shard_task = None
 
+        if store is not None and gateway is not None and (session := gateway.get_session()):
+            try:
+                await store.save(session)
+            except Exception as e:
+                self.wrapped_logger(logging.ERROR, f"Failed to save gateway session: {e!r}")
+            else:
+                self.wrapped_logger(logging.DEBUG, f"Saved gateway session {session.session_id}")
+
         self.gateway_started.clear()
 
+    async def _load_session(self) -> GatewaySession | None:
+        """Load this shard's persisted session, if it can be resumed."""
+        store = self.client.session_store
+        if store is None:
+            return None
+
+        try:
+            session = await store.pop(self.shard_id, self.total_shards)
+        except Exception as e:
+            self.wrapped_logger(logging.ERROR, f"Failed to load gateway session: {e!r}")
+            return None
+
+        if session is None:
+            return None
+        if not self.client.cache.guild_cache and not self.client.resume_without_cache:
+            # resuming only replays the events we missed, so without a warm cache we'd never learn about our guilds
+            self.wrapped_logger(logging.INFO, "Cache is empty, discarding persisted gateway session")
+            return None
+
+        self.wrapped_logger(logging.INFO, f"Attempting to resume persisted session {session.session_id}")
+        return session
+
     def clear_ready(self) -> None:
         """Clear the ready event."""
         self._shard_ready.clear()
@@ -105,12 +186,12 @@ class ConnectionState:
         """Connect to the Discord Gateway."""
         self.wrapped_logger(logging.INFO, "Shard is attempting to connect to gateway...")
         try:
-            async with GatewayClient(self, (self.shard_id, self.client.total_shards)) as self.gateway:
+            async with GatewayClient(self, (self.shard_id, self.total_shards), session=self._session) as self.gateway:
                 try:
                     await self.gateway.run()
                 finally:
                     self._shard_ready.clear()
-                    if self.client.total_shards == 1:
+                    if self.total_shards == 1:
                         self.client.dispatch(events.Disconnect())
                     else:
                         self.client.dispatch(events.ShardDisconnect(self.shard_id))
@@ -130,17 +211,21 @@ class ConnectionState:
             self.client.dispatch(events.Disconnect())
             self.wrapped_logger(logging.ERROR, "".join(traceback.format_exception(type(e), e, e.__traceback__)))
 
-    def wrapped_logger(self, level: int, message: str, **kwargs) -> None:
+    def wrapped_logger(self, level: int, message: str, *args, **kwargs) -> None:
         """
         A logging wrapper that adds shard information to the message.
 
+        Nothing is formatted unless the level is enabled, so values are best passed as `args` for `%s` placeholders.
+
         Args:
             level: The logging level
             message: The message to log
+            *args: The values of the message's `%s` placeholders
             **kwargs: Any additional keyword arguments that Logger.log accepts
 
         """
-        self.logger.log(level, f"Shard ID {self.shard_id} | {message}", **kwargs)
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, f"Shard ID {self.shard_id} | {message}", *args, **kwargs)
 
     async def change_presence(
         self,
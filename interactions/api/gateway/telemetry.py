@@ -0,0 +1,163 @@
+import time
+from collections import Counter, deque
+
+__all__ = ("GatewayTelemetry",)
+
+
+class GatewayTelemetry:
+    """
+    Counters and timings for a gateway connection.
+
+    A shard's telemetry persists across reconnects, so it covers the whole lifetime of the shard.
+
+    Attributes:
+        frames: The number of websocket frames received
+        bytes_received: The number of bytes received over the websocket
+        compressed_bytes: The number of compressed bytes received
+        decompressed_bytes: The size of the compressed payloads once decompressed
+        payloads: The number of complete payloads received
+        inflate_time: The total time spent decompressing payloads (seconds)
+        parse_time: The total time spent parsing payloads (seconds)
+        events: The number of dispatches received of each event type
+        reconnects: The number of reconnects, by reason
+        resumes: The number of sessions successfully resumed
+        time_to_first_dispatch: The time between the last READY and the dispatch that followed it (seconds)
+
+    """
+
+    def __init__(self, *, history: int = 20) -> None:
+        self.frames = 0
+        self.bytes_received = 0
+        self.compressed_bytes = 0
+        self.decompressed_bytes = 0
+        self.payloads = 0
+        self.inflate_time = 0.0
+        self.parse_time = 0.0
+
+        self.events: Counter = Counter()
+        self.reconnects: Counter = Counter()
+        self.resumes = 0
+        self.reconnect_history: deque[tuple[float, str, bool]] = deque(maxlen=history)
+        """The most recent reconnects, as (timestamp, reason, resumed)"""
+
+        self.time_to_first_dispatch: float | None = None
+        self._ready_at: float | None = None
+
+        self.started_at = time.monotonic()
+        # events are counted in one second buckets, the last complete bucket gives the current rate
+        self._bucket_start = self.started_at
+        self._bucket: Counter = Counter()
+        self._last_bucket: Counter = Counter()
+
+    def record_frame(self, size: int, compressed: bool) -> None:
+        """
+        Record a websocket frame.
+
+        Args:
+            size: The size of the frame (bytes)
+            compressed: Whether the frame is part of the zlib stream
+
+        """
+        self.frames += 1
+        self.bytes_received += size
+        if compressed:
+            self.compressed_bytes += size
+
+    def record_payload(self, decompressed_size: int | None, inflate_time: float, parse_time: float) -> None:
+        """
+        Record a complete payload.
+
+        Args:
+            decompressed_size: The size of the payload after decompression, or None if it wasn't compressed
+            inflate_time: The time spent decompressing the payload (seconds)
+            parse_time: The time spent parsing the payload (seconds)
+
+        """
+        self.payloads += 1
+        if decompressed_size is not None:
+            self.decompressed_bytes += decompressed_size
+        self.inflate_time += inflate_time
+        self.parse_time += parse_time
+
+    def record_dispatch(self, event: str) -> None:
+        """
+        Record a dispatch.
+
+        Args:
+            event: The name of the dispatched event
+
+        """
+        now = time.monotonic()
+        if now - self._bucket_start >= 1:
+            # if more than a second passed without events, the last complete second was empty
+            self._last_bucket = self._bucket if now - self._bucket_start < 2 else Counter()
+            self._bucket = Counter()
+            self._bucket_start = now
+
+        self.events[event] += 1
+        self._bucket[event] += 1
+
+        if event == "READY":
+            self._ready_at = now
+        elif self._ready_at is not None:
+            self.time_to_first_dispatch = now - self._ready_at
+            self._ready_at = None
+
+    def record_reconnect(self, reason: str, resume: bool) -> None:
+        """
+        Record a reconnect.
+
+        Args:
+            reason: Why the connection reconnected
+            resume: Whether the connection attempted to resume the session
+
+        """
+        self.reconnects[reason] += 1
+        self.reconnect_history.append((time.time(), reason, resume))
+
+    def record_resume(self) -> None:
+        """Record a successfully resumed session."""
+        self.resumes += 1
+
+    @property
+    def events_per_second(self) -> dict[str, int]:
+        """The number of dispatches of each event type received in the last complete second."""
+        if time.monotonic() - self._bucket_start >= 2:
+            return {}
+        return dict(self._last_bucket)
+
+    @property
+    def total_events_per_second(self) -> int:
+        """The number of dispatches received in the last complete second."""
+        return sum(self.events_per_second.values())
+
+    @property
+    def compression_ratio(self) -> float:
+        """The ratio of decompressed to compressed bytes."""
+        return self.decompressed_bytes / self.compressed_bytes if self.compressed_bytes else 0.0
+
+    def to_dict(self) -> dict:
+        """
+        Get a snapshot of this telemetry.
+
+        Returns:
+            The counters and timings, as a dict
+
+        """
+        return {
+            "frames": self.frames,
+            "bytes_received": self.bytes_received,
+            "compressed_bytes": self.compressed_bytes,
+            "decompressed_bytes": self.decompressed_bytes,
+            "compression_ratio": self.compression_ratio,
+            "payloads": self.payloads,
+            "inflate_time": self.inflate_time,
+            "parse_time": self.parse_time,
+            "events": dict(self.events),
+            "events_per_second": self.events_per_second,
+            "total_events_per_second": self.total_events_per_second,
+            "reconnects": dict(self.reconnects),
+            "resumes": self.resumes,
+            "time_to_first_dispatch": self.time_to_first_dispatch,
+            "uptime": time.monotonic() - self.started_at,
+        }
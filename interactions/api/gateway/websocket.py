@@ -1,9 +1,11 @@
 import asyncio
 import collections
+import logging
 import random
 import time
 import zlib
 from abc import abstractmethod
+from concurrent.futures import Executor
 from types import TracebackType
 from typing import TypeVar, TYPE_CHECKING
 
@@ -13,6 +15,7 @@ from interactions.client import const
 from interactions.client.errors import WebSocketClosed
 from interactions.client.utils.input_utils import FastJson
 from interactions.models.internal.cooldowns import CooldownSystem
+from .telemetry import GatewayTelemetry
 
 if TYPE_CHECKING:
     from interactions.api.gateway.state import ConnectionState
@@ -49,6 +52,11 @@ class WebsocketClient:
 
         self.heartbeat_interval = None
         self._latency = collections.deque(maxlen=10)
+        self.telemetry = GatewayTelemetry()
+
+        # payloads at least this large are decompressed and parsed off the event loop
+        self.offload_threshold: int | None = state.client.gateway_offload_threshold
+        self.parse_executor: Executor | None = state.client.gateway_parse_executor
 
         # This lock needs to be held to send something over the gateway, but is also held when
         # reconnecting. That way there's no race conditions between sending and reconnecting.
@@ -142,7 +150,8 @@ class WebsocketClient:
             bypass: Should the rate limit be ignored for this send (used for heartbeats)
 
         """
-        self.logger.debug(f"Sending data to websocket: {data}")
+        if self.logger.isEnabledFor(logging.DEBUG) and self.state.client.log_sampler.sample("gateway"):
+            self.logger.debug("Sending data to websocket: %s", data)
 
         async with self._race_lock:
             if self.ws is None:
@@ -195,7 +204,11 @@ class WebsocketClient:
                 if force:
                     raise RuntimeError("Discord unexpectedly wants to close the WebSocket during force receive!")
 
-                await self.reconnect(code=code, resume=code not in const.NON_RESUMABLE_WEBSOCKET_CLOSE_CODES)
+                await self.reconnect(
+                    code=code,
+                    resume=code not in const.NON_RESUMABLE_WEBSOCKET_CLOSE_CODES,
+                    reason=f"closed with code {code}",
+                )
                 continue
 
             if resp.type is WSMsgType.CLOSED:
@@ -211,7 +224,7 @@ class WebsocketClient:
                     # This is an odd corner-case where the underlying socket connection was closed
                     # unexpectedly without communicating the WebSocket closing handshake. We'll have
                     # to reconnect ourselves.
-                    await self.reconnect(resume=True)
+                    await self.reconnect(resume=True, reason="connection lost")
 
             elif resp.type is WSMsgType.CLOSING:
                 if force:
@@ -227,26 +240,83 @@ class WebsocketClient:
                 continue
 
             if isinstance(resp.data, bytes):
+                self.telemetry.record_frame(len(resp.data), compressed=True)
                 buffer.extend(resp.data)
 
                 if len(resp.data) < 4 or resp.data[-4:] != b"\x00\x00\xff\xff":
                     # message isn't complete yet, wait
                     continue
 
+                if self.offload_threshold is not None and len(buffer) >= self.offload_threshold:
+                    if (msg := await self._receive_offloaded(buffer)) is None:
+                        continue
+                    return msg
+
+                start = time.perf_counter()
                 msg = self._zlib.decompress(buffer)
+                decompressed_size = len(msg)
                 msg = msg.decode("utf-8")
             else:
+                self.telemetry.record_frame(len(resp.data), compressed=False)
+                if self.offload_threshold is not None and len(resp.data) >= self.offload_threshold:
+                    if (msg := await self._receive_offloaded(resp.data)) is None:
+                        continue
+                    return msg
+
+                start = time.perf_counter()
+                decompressed_size = None
                 msg = resp.data
 
+            inflated = time.perf_counter()
             try:
                 msg = FastJson.loads(msg)
             except Exception as e:
                 self.logger.error(e)
                 continue
 
+            self.telemetry.record_payload(decompressed_size, inflated - start, time.perf_counter() - inflated)
             return msg
 
-    async def reconnect(self, *, resume: bool = False, code: int = 1012, url: str | None = None) -> None:
+    async def _receive_offloaded(self, data: bytearray | str) -> dict | None:
+        """
+        Decompress and parse a large payload without blocking the event loop.
+
+        Decompression runs in a worker thread, as zlib releases the GIL. Parsing holds the GIL, so it's only
+        moved off the loop if `parse_executor` is set (ie a process pool), otherwise it runs inline.
+
+        Args:
+            data: The complete compressed payload, or the payload text if it wasn't compressed
+
+        Returns:
+            The parsed payload, or None if it couldn't be parsed
+
+        """
+        start = time.perf_counter()
+        decompressed_size = None
+        if isinstance(data, bytearray):
+            # the stream is only ever read by this task, so payloads are still decompressed in order. The
+            # decompressor is captured in case the connection is replaced while we wait
+            decompressor = self._zlib
+            raw = await asyncio.to_thread(decompressor.decompress, bytes(data))
+            decompressed_size = len(raw)
+            data = raw.decode("utf-8")
+
+        inflated = time.perf_counter()
+        try:
+            if self.parse_executor is None:
+                msg = FastJson.loads(data)
+            else:
+                msg = await asyncio.get_running_loop().run_in_executor(self.parse_executor, FastJson.loads, data)
+        except Exception as e:
+            self.logger.error(e)
+            return None
+
+        self.telemetry.record_payload(decompressed_size, inflated - start, time.perf_counter() - inflated)
+        return msg
+
+    async def reconnect(
+        self, *, resume: bool = False, code: int = 1012, url: str | None = None, reason: str = "unknown"
+    ) -> None:
         async with self._race_lock:
             self._closed.clear()
 
@@ -300,7 +370,7 @@ class WebsocketClient:
                     " likely zombied connection. Reconnect!"
                 )
 
-                await self.reconnect(resume=True)
+                await self.reconnect(resume=True, reason="heartbeat not acknowledged")
 
             self._acknowledged.clear()
             await self.send_heartbeat()
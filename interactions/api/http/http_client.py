@@ -4,7 +4,7 @@ import asyncio
 import inspect
 import os
 import time
-from logging import Logger
+from logging import DEBUG, Logger
 from typing import Any, cast, Callable
 from urllib.parse import quote as _uriquote
 from weakref import WeakValueDictionary
@@ -15,6 +15,7 @@ from aiohttp import BaseConnector, ClientSession, ClientWebSocketResponse, FormD
 from multidict import CIMultiDictProxy
 
 import interactions.client.const as constants
+from interactions.client import tracing
 from interactions import models
 from interactions.api.http.http_requests import (
     BotRequests,
@@ -49,6 +50,7 @@ from interactions.client.errors import (
 )
 from interactions.client.mixins.serialization import DictSerializationMixin
 from interactions.client.utils.input_utils import response_decode, FastJson
+from interactions.client.utils.log_utils import LogSampler
 from interactions.client.utils.serializer import dict_filter, get_file_mimetype
 from interactions.models.discord.file import UPLOADABLE_TYPE
 from .route import Route
@@ -156,7 +158,7 @@ class BucketLock:
             return
 
         if self._lock.locked():
-            self.logger.debug(f"Waiting for bucket {self.bucket_hash} to unlock.")
+            self.logger.debug("Waiting for bucket %s to unlock.", self.bucket_hash)
             async with self._lock:
                 pass
 
@@ -229,8 +231,11 @@ class HTTPClient(
         logger: Logger = MISSING,
         show_ratelimit_tracebacks: bool = False,
         proxy: tuple[str | None, BasicAuth | None] | None = None,
+        log_sampler: LogSampler | None = None,
+        api_url: str | None = None,
     ) -> None:
         self.connector: BaseConnector | None = connector
+        self.api_url: str = api_url or Route.BASE
         self.__session: ClientSession | None = None
         self.token: str | None = None
         self.global_lock: GlobalLock = GlobalLock()
@@ -238,6 +243,7 @@ class HTTPClient(
 
         self.ratelimit_locks: WeakValueDictionary[str, BucketLock] = WeakValueDictionary()
         self.show_ratelimit_traceback: bool = show_ratelimit_tracebacks
+        self.log_sampler: LogSampler = log_sampler or LogSampler()
         self._endpoints = {}
 
         self.user_agent: str = (
@@ -283,7 +289,7 @@ class HTTPClient(
 
         if bucket_lock.bucket_hash:
             # We only ever try and cache the bucket if the bucket hash has been set (ignores unlimited endpoints)
-            self.logger.debug(f"Caching ingested rate limit data for: {bucket_lock.bucket_hash}")
+            self.logger.debug("Caching ingested rate limit data for: %s", bucket_lock.bucket_hash)
             self._endpoints[route.rl_bucket] = bucket_lock.bucket_hash
             self.ratelimit_locks[bucket_lock.bucket_hash] = bucket_lock
 
@@ -357,7 +363,7 @@ class HTTPClient(
         form_data.add_field("payload_json", FastJson.dumps(payload))
         return form_data
 
-    async def request(  # noqa: C901
+    async def request(
         self,
         route: Route,
         payload: list | dict | None = None,
@@ -377,6 +383,19 @@ class HTTPClient(
             params: Query string parameters
 
         """
+        with tracing.span("http", method=route.method, route=route.path) as span:
+            return await self._request(span, route, payload, files, reason, params, **kwargs)
+
+    async def _request(  # noqa: C901
+        self,
+        span: "tracing.Span | tracing._NoSpan",
+        route: Route,
+        payload: list | dict | None,
+        files: list[UPLOADABLE_TYPE] | None,
+        reason: str | None,
+        params: dict | None,
+        **kwargs: dict,
+    ) -> str | dict[str, Any] | None:
         # Assemble headers
         kwargs["headers"] = {"User-Agent": self.user_agent}
         if self.token:
@@ -394,8 +413,13 @@ class HTTPClient(
         # If this endpoint has been used before, it will get an existing ratelimit for the respective buckethash
         # otherwise a brand-new bucket lock will be returned
 
+        url = self.api_url + route.resolved_path
+        # time spent waiting on rate limits, rather than on discord
+        ratelimit_wait = 0.0
         for attempt in range(self._max_attempts):
+            queued = time.perf_counter()
             async with lock:
+                ratelimit_wait += time.perf_counter() - queued
                 try:
                     if self.__session.closed:
                         await self.login(cast(str, self.token))
@@ -405,13 +429,15 @@ class HTTPClient(
                         kwargs["data"] = processed_data  # pyright: ignore
                     else:
                         kwargs["json"] = processed_data  # pyright: ignore
+                    queued = time.perf_counter()
                     await self.global_lock.wait()
+                    ratelimit_wait += time.perf_counter() - queued
 
                     if self.proxy:
                         kwargs["proxy"] = self.proxy[0]
                         kwargs["proxy_auth"] = self.proxy[1]
 
-                    async with self.__session.request(route.method, route.url, **kwargs) as response:
+                    async with self.__session.request(route.method, url, **kwargs) as response:
                         result = await response_decode(response)
                         self.ingest_ratelimit(route, response.headers, lock)
 
@@ -466,9 +492,17 @@ class HTTPClient(
                         if not 300 > response.status >= 200:
                             await self._raise_exception(response, route, result)
 
-                        self.logger.debug(
-                            f"{route.resolved_endpoint} Received {response.status} :: [{lock.remaining}/{lock.limit} calls remaining]"
-                        )
+                        if self.logger.isEnabledFor(DEBUG) and self.log_sampler.sample("http"):
+                            self.logger.debug(
+                                "%s Received %s :: [%s/%s calls remaining]",
+                                route.resolved_endpoint,
+                                response.status,
+                                lock.remaining,
+                                lock.limit,
+                            )
+                        span.set_attribute("status", response.status)
+                        span.set_attribute("attempts", attempt + 1)
+                        span.set_attribute("ratelimit_wait", ratelimit_wait)
                         return result
                 except OSError as e:
                     if attempt < self._max_attempts - 1 and e.errno in (54, 10054):
@@ -477,7 +511,7 @@ class HTTPClient(
                     raise
 
     async def _raise_exception(self, response, route, result) -> None:
-        self.logger.error(f"{route.method}::{route.url}: {response.status}")
+        self.logger.error(f"{route.method}::{self.api_url}{route.resolved_path}: {response.status}")
 
         if response.status == 403:
             raise Forbidden(response, response_data=result, route=route)
@@ -496,6 +530,8 @@ class HTTPClient(
             message: The message to log
 
         """
+        if not self.log_sampler.sample("ratelimit"):
+            return
         if self.show_ratelimit_traceback:
             if frame := next(
                 (frame for frame in inspect.stack() if constants.LIB_PATH not in frame.filename),
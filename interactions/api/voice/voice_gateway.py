@@ -212,7 +212,7 @@ class VoiceGateway(WebsocketClient):
             case _:
                 return self.logger.debug(f"Unhandled OPCODE: {op} = {data = }")
 
-    async def reconnect(self, *, resume: bool = False, code: int = 1012) -> None:
+    async def reconnect(self, *, resume: bool = False, code: int = 1012, reason: str = "unknown") -> None:
         async with self._race_lock:
             self._closed.clear()
 
@@ -240,7 +240,7 @@ class VoiceGateway(WebsocketClient):
                 self.heartbeat_interval = hello["d"]["heartbeat_interval"] / 1000
             except RuntimeError:
                 # sometimes the initial connection fails with voice gateways, handle that
-                return await self.reconnect(resume=resume, code=code)
+                return await self.reconnect(resume=resume, code=code, reason=reason)
 
             if not resume:
                 await self._identify()
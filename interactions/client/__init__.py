@@ -38,7 +38,14 @@ from .const import (
 )
 from .client import Client
 from .auto_shard_client import AutoShardedClient
+from . import cluster
+from . import coalescing
+from . import loop_monitor
+from . import resharding
 from . import smart_cache
+from . import snapshot
+from . import supervisor
+from . import tracing
 from . import errors
 from . import utils
 
@@ -81,7 +88,14 @@ __all__ = (
     "ClientT",
     "Client",
     "AutoShardedClient",
+    "cluster",
+    "coalescing",
+    "loop_monitor",
+    "resharding",
     "smart_cache",
+    "snapshot",
+    "supervisor",
+    "tracing",
     "errors",
     "utils",
 )
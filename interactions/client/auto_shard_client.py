@@ -1,14 +1,18 @@
 import asyncio
+import random
 import time
 from datetime import datetime
-from collections import defaultdict
 from typing import TYPE_CHECKING, Optional, List
 
 import interactions.api.events as events
 from interactions.api.events import ShardConnect
+from interactions.api.gateway.identify import IdentifyScheduler
 from interactions.api.gateway.state import ConnectionState
 from interactions.client.client import Client
 from interactions.client.const import MISSING
+from interactions.client.errors import BotException
+from interactions.client.resharding import Resharder
+from interactions.client.supervisor import ShardSupervisor
 from interactions.models import (
     Guild,
     to_snowflake,
@@ -29,6 +33,10 @@ class AutoShardedClient(Client):
     A client to automatically shard the bot.
 
     You can optionally specify the total number of shards to start with, or it will be determined automatically.
+
+    Shards identify as fast as discord's session start limit allows, and a shard that fails to connect is retried
+    up to `identify_retries` times without holding up the other shards. Pass a `ShardSupervisor` as
+    `shard_supervisor` to restart shards that become unhealthy while running.
     """
 
     def __init__(self, *args, **kwargs) -> None:
@@ -39,10 +47,24 @@ class AutoShardedClient(Client):
 
         self._connection_state = None
 
+        self._shard_map: dict[int, ConnectionState] = {}
         self._connection_states: list[ConnectionState] = []
 
         self.max_start_concurrency: int = 1
 
+        self.identify_retries: int = kwargs.get("identify_retries", 3)
+        """How many times to retry starting a shard that failed to connect"""
+        self.identify_scheduler: IdentifyScheduler | None = None
+        """The scheduler pacing this client's identifies"""
+        self.startup_report: dict | None = None
+        """The expected and actual time it took to start all shards, once they are ready"""
+
+        self.shard_supervisor: ShardSupervisor | None = kwargs.get("shard_supervisor", None)
+        """Watches the health of the shards, and restarts unhealthy shards"""
+
+        self._shard_tasks: dict[ConnectionState, asyncio.Task] = {}
+        self._reshard_lock = asyncio.Lock()
+
     @property
     def gateway_started(self) -> bool:
         """Returns if the gateway has been started in all shards."""
@@ -53,6 +75,53 @@ class AutoShardedClient(Client):
         """Returns a list of all shards currently in use."""
         return self._connection_states
 
+    @property
+    def _connection_states(self) -> list[ConnectionState]:
+        return self._shard_list
+
+    @_connection_states.setter
+    def _connection_states(self, states: list[ConnectionState]) -> None:
+        self._shard_list = states
+        self._shard_map = {state.shard_id: state for state in states}
+
+    def _add_connection_state(self, state: ConnectionState) -> None:
+        self._shard_list.append(state)
+        self._shard_map[state.shard_id] = state
+
+    def _index_guilds(self) -> None:
+        """Rebuild the guild index of every shard, from the guilds the bot is in."""
+        for state in self._connection_states:
+            state.guild_ids.clear()
+        for guild_id in self._user._guild_ids if self._user else ():
+            if (state := self._shard_map.get(self.get_shard_id(guild_id))) is not None:
+                state.guild_ids.add(guild_id)
+
+    def get_shard(self, shard_id: int) -> ConnectionState | None:
+        """
+        Get a shard by its ID.
+
+        Args:
+            shard_id: The ID of the shard
+
+        Returns:
+            The shard, or None if it isn't run by this client
+
+        """
+        return self._shard_map.get(shard_id)
+
+    def get_guild_shard(self, guild_id: "Snowflake_Type") -> ConnectionState | None:
+        """
+        Get the shard a guild belongs to.
+
+        Args:
+            guild_id: The ID of the guild
+
+        Returns:
+            The shard, or None if it isn't run by this client
+
+        """
+        return self._shard_map.get(self.get_shard_id(guild_id))
+
     @property
     def latency(self) -> float:
         """The average latency of all active gateways."""
@@ -72,6 +141,40 @@ class AutoShardedClient(Client):
         """
         return {state.shard_id: state.latency for state in self._connection_states}
 
+    @property
+    def dispatch_metrics(self) -> dict[int, dict | None]:
+        """
+        Return a dictionary of dispatch pipeline metrics for all shards.
+
+        Returns:
+            {shard_id: metrics}
+
+        """
+        return {state.shard_id: state.dispatch_metrics for state in self._connection_states}
+
+    @property
+    def telemetry(self) -> dict[int, dict]:
+        """
+        Return a dictionary of gateway telemetry for all shards.
+
+        Each shard's telemetry is also available as `shard.telemetry` through `shards`.
+
+        Returns:
+            {shard_id: telemetry}
+
+        """
+        return {state.shard_id: state.telemetry.to_dict() for state in self._connection_states}
+
+    def get_busiest_shard(self) -> ConnectionState | None:
+        """
+        Get the shard that received the most events in the last second.
+
+        Returns:
+            The busiest shard, or None if there are no shards
+
+        """
+        return max(self._connection_states, key=lambda state: state.telemetry.total_events_per_second, default=None)
+
     @property
     def start_time(self) -> datetime:
         """The start time of the first shard of the bot."""
@@ -82,11 +185,11 @@ class AutoShardedClient(Client):
         """The start times of all shards of the bot, keyed by each shard ID."""
         return {state.shard_id: state.start_time for state in self._connection_states}  # type: ignore
 
-    async def stop(self) -> None:
-        """Shutdown the bot."""
-        self.logger.debug("Stopping the bot.")
-        self._ready.clear()
-        await self.http.close()
+    async def _stop_connections(self) -> None:
+        """Stop the supervisor and every shard."""
+        self._closed = True
+        if self.shard_supervisor is not None:
+            self.shard_supervisor.stop()
         await asyncio.gather(*(state.stop() for state in self._connection_states))
 
     def get_guild_websocket(self, guild_id: "Snowflake_Type") -> GatewayClient:
@@ -100,8 +203,7 @@ class AutoShardedClient(Client):
             A gateway client for the given ID
 
         """
-        shard_id = (int(guild_id) >> 22) % self.total_shards
-        return next((state for state in self._connection_states if state.shard_id == shard_id), MISSING).gateway
+        return self._shard_map.get(self.get_shard_id(guild_id), MISSING).gateway
 
     def get_shards_guild(self, shard_id: int) -> list[Guild]:
         """
@@ -114,6 +216,9 @@ class AutoShardedClient(Client):
             A list of guilds
 
         """
+        if (shard := self._shard_map.get(shard_id)) is not None:
+            return [guild for guild_id in shard.guild_ids if (guild := self.cache.get_guild(guild_id)) is not None]
+        # the shard is run elsewhere, so only cached guilds are known
         return [guild for key, guild in self.cache.guild_cache.items() if ((key >> 22) % self.total_shards) == shard_id]
 
     def get_shard_id(self, guild_id: "Snowflake_Type") -> int:
@@ -129,6 +234,31 @@ class AutoShardedClient(Client):
         """
         return (int(guild_id) >> 22) % self.total_shards
 
+    @Listener.create()
+    async def on_resume(self) -> None:
+        if self._startup:
+            self._ready.set()
+            return
+
+        # this session was resumed from the session store, so this shard never received READY.
+        # noinspection PyProtectedMember
+        await asyncio.gather(*[shard._shard_ready.wait() for shard in self._connection_states])
+        # READY and GUILD_CREATE would have told us which guilds we're in, the cache is all we have
+        # noinspection PyProtectedMember
+        self._user._add_guilds(set(self.cache.guild_cache))
+        self._index_guilds()
+        if self._startup:
+            self._ready.set()
+            return
+        if not all(shard.gateway and shard.gateway.resumed_session for shard in self._connection_states):
+            # a shard identified instead, so its READY handler will start the bot
+            return
+
+        await self._run_startup_tasks()
+        await self._run_startup_once()
+        self._ready.set()
+        self.dispatch(events.Ready())
+
     @Listener.create()
     async def _on_websocket_ready(self, event: events.RawGatewayEvent) -> None:
         """
@@ -141,7 +271,9 @@ class AutoShardedClient(Client):
         connection_data = event.data
         expected_guilds = {to_snowflake(guild["id"]) for guild in connection_data["guilds"]}
         shard_id, total_shards = connection_data["shard"]
-        connection_state = next((state for state in self._connection_states if state.shard_id == shard_id), None)
+        connection_state = self._shard_map.get(shard_id)
+        if self.cache_snapshot is not None:
+            self.cache_snapshot.discard_missing_guilds(expected_guilds, shard_id, total_shards)
 
         if expected_guilds:
             while True:
@@ -155,7 +287,7 @@ class AutoShardedClient(Client):
                     # all guilds cached
                     break
 
-            if self.fetch_members:
+            if self.fetch_members and not self.chunk_in_background:
                 self.logger.info(f"Shard {shard_id} is waiting for members to be chunked")
                 await asyncio.gather(*(guild.chunked.wait() for guild in self.guilds if guild.id in expected_guilds))
         else:
@@ -171,26 +303,13 @@ class AutoShardedClient(Client):
         await asyncio.gather(*[shard._shard_ready.wait() for shard in self._connection_states])
 
         # run any pending startup tasks
-        if self.async_startup_tasks:
-            try:
-                await asyncio.gather(
-                    *[
-                        task[0](*task[1] if len(task) > 1 else [], **task[2] if len(task) == 3 else {})
-                        for task in self.async_startup_tasks
-                    ]
-                )
-            except Exception as e:
-                self.dispatch(events.Error(source="async-extension-loader", error=e))
+        await self._run_startup_tasks()
 
         # cache slash commands
-        if not self._startup:
-            await self._init_interactions()
+        await self._run_startup_once()
 
         if not self._ready.is_set():
             self._ready.set()
-            if not self._startup:
-                self._startup = True
-                self.dispatch(events.Startup())
             self.dispatch(events.Ready())
 
     async def astart(self, token: str | None = None) -> None:
@@ -204,34 +323,161 @@ class AutoShardedClient(Client):
         self.logger.debug("Starting http client...")
         await self.login(token)
 
-        tasks = []
+        if self.eager_tasks:
+            self._enable_eager_tasks()
+        if self.loop_monitor is not None:
+            self.loop_monitor.start(self)
+        if self.cache_snapshot is not None:
+            self.cache_snapshot.load()
+            self._index_guilds()
+            self.cache_snapshot.start()
+
+        self._closed = False
+        self.identify_scheduler = IdentifyScheduler(self.max_start_concurrency)
+        if self.identify_gate is None:
+            self.identify_gate = self.identify_scheduler.acquire
+
+        # every shard is started at once, the scheduler decides when each of them may identify
+        start = time.perf_counter()
+        self._start_shards(self._connection_states)
+        _ = asyncio.create_task(self._report_startup(start))  # noqa: RUF006
+        if self.shard_supervisor is not None:
+            self.shard_supervisor.start(self)
 
-        # Sort shards into their respective ratelimit buckets
-        shard_buckets = defaultdict(list)
-        for shard in self._connection_states:
-            bucket = str(shard.shard_id % self.max_start_concurrency)
-            shard_buckets[bucket].append(shard)
+        try:
+            # shards may be added or restarted while running, and the supervisor keeps the bot alive to restart them
+            while True:
+                tasks = set(self._shard_tasks.values())
+                if self.shard_supervisor is not None and self.shard_supervisor.running:
+                    # noinspection PyProtectedMember
+                    tasks.add(self.shard_supervisor._task)
+                if not tasks:
+                    break
 
-        for bucket in shard_buckets.values():
-            for shard in bucket:
-                self.logger.debug(f"Starting {shard.shard_id}")
-                start = time.perf_counter()
-                tasks.append(asyncio.create_task(shard.start()))
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for shard, task in list(self._shard_tasks.items()):
+                    if task in done:
+                        del self._shard_tasks[shard]
+                for task in done:
+                    if not task.cancelled() and (exc := task.exception()) is not None:
+                        raise exc
+        finally:
+            await self.stop()
 
-                if self.max_start_concurrency == 1:
-                    # connection ratelimiting when discord has asked for one connection concurrently
-                    # noinspection PyProtectedMember
-                    await shard._shard_ready.wait()
-                    await asyncio.sleep(5.1 - (time.perf_counter() - start))
+    def _start_shards(self, shards: list[ConnectionState]) -> None:
+        """Start the given shards in the background."""
+        for shard in shards:
+            self._shard_tasks[shard] = asyncio.create_task(
+                self._start_shard(shard), name=f"interactions:: shard {shard.shard_id}"
+            )
 
-            # wait for shards to finish starting
+    def restart_shard(self, shard_id: int, *, delay: float = 0) -> None:
+        """
+        Restart a shard with a new session, without interrupting the other shards.
+
+        Args:
+            shard_id: The ID of the shard to restart
+            delay: How long to wait before reconnecting (seconds)
+
+        """
+        shard = self._shard_map.get(shard_id)
+        if shard is None:
+            raise ValueError(f"Shard {shard_id} is not running on this client")
+
+        previous = self._shard_tasks.get(shard)
+        self._shard_tasks[shard] = asyncio.create_task(
+            self._restart_shard(shard, previous, delay), name=f"interactions:: shard {shard_id}"
+        )
+
+    async def _restart_shard(self, shard: ConnectionState, previous: asyncio.Task | None, delay: float) -> None:
+        """Stop a shard, then start it again after a delay."""
+        await shard.stop(save_session=False)
+        if previous is not None:
+            # stop the previous task from retrying the connection
+            previous.cancel()
+        await asyncio.sleep(delay)
+        if not self._closed:
+            await self._start_shard(shard)
+
+    async def reshard(self, total_shards: int | None = None, *, overlap: float = 5, timeout: float = 600) -> None:
+        """
+        Change the number of shards without going offline.
+
+        The new shards connect alongside the current ones, and the client switches over once they have received all
+        of their guilds. Dispatches are never dropped, and duplicates received while both sets of shards are
+        connected are suppressed.
+
+        ??? Hint "Example Usage:"
+            ```python
+            @Task.create(IntervalTrigger(hours=12))
+            async def check_shards():
+                await bot.reshard()
+            ```
+
+        Args:
+            total_shards: The new number of shards, defaults to the number discord recommends
+            overlap: How long both sets of shards deliver dispatches for (seconds)
+            timeout: How long to wait for the new shards to be ready before aborting (seconds)
+
+        Raises:
+            asyncio.TimeoutError: If the new shards weren't ready in time, the current shards are left running
+
+        """
+        if self.shard_ids:
+            raise BotException("Resharding is not supported when running a subset of shards")
+
+        async with self._reshard_lock:
+            if total_shards is None:
+                total_shards = (await self.http.get_gateway_bot())["shards"]
+            if total_shards == self.total_shards:
+                self.logger.debug(f"Already running {total_shards} shards, not resharding")
+                return
+
+            await Resharder(self, total_shards, overlap=overlap, timeout=timeout).run()
+
+    async def _start_shard(self, shard: ConnectionState) -> None:
+        """Start a shard, retrying if it fails to connect."""
+        attempt = 0
+        while True:
             # noinspection PyProtectedMember
-            await asyncio.gather(*[shard._shard_ready.wait() for shard in self._connection_states])
+            ready = asyncio.create_task(shard._shard_ready.wait())
+            try:
+                await shard.start()
+            finally:
+                connected = ready.done()
+                ready.cancel()
+
+            if connected or self._closed:
+                return
+            if attempt >= self.identify_retries:
+                self.logger.error(f"Shard {shard.shard_id} failed to connect after {attempt + 1} attempts")
+                return
+
+            attempt += 1
+            delay = min(2**attempt, 60) * random.uniform(0.5, 1)
+            self.logger.warning(f"Shard {shard.shard_id} failed to connect, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _report_startup(self, start: float) -> None:
+        """Log the expected and actual startup time once every shard is ready."""
+        shard_ids = [shard.shard_id for shard in self._connection_states]
+        expected = self.identify_scheduler.expected_duration(shard_ids)
 
-        try:
-            await asyncio.gather(*tasks)
-        finally:
-            await self.stop()
+        # noinspection PyProtectedMember
+        await asyncio.gather(*[shard._shard_ready.wait() for shard in self._connection_states])
+
+        self.startup_report = {
+            "shards": len(shard_ids),
+            "max_concurrency": self.identify_scheduler.max_concurrency,
+            "expected_identify_time": expected,
+            "actual_identify_time": self.identify_scheduler.actual_duration,
+            "ready_time": time.perf_counter() - start,
+        }
+        self.logger.info(
+            f"All {len(shard_ids)} shards are ready after {self.startup_report['ready_time']:.1f}s. "
+            f"Identifying took {self.startup_report['actual_identify_time']:.1f}s, "
+            f"expected {expected:.1f}s with a max concurrency of {self.identify_scheduler.max_concurrency}"
+        )
 
     async def login(self, token: str | None = None) -> None:
         """
@@ -287,4 +533,4 @@ class AutoShardedClient(Client):
         if shard_id is None:
             await asyncio.gather(*[shard.change_presence(status, activity) for shard in self._connection_states])
         else:
-            await self._connection_states[shard_id].change_presence(status, activity)
+            await self._shard_map[shard_id].change_presence(status, activity)
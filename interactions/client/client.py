@@ -19,7 +19,9 @@ from typing import (
     Callable,
     Coroutine,
     Dict,
+    Hashable,
     List,
+    Literal,
     NoReturn,
     Optional,
     Sequence,
@@ -36,11 +38,12 @@ from aiohttp import BasicAuth
 import interactions.api.events as events
 import interactions.client.const as constants
 from interactions.api.events import BaseEvent, RawGatewayEvent, processors
+from interactions.api.events.base import _dispatch_payload
 from interactions.api.events.internal import CallbackAdded
 from interactions.api.gateway.gateway import GatewayClient
 from interactions.api.gateway.state import ConnectionState
 from interactions.api.http.http_client import HTTPClient
-from interactions.client import errors
+from interactions.client import errors, tracing
 from interactions.client.const import (
     GLOBAL_SCOPE,
     Missing,
@@ -59,8 +62,10 @@ from interactions.client.errors import (
     HTTPException,
     NotFound,
 )
+from interactions.client.loop_monitor import LoopMonitor
 from interactions.client.smart_cache import GlobalCache
-from interactions.client.utils import NullCache, FastJson
+from interactions.client.snapshot import CacheSnapshot
+from interactions.client.utils import NullCache, FastJson, LogSampler
 from interactions.client.utils.misc_utils import get_event_name, wrap_partial
 from interactions.client.utils.serializer import to_image_data
 from interactions.models import (
@@ -120,10 +125,18 @@ from interactions.models.internal.context import (
     AutocompleteContext,
     ContextMenuContext,
 )
-from interactions.models.internal.listener import Listener
+from interactions.models.internal.listener import FilteredListeners, Listener
 from interactions.models.internal.tasks import Task
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from interactions.api.gateway.recorder import GatewayRecorder
+    from interactions.api.gateway.session import SessionStore
+    from interactions.client.cluster import ClusterClient
+    from interactions.client.coalescing import EventCoalescer
+    from interactions.client.tracing import Tracer
     from interactions.models import Snowflake_Type, TYPE_ALL_CHANNEL
 
 EventT = TypeVar("EventT", bound=BaseEvent)
@@ -222,6 +235,24 @@ _INTENT_EVENTS: dict[BaseEvent, list[Intents]] = {
 }
 
 
+def _discard(waits: list, wait: Wait) -> None:
+    with contextlib.suppress(ValueError):
+        waits.remove(wait)
+
+
+def _voice_wait_keys(event: RawGatewayEvent) -> tuple:
+    return (int(guild_id),) if (guild_id := event.data.get("guild_id")) else ()
+
+
+_WAIT_KEYS: dict[str, Callable[[BaseEvent], tuple[Hashable, ...]]] = {
+    "message_create": lambda event: (event.message.id,),
+    "component": lambda event: (event.ctx.message.id if event.ctx.message else None, event.ctx.custom_id),
+    "modal_completion": lambda event: (event.ctx.custom_id,),
+    "raw_voice_state_update": _voice_wait_keys,
+    "raw_voice_server_update": _voice_wait_keys,
+}
+
+
 class Client(
     processors.AutoModEvents,
     processors.ChannelEvents,
@@ -252,6 +283,10 @@ class Client(
         delete_unused_application_cmds: Delete any commands from discord that aren't implemented in this client
         enforce_interaction_perms: Enforce discord application command permissions, locally
         fetch_members: Should the client fetch members from guilds upon startup (this will delay the client being ready)
+        chunk_in_background: With `fetch_members`, chunk guilds over the gateway in the background instead of delaying the client being ready
+        chunk_priority: With `chunk_in_background`, chunk the largest guilds first (`size`) or those with the most events (`activity`)
+        chunk_filter: With `chunk_in_background`, only chunk guilds this returns True for
+        chunk_on_demand: With `chunk_in_background`, only chunk a guild once an event is received for it
         send_command_tracebacks: Automatically send uncaught tracebacks if a command throws an exception
         send_not_ready_messages: Send a message to the user if they try to use a command before the client is ready
 
@@ -263,12 +298,30 @@ class Client(
 
         total_shards: The total number of shards in use
         shard_id: The zero based int ID of this shard
+        dispatch_workers: The number of workers each shard uses to process gateway events. Events for the same guild are processed in order, and the websocket is throttled once the queue is full. `0` processes every event in its own task
+        dispatch_queue_size: The maximum number of gateway events each shard may have queued when `dispatch_workers` is set
+        batch_listeners: Run all listeners of an event in a single task, one after another, rather than a task per listener
+        eager_tasks: Start running new tasks immediately, so listeners and processors that finish without suspending never wait for the event loop. Requires Python 3.12 or newer
+        event_coalescer: Coalesces bursts of high frequency events, such as presence updates, so listeners only receive the newest event per key in each time window
+        session_store: A store used to persist gateway sessions on shutdown, so they can be resumed when the bot restarts. Only used if the cache is warm when the bot starts, unless `resume_without_cache` is set
+        resume_without_cache: Resume persisted gateway sessions even if the cache is empty
+        cache_snapshot_path: A file to save the cache to when the bot stops, which is restored when the bot next starts
+        cache_snapshot_interval: How often to save the cache snapshot while the bot is running (seconds)
+        gateway_offload_threshold: Gateway payloads at least this large (bytes, before decompression) are decompressed in a worker thread, so large guilds don't block the event loop. By default payloads are always processed inline
+        gateway_parse_executor: An executor to parse payloads above `gateway_offload_threshold` in, ie a `ProcessPoolExecutor` for parse-heavy workloads. By default they're parsed inline, as parsing holds the GIL
+        gateway_recorder: A recorder to write every gateway dispatch to, which can be replayed with `GatewayReplayer`
+        gateway_url: Connect to this gateway instead of the one returned by discord, ie a local `FakeDiscord` server
+        api_url: Send REST requests to this url instead of discord's api, ie a local `FakeDiscord` server
+        tracer: Traces each gateway dispatch through its processor, interaction callbacks and REST requests, see `interactions.client.tracing`
+        guild_hydration_budget: How long to spend caching a guild's channels, roles and members from GUILD_CREATE before yielding to the event loop (seconds). `None` caches each guild in one go
 
         debug_scope: Force all application commands to be registered within this scope
         disable_dm_commands: Should interaction commands be disabled in DMs?
         basic_logging: Utilise basic logging to output library data to console. Do not use in combination with `Client.logger`
         logging_level: The level of logging to use for basic_logging. Do not use in combination with `Client.logger`
         logger: The logger interactions.py should use. Do not use in combination with `Client.basic_logging` and `Client.logging_level`. Note: Different loggers with multiple clients are not supported
+        log_sampling: Only log 1 in N of the library's high volume messages, by category, ie `{"ratelimit": 10}`. See `LogSampler` for the categories
+        loop_monitor: Watches the event loop's lag, callbacks that block it and the number of pending tasks. `True` uses the default limits
 
         proxy: A http/https proxy to use for all requests
         proxy_auth: The auth to use for the proxy - must be either a tuple of (username, password) or aiohttp.BasicAuth
@@ -290,22 +343,41 @@ class Client(
         self,
         *,
         activity: Union[Activity, str] = None,
+        api_url: str | None = None,
         auto_defer: Absent[Union[AutoDefer, bool]] = MISSING,
         autocomplete_context: Type[BaseContext] = AutocompleteContext,
         basic_logging: bool = False,
+        batch_listeners: bool = False,
+        cache_snapshot_interval: float | None = None,
+        cache_snapshot_path: "str | Path | None" = None,
+        chunk_filter: "Callable[[Guild], bool] | None" = None,
+        chunk_in_background: bool = False,
+        chunk_on_demand: bool = False,
+        chunk_priority: Literal["size", "activity"] = "size",
         component_context: Type[BaseContext] = ComponentContext,
         context_menu_context: Type[BaseContext] = ContextMenuContext,
         debug_scope: Absent["Snowflake_Type"] = MISSING,
         delete_unused_application_cmds: bool = False,
         disable_dm_commands: bool = False,
+        dispatch_queue_size: int = 10_000,
+        dispatch_workers: int = 0,
+        eager_tasks: bool = False,
         enforce_interaction_perms: bool = True,
+        event_coalescer: "EventCoalescer | None" = None,
         fetch_members: bool = False,
+        gateway_offload_threshold: int | None = None,
+        gateway_parse_executor: "Executor | None" = None,
+        gateway_recorder: "GatewayRecorder | None" = None,
+        gateway_url: str | None = None,
         global_post_run_callback: Absent[Callable[..., Coroutine]] = MISSING,
         global_pre_run_callback: Absent[Callable[..., Coroutine]] = MISSING,
+        guild_hydration_budget: float | None = 0.005,
         intents: Union[int, Intents] = Intents.DEFAULT,
         interaction_context: Type[InteractionContext] = InteractionContext,
+        log_sampling: dict[str, int] | None = None,
         logger: logging.Logger = MISSING,
         logging_level: int = logging.INFO,
+        loop_monitor: "LoopMonitor | bool" = False,
         modal_context: Type[BaseContext] = ModalContext,
         owner_ids: Iterable["Snowflake_Type"] = (),
         send_command_tracebacks: bool = True,
@@ -318,8 +390,11 @@ class Client(
         sync_interactions: bool = True,
         proxy_url: str | None = None,
         proxy_auth: BasicAuth | tuple[str, str] | None = None,
+        resume_without_cache: bool = False,
+        session_store: "SessionStore | None" = None,
         token: str | None = None,
         total_shards: int = 1,
+        tracer: "Tracer | None" = None,
         **kwargs,
     ) -> None:
         if logger is MISSING:
@@ -335,6 +410,8 @@ class Client(
         !!! note
             Different loggers with multiple clients are not supported"""
         constants._logger = logger
+        self.log_sampler: LogSampler = LogSampler(log_sampling)
+        """Samples the library's high volume log messages"""
 
         # Configuration
         self.sync_interactions: bool = sync_interactions
@@ -363,7 +440,11 @@ class Client(
 
         proxy = (proxy_url, proxy_auth) if proxy_url or proxy_auth else None
         self.http: HTTPClient = HTTPClient(
-            logger=self.logger, show_ratelimit_tracebacks=show_ratelimit_tracebacks, proxy=proxy
+            logger=self.logger,
+            show_ratelimit_tracebacks=show_ratelimit_tracebacks,
+            proxy=proxy,
+            log_sampler=self.log_sampler,
+            api_url=api_url,
         )
         """The HTTP client to use when interacting with discord endpoints"""
 
@@ -393,6 +474,43 @@ class Client(
         self.guild_event_timeout = 3
         """How long to wait for guilds to be cached"""
 
+        self.dispatch_workers: int = dispatch_workers
+        """The number of workers each shard uses to process gateway events, `0` disables the dispatch pipeline"""
+        self.dispatch_queue_size: int = dispatch_queue_size
+        """The maximum number of gateway events each shard may have queued"""
+        self.batch_listeners: bool = batch_listeners
+        """Run all listeners of an event in a single task, rather than a task per listener"""
+        self.eager_tasks: bool = eager_tasks
+        """Start running new tasks immediately, rather than on the next iteration of the event loop"""
+        self.event_coalescer: "EventCoalescer | None" = event_coalescer
+        """Coalesces bursts of high frequency events, if enabled"""
+        if event_coalescer is not None:
+            event_coalescer.client = self
+        self.session_store: "SessionStore | None" = session_store
+        """The store used to persist gateway sessions between restarts"""
+        self.resume_without_cache: bool = resume_without_cache
+        """Resume persisted gateway sessions even if the cache is empty"""
+        self.identify_gate: Callable[[int], Awaitable[None]] | None = None
+        """Awaited with a shard's ID before it identifies, used to coordinate identify rate limits between processes"""
+        self.cluster: "ClusterClient | None" = None
+        """The connection to the cluster supervisor, if this client is running in a cluster"""
+        self.gateway_recorder: "GatewayRecorder | None" = gateway_recorder
+        """The recorder gateway dispatches are written to, if enabled"""
+        self.gateway_url: str | None = gateway_url
+        """The gateway to connect to instead of the one returned by discord"""
+        self.gateway_offload_threshold: int | None = gateway_offload_threshold
+        """The size (bytes) above which gateway payloads are decompressed off the event loop"""
+        self.gateway_parse_executor: "Executor | None" = gateway_parse_executor
+        """The executor large gateway payloads are parsed in, if not inline"""
+        self.guild_hydration_budget: float | None = guild_hydration_budget
+        """How long to spend caching a guild's objects before yielding to the event loop (seconds)"""
+        self.tracer: "Tracer | None" = tracer
+        """Traces the handling of gateway dispatches, if enabled"""
+        if loop_monitor is True:
+            loop_monitor = LoopMonitor()
+        self.loop_monitor: LoopMonitor | None = loop_monitor or None
+        """Watches the health of the event loop, if enabled"""
+
         # Sharding
         self.total_shards = total_shards
         self._connection_state: ConnectionState = ConnectionState(self, intents, shard_id=shard_id)
@@ -401,11 +519,23 @@ class Client(
 
         self.fetch_members = fetch_members
         """Fetch the full members list of all guilds on startup"""
+        self.chunk_in_background: bool = chunk_in_background
+        """Chunk guilds over the gateway in the background, rather than delaying ready"""
+        self.chunk_priority: Literal["size", "activity"] = chunk_priority
+        """The order guilds are chunked in the background"""
+        self.chunk_filter: "Callable[[Guild], bool] | None" = chunk_filter
+        """Only guilds this returns True for are chunked in the background"""
+        self.chunk_on_demand: bool = chunk_on_demand
+        """Only chunk a guild in the background once an event is received for it"""
 
         self._mention_reg = MISSING
 
         # caches
         self.cache: GlobalCache = GlobalCache(self, **{k: v for k, v in kwargs.items() if hasattr(GlobalCache, k)})
+        self.cache_snapshot: CacheSnapshot | None = (
+            CacheSnapshot(self, cache_snapshot_path, interval=cache_snapshot_interval) if cache_snapshot_path else None
+        )
+        """Saves and restores the cache between restarts, if enabled"""
         # these store the last sent presence data for change_presence
         self._status: Status = status
         if isinstance(activity, str):
@@ -431,11 +561,16 @@ class Client(
         self._regex_modal_callbacks: Dict[re.Pattern, Callable[..., Coroutine]] = {}
         self._global_autocompletes: Dict[str, GlobalAutoComplete] = {}
         self.processors: Dict[str, Callable[..., Coroutine]] = {}
+        self._processor_products: dict[str, tuple[str, ...]] = {}
         self.__modules = {}
         self.ext: Dict[str, Extension] = {}
         """A dictionary of mounted ext"""
         self.listeners: Dict[str, list[Listener]] = {}
+        self._filtered_listeners: dict[str, FilteredListeners] = {}
         self.waits: Dict[str, List] = {}
+        self.wait_keys: dict[str, Callable[[BaseEvent], tuple[Hashable, ...]]] = dict(_WAIT_KEYS)
+        """Gets the keys of an event for `wait_for(key=...)`, by event name"""
+        self._keyed_waits: dict[str, dict[Hashable, list[Wait]]] = {}
         self.owner_ids: set[Snowflake_Type] = set(owner_ids)
 
         self.async_startup_tasks: list[tuple[Callable[..., Coroutine], Iterable[Any], dict[str, Any]]] = []
@@ -566,6 +701,19 @@ class Client(
     def get_guild_websocket(self, id: "Snowflake_Type") -> GatewayClient:
         return self.ws
 
+    def get_guild_shard(self, guild_id: "Snowflake_Type") -> ConnectionState:
+        """
+        Get the shard a guild belongs to.
+
+        Args:
+            guild_id: The ID of the guild
+
+        Returns:
+            The bot's connection state, as it only has one shard
+
+        """
+        return self._connection_state
+
     def _sanity_check(self) -> None:
         """Checks for possible and common errors in the bot's configuration."""
         self.logger.debug("Running client sanity checks...")
@@ -591,7 +739,7 @@ class Client(
 
         if self.fetch_members and Intents.GUILD_MEMBERS not in self._connection_state.intents:
             raise BotException("Members Intent must be enabled in order to use fetch members")
-        if self.fetch_members:
+        if self.fetch_members and not self.chunk_in_background:
             self.logger.warning("fetch_members enabled; startup will be delayed")
 
         if len(self.processors) == 0:
@@ -607,44 +755,63 @@ class Client(
             if isinstance(_cache_obj, NullCache):
                 self.logger.warning(f"{cache} has been disabled")
 
-    def _queue_task(self, coro: Listener, event: BaseEvent, *args, **kwargs) -> asyncio.Task:
-        async def _async_wrap(_coro: Listener, _event: BaseEvent, *_args, **_kwargs) -> None:
-            try:
-                if (
-                    not isinstance(_event, (events.Error, events.RawGatewayEvent))
-                    and coro.delay_until_ready
-                    and not self.is_ready
-                ):
-                    await self.wait_until_ready()
+    async def _run_listener(self, listener: Listener, event: BaseEvent, *args, **kwargs) -> None:
+        # the task inherited the payload of the dispatch, which must not leak into events the listener dispatches
+        _dispatch_payload.set(None)
+        try:
+            if (
+                listener.delay_until_ready
+                and not self.is_ready
+                and not isinstance(event, (events.Error, events.RawGatewayEvent))
+            ):
+                await self.wait_until_ready()
+
+            # don't pass event object if listener doesn't expect it
+            if listener.pass_event_object:
+                await listener(event, *args, **kwargs)
+            else:
+                if not listener.warned_no_event_arg and len(event.__attrs_attrs__) > 2 and listener.event != "event":
+                    self.logger.warning(
+                        f"{listener} is listening to {listener.event} event which contains event data. "
+                        f"Add an event argument to this listener to receive the event data object."
+                    )
+                    listener.warned_no_event_arg = True
+                await listener()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self._handle_listener_error(event, e)
 
-                # don't pass event object if listener doesn't expect it
-                if _coro.pass_event_object:
-                    await _coro(_event, *_args, **_kwargs)
-                else:
-                    if not _coro.warned_no_event_arg and len(_event.__attrs_attrs__) > 2 and _coro.event != "event":
-                        self.logger.warning(
-                            f"{_coro} is listening to {_coro.event} event which contains event data. "
-                            f"Add an event argument to this listener to receive the event data object."
-                        )
-                        _coro.warned_no_event_arg = True
-                    await _coro()
-            except asyncio.CancelledError:
-                pass
-            except Exception as e:
-                if isinstance(event, events.Error):
-                    # No infinite loops please
-                    self.default_error_handler(repr(event), e)
-                else:
-                    self.dispatch(events.Error(source=repr(event), error=e))
+    async def _run_listeners(self, listeners: list[Listener], event: BaseEvent, *args, **kwargs) -> None:
+        _dispatch_payload.set(None)
+        for listener in listeners:
+            await self._run_listener(listener, event, *args, **kwargs)
+
+    def _run_inline(self, listener: Listener, event: BaseEvent, *args, **kwargs) -> None:
+        try:
+            if listener.pass_event_object:
+                listener.call_inline(event, *args, **kwargs)
+            else:
+                listener.call_inline()
+        except Exception as e:
+            self._handle_listener_error(event, e)
 
+    def _handle_listener_error(self, event: BaseEvent, error: Exception) -> None:
+        if isinstance(event, events.Error):
+            # No infinite loops please
+            self.default_error_handler(repr(event), error)
+        else:
+            self.dispatch(events.Error(source=repr(event), error=error))
+
+    def _queue_task(self, coro: Listener, event: BaseEvent, *args, **kwargs) -> asyncio.Task:
         try:
             asyncio.get_running_loop()
             return asyncio.create_task(
-                _async_wrap(coro, event, *args, **kwargs), name=f"interactions:: {event.resolved_name}"
+                self._run_listener(coro, event, *args, **kwargs), name=f"interactions:: {event.resolved_name}"
             )
         except RuntimeError:
             self.logger.debug("Event loop is closed; queuing task for execution on startup")
-            self.async_startup_tasks.append((_async_wrap, (coro, event, *args), kwargs))
+            self.async_startup_tasks.append((self._run_listener, (coro, event, *args), kwargs))
 
     @staticmethod
     def default_error_handler(source: str, error: BaseException) -> None:
@@ -851,6 +1018,14 @@ class Client(
 
     @Listener.create()
     async def on_resume(self) -> None:
+        if not self._startup:
+            # this session was resumed from the session store, so we never received READY
+            # READY would have told us which guilds we're in, the cache is all we have
+            self._user._add_guilds(set(self.cache.guild_cache))
+            await self._run_startup_once()
+            self._ready.set()
+            self.dispatch(events.Ready())
+            return
         self._ready.set()
 
     @Listener.create(is_default_listener=True)
@@ -865,6 +1040,8 @@ class Client(
         data = event.data
         expected_guilds = {to_snowflake(guild["id"]) for guild in data["guilds"]}
         self._user._add_guilds(expected_guilds)
+        if self.cache_snapshot is not None:
+            self.cache_snapshot.discard_missing_guilds(expected_guilds)
 
         if not self._startup:
             while len(self.guilds) != len(expected_guilds):
@@ -878,7 +1055,7 @@ class Client(
                     break
                 self._guild_event.clear()
 
-            if self.fetch_members:
+            if self.fetch_members and not self.chunk_in_background:
                 # ensure all guilds have completed chunking
                 for guild in self.guilds:
                     if guild and not guild.chunked.is_set():
@@ -886,11 +1063,7 @@ class Client(
                         await guild.chunked.wait()
 
             # cache slash commands
-            if not self._startup:
-                await self._init_interactions()
-
-            self._startup = True
-            self.dispatch(events.Startup())
+            await self._run_startup_once()
 
         else:
             # reconnect ready
@@ -909,7 +1082,7 @@ class Client(
                     break
                 self._guild_event.clear()
 
-            self.listeners["raw_guild_create"].remove(listener)
+            self.remove_listener(listener)
 
         self._ready.set()
         self.dispatch(events.Ready())
@@ -963,7 +1136,23 @@ class Client(
         """
         await self.login(token)
 
+        if self.eager_tasks:
+            self._enable_eager_tasks()
+        if self.loop_monitor is not None:
+            self.loop_monitor.start(self)
+        if self.cache_snapshot is not None:
+            self.cache_snapshot.load()
+            self.cache_snapshot.start()
+
         # run any pending startup tasks
+        await self._run_startup_tasks()
+        try:
+            await self._connection_state.start()
+        finally:
+            await self.stop()
+
+    async def _run_startup_tasks(self) -> None:
+        """Run the tasks that were queued before the event loop was running."""
         if self.async_startup_tasks:
             try:
                 await asyncio.gather(
@@ -974,16 +1163,28 @@ class Client(
                 )
             except Exception as e:
                 self.dispatch(events.Error(source="async-extension-loader", error=e))
-        try:
-            await self._connection_state.start()
-        finally:
-            await self.stop()
+
+    async def _run_startup_once(self) -> None:
+        """Cache the application commands and dispatch `Startup`, unless the bot has already started."""
+        if self._startup:
+            return
+        self._startup = True
+        await self._init_interactions()
+        self.dispatch(events.Startup())
+
+    def _enable_eager_tasks(self) -> None:
+        """Make the running event loop start new tasks eagerly."""
+        if sys.version_info < (3, 12):
+            self.logger.warning("Eager tasks require Python 3.12 or newer, tasks will be scheduled as usual")
+            return
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        self.logger.info("Eager tasks enabled")
 
     def start(self, token: str | None = None) -> None:
         """
         Start the bot.
 
-        If `uvloop` is installed, it will be used.
+        If `uvloop` is installed, it will be used. For the fastest event loop, install `uvloop` and set `eager_tasks`.
 
         info:
             This is the recommended method to start the bot
@@ -1018,19 +1219,42 @@ class Client(
         """Shutdown the bot."""
         self.logger.debug("Stopping the bot.")
         self._ready.clear()
-        await self.http.close()
+        # the gateway drains its pipeline when stopping, and the drained handlers may still make requests
+        await self._stop_connections()
+        await self._teardown()
+
+    async def _stop_connections(self) -> None:
+        """Stop the bot's gateway connections."""
         await self._connection_state.stop()
 
+    async def _teardown(self) -> None:
+        """Stop everything else the bot runs, once its gateway connections have stopped."""
+        if self.event_coalescer is not None:
+            self.event_coalescer.stop()
+        if self.loop_monitor is not None:
+            self.loop_monitor.stop()
+        if self.cache_snapshot is not None:
+            await self.cache_snapshot.stop()
+        if self.gateway_recorder is not None:
+            self.gateway_recorder.close()
+        await self.http.close()
+
     async def _process_waits(self, event: events.BaseEvent) -> None:
-        if _waits := self.waits.get(event.resolved_name, []):
-            index_to_remove = []
-            for i, _wait in enumerate(_waits):
-                result = await _wait(event)
-                if result:
-                    index_to_remove.append(i)
+        name = event.resolved_name
+        if keyed := self._keyed_waits.get(name):
+            try:
+                keys = self.wait_keys[name](event)
+            except Exception as e:
+                self.logger.error(f"Failed to get the wait keys of {name}: {e!r}")
+                keys = ()
+            for key in keys:
+                if bucket := keyed.get(key):
+                    for _wait in list(bucket):
+                        await _wait(event)
 
-            for idx in sorted(index_to_remove, reverse=True):
-                _waits.pop(idx)
+        if _waits := self.waits.get(name):
+            for _wait in list(_waits):
+                await _wait(event)
 
     def dispatch(self, event: events.BaseEvent, *args, **kwargs) -> None:
         """
@@ -1040,17 +1264,57 @@ class Client(
             event: The event to be dispatched.
 
         """
-        if listeners := self.listeners.get(event.resolved_name, []):
-            self.logger.debug(f"Dispatching Event: {event.resolved_name}")
+        name = event.resolved_name
+        if (coalescer := self.event_coalescer) is not None and name in coalescer.windows:
+            if coalescer.coalesce(event, args, kwargs):
+                return
+
+        if listeners := self._get_dispatch_listeners(name, event):
+            if self.logger.isEnabledFor(logging.DEBUG) and self.log_sampler.sample("dispatch"):
+                self.logger.debug("Dispatching Event: %s", name)
             event.bot = self
-            for _listen in listeners:
-                try:
+            self._queue_listeners(listeners, event, *args, **kwargs)
+
+        if self.waits.get(name) or self._keyed_waits.get(name):
+            self._queue_waits(event)
+
+        if "event" in self.listeners:
+            # special meta event listener
+            for _listen in self.listeners["event"]:
+                self._queue_task(_listen, event, *args, **kwargs)
+
+    def _get_dispatch_listeners(self, name: str, event: BaseEvent) -> list[Listener] | None:
+        """Get the listeners of an event, including the filtered listeners that match its payload."""
+        listeners = self.listeners.get(name)
+        if filtered := self._filtered_listeners.get(name):
+            payload = _dispatch_payload.get()
+            if payload is None and isinstance(event, RawGatewayEvent):
+                payload = event.data
+            if payload is not None and (matched := filtered.match(payload)):
+                listeners = [*listeners, *matched] if listeners else matched
+        return listeners
+
+    def _queue_listeners(self, listeners: list[Listener], event: BaseEvent, *args, **kwargs) -> None:
+        """Run the inline listeners of an event, and queue the rest as tasks, or a single task if batching."""
+        batch = [] if self.batch_listeners else None
+        for _listen in listeners:
+            try:
+                if _listen.inline:
+                    self._run_inline(_listen, event, *args, **kwargs)
+                elif batch is not None:
+                    batch.append(_listen)
+                else:
                     self._queue_task(_listen, event, *args, **kwargs)
-                except Exception as e:
-                    raise BotException(
-                        f"An error occurred attempting during {event.resolved_name} event processing"
-                    ) from e
+            except Exception as e:
+                raise BotException(f"An error occurred attempting during {event.resolved_name} event processing") from e
 
+        if batch:
+            if len(batch) == 1:
+                self._queue_task(batch[0], event, *args, **kwargs)
+            else:
+                self._queue_batch(batch, event, *args, **kwargs)
+
+    def _queue_waits(self, event: BaseEvent) -> None:
         try:
             asyncio.get_running_loop()
             _ = asyncio.create_task(self._process_waits(event))  # noqa: RUF006
@@ -1058,10 +1322,15 @@ class Client(
             # dispatch attempt before event loop is running
             self.async_startup_tasks.append((self._process_waits, (event,), {}))
 
-        if "event" in self.listeners:
-            # special meta event listener
-            for _listen in self.listeners["event"]:
-                self._queue_task(_listen, event, *args, **kwargs)
+    def _queue_batch(self, listeners: list[Listener], event: BaseEvent, *args, **kwargs) -> None:
+        try:
+            asyncio.get_running_loop()
+            _ = asyncio.create_task(  # noqa: RUF006
+                self._run_listeners(listeners, event, *args, **kwargs), name=f"interactions:: {event.resolved_name}"
+            )
+        except RuntimeError:
+            self.logger.debug("Event loop is closed; queuing task for execution on startup")
+            self.async_startup_tasks.append((self._run_listeners, (listeners, event, *args), kwargs))
 
     async def wait_until_ready(self) -> None:
         """Waits for the client to become ready."""
@@ -1073,6 +1342,8 @@ class Client(
         event: type[EventT],
         checks: Absent[Callable[[EventT], bool] | Callable[[EventT], Awaitable[bool]]] = MISSING,
         timeout: Optional[float] = None,
+        *,
+        key: Absent[Hashable] = MISSING,
     ) -> "Awaitable[EventT]": ...
 
     @overload
@@ -1081,6 +1352,8 @@ class Client(
         event: str,
         checks: Callable[[EventT], bool] | Callable[[EventT], Awaitable[bool]],
         timeout: Optional[float] = None,
+        *,
+        key: Absent[Hashable] = MISSING,
     ) -> "Awaitable[EventT]": ...
 
     @overload
@@ -1089,6 +1362,8 @@ class Client(
         event: str,
         checks: Missing = MISSING,
         timeout: Optional[float] = None,
+        *,
+        key: Absent[Hashable] = MISSING,
     ) -> Awaitable[Any]: ...
 
     def wait_for(
@@ -1096,29 +1371,58 @@ class Client(
         event: Union[str, "type[BaseEvent]"],
         checks: Absent[Callable[[BaseEvent], bool] | Callable[[BaseEvent], Awaitable[bool]]] = MISSING,
         timeout: Optional[float] = None,
+        *,
+        key: Absent[Hashable] = MISSING,
     ) -> Awaitable[Any]:
         """
         Waits for a WebSocket event to be dispatched.
 
+        Waiting for a key is much cheaper than a predicate when many waits are pending, as the event is only checked
+        against the waits for its keys. The keys of each event are taken from `wait_keys`, ie the message ID for
+        `MessageCreate`, or the message ID and custom ID for `Component`.
+
+        ??? Hint "Example Usage:"
+            ```python
+            event = await bot.wait_for(MessageCreate, key=message_id)
+            ```
+
         Args:
             event: The name of event to wait.
             checks: A predicate to check what to wait for.
             timeout: The number of seconds to wait before timing out.
+            key: Only wait for events with this key, or any key in a list or set of keys. `checks` are also applied
 
         Returns:
             The event object.
 
         """
         event = get_event_name(event)
-
-        if event not in self.waits:
-            self.waits[event] = []
-
         future = asyncio.Future()
-        self.waits[event].append(Wait(event, checks, future))
+        wait = Wait(event, checks, future)
+
+        if key is MISSING:
+            waits = self.waits.setdefault(event, [])
+            waits.append(wait)
+            future.add_done_callback(lambda _: _discard(waits, wait))
+        else:
+            if event not in self.wait_keys:
+                raise ValueError(f"{event} events can't be waited for by key, add a key getter to `wait_keys`")
+            keys = tuple(key) if isinstance(key, (list, set, frozenset)) else (key,)
+            keyed = self._keyed_waits.setdefault(event, {})
+            for _key in keys:
+                keyed.setdefault(_key, []).append(wait)
+            future.add_done_callback(lambda _: self._remove_keyed_wait(keyed, keys, wait))
 
         return asyncio.wait_for(future, timeout)
 
+    @staticmethod
+    def _remove_keyed_wait(keyed: dict[Hashable, list[Wait]], keys: tuple[Hashable, ...], wait: Wait) -> None:
+        for key in keys:
+            if (bucket := keyed.get(key)) is not None:
+                _discard(bucket, wait)
+                if not bucket:
+                    del keyed[key]
+
     async def wait_for_modal(
         self,
         modal: "Modal",
@@ -1143,11 +1447,9 @@ class Client(
         author = to_snowflake(author) if author else None
 
         def predicate(event: events.ModalCompletion) -> bool:
-            if modal.custom_id != event.ctx.custom_id:
-                return False
             return author == to_snowflake(event.ctx.author) if author else True
 
-        resp = await self.wait_for("modal_completion", predicate, timeout)
+        resp = await self.wait_for("modal_completion", predicate, timeout, key=modal.custom_id)
         return resp.ctx
 
     @overload
@@ -1256,7 +1558,12 @@ class Client(
                 return bool(check is None or check(event))
             return False
 
-        return await self.wait_for("component", checks=_check, timeout=timeout)
+        # custom IDs are the more specific key, the message is still checked by the predicate
+        if custom_ids:
+            key = set(custom_ids)
+        else:
+            key = {message_ids} if isinstance(message_ids, int) else set(message_ids)
+        return await self.wait_for("component", checks=_check, timeout=timeout, key=key)
 
     def command(self, *args, **kwargs) -> Callable:
         """A decorator that registers a command. Aliases `interactions.slash_command`"""
@@ -1285,12 +1592,15 @@ class Client(
 
     event = listen  # alias for easier migration
 
-    def add_event_processor(self, event_name: Absent[str] = MISSING) -> Callable[[AsyncCallable], AsyncCallable]:
+    def add_event_processor(
+        self, event_name: Absent[str] = MISSING, *, produces: Sequence["str | type[BaseEvent]"] = ()
+    ) -> Callable[[AsyncCallable], AsyncCallable]:
         """
         A decorator to be used to add event processors.
 
         Args:
             event_name: The event name to use, if not the coroutine name
+            produces: The events the processor dispatches, see `is_demanded`
 
         Returns:
             A function that can be used to hook into the event.
@@ -1304,10 +1614,61 @@ class Client(
             name = name.lstrip("_")
             name = name.removeprefix("on_")
             self.processors[name] = coro
+            if produces:
+                self._processor_products[name] = tuple(get_event_name(event) for event in produces)
+            else:
+                self._processor_products.pop(name, None)
             return coro
 
         return wrapper
 
+    def has_listeners(self, event: "str | type[BaseEvent]") -> bool:
+        """
+        Check if anything would receive an event, if it was dispatched.
+
+        Args:
+            event: The event, or its name
+
+        Returns:
+            Whether the event has any listeners or waits
+
+        """
+        name = get_event_name(event)
+        return bool(
+            self.listeners.get(name)
+            or self._filtered_listeners.get(name)
+            or self.waits.get(name)
+            or self._keyed_waits.get(name)
+            or "event" in self.listeners
+        )
+
+    def _has_receivers(self, name: str, payload: dict) -> bool:
+        """Check if anything would receive an event dispatched while processing a payload."""
+        if (filtered := self._filtered_listeners.get(name)) and filtered.match(payload):
+            return True
+        return bool(
+            self.listeners.get(name) or self.waits.get(name) or self._keyed_waits.get(name) or "event" in self.listeners
+        )
+
+    def is_demanded(self, event: RawGatewayEvent) -> bool:
+        """
+        Check if the events a processor dispatches for a raw gateway event have any listeners.
+
+        Processors use this to skip building models and fetching objects over REST when nothing would receive the
+        result, only keeping the cache up to date. Filtered listeners only count if the event's payload passes their
+        filters.
+
+        Args:
+            event: The raw gateway event being processed
+
+        Returns:
+            Whether the processor should do its full work
+
+        """
+        if (products := self._processor_products.get(event.resolved_name)) is None:
+            return True
+        return any(self._has_receivers(name, event.data) for name in products)
+
     def add_listener(self, listener: Listener) -> None:
         """
         Add a listener for an event, if no event is passed, one is determined.
@@ -1317,6 +1678,9 @@ class Client(
 
         """
         if listener.event == "event":
+            if listener.inline:
+                # meta listeners are awaited with the event, so they can't be run inline
+                raise ValueError("Meta event listeners cannot be inline")
             self.logger.critical(
                 f"Subscribing to `{listener.event}` - Meta Events are very expensive; remember to remove it before"
                 " releasing your bot"
@@ -1335,15 +1699,24 @@ class Client(
                         )
 
         # prevent the same callback being added twice
-        if listener in self.listeners.get(listener.event, []):
+        if listener in self.listeners.get(listener.event, []) or listener in self._filtered_listeners.get(
+            listener.event, []
+        ):
             self.logger.debug(f"Listener {listener} has already been hooked, not re-hooking it again")
             return
 
         listener.lazy_parse_params()
 
-        if listener.event not in self.listeners:
-            self.listeners[listener.event] = []
-        self.listeners[listener.event].append(listener)
+        if listener.filters:
+            if listener.event == "event":
+                raise ValueError("Meta event listeners cannot be filtered")
+            if listener.event not in self._filtered_listeners:
+                self._filtered_listeners[listener.event] = FilteredListeners()
+            self._filtered_listeners[listener.event].add(listener)
+            return
+
+        # the lists are replaced rather than modified, as dispatch may be iterating over them
+        self.listeners[listener.event] = [*self.listeners.get(listener.event, ()), listener]
 
         # check if other listeners are to be deleted
         default_listeners = [c_listener.is_default_listener for c_listener in self.listeners[listener.event]]
@@ -1354,6 +1727,24 @@ class Client(
                 c_listener for c_listener in self.listeners[listener.event] if not c_listener.is_default_listener
             ]
 
+    def remove_listener(self, listener: Listener) -> None:
+        """
+        Remove a listener from the client.
+
+        Args:
+            listener: The listener to remove
+
+        """
+        if listener.filters:
+            if (filtered := self._filtered_listeners.get(listener.event)) and listener in filtered:
+                filtered.remove(listener)
+                if not filtered:
+                    del self._filtered_listeners[listener.event]
+        elif listener in (listeners := self.listeners.get(listener.event, [])):
+            listeners = [*listeners]
+            listeners.remove(listener)
+            self.listeners[listener.event] = listeners
+
     def add_interaction(self, command: InteractionCommand) -> bool:
         """
         Add a slash command to the client.
@@ -2010,6 +2401,23 @@ class Client(
         if callback_kwargs is None:
             callback_kwargs = {}
 
+        with tracing.span(
+            "interaction",
+            interaction_id=str(ctx.id),
+            context=type(ctx).__name__,
+            target=getattr(ctx, "_command_name", None),
+        ) as span:
+            await self.__run_interaction(span, ctx, callback, error_callback, completion_callback, callback_kwargs)
+
+    async def __run_interaction(
+        self,
+        span: "tracing.Span | tracing._NoSpan",
+        ctx,
+        callback: Coroutine,
+        error_callback: Type[BaseEvent],
+        completion_callback: Type[BaseEvent] | None,
+        callback_kwargs: dict,
+    ) -> None:
         try:
             if self.pre_run_callback:
                 await self.pre_run_callback(ctx, **callback_kwargs)
@@ -2031,6 +2439,7 @@ class Client(
             if self.post_run_callback:
                 _ = asyncio.create_task(self.post_run_callback(ctx, **callback_kwargs))  # noqa: RUF006
         except Exception as e:
+            span.set_attribute("error", repr(e))
             self.dispatch(error_callback(ctx=ctx, error=e))
         finally:
             if completion_callback:
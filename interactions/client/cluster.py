@@ -0,0 +1,619 @@
+"""
+Run an `AutoShardedClient` across multiple processes.
+
+Each cluster is a worker process running its own client for a subset of the bot's shards, so decompression, parsing
+and model building aren't limited to a single core. A supervisor process spawns the clusters, coordinates when
+shards may identify, restarts clusters that crash, and relays messages between clusters.
+
+???+ hint "Example Usage"
+    ```python
+    from interactions import AutoShardedClient
+    from interactions.client.cluster import ClusterManager
+
+    def create_client(shard_ids: list[int], total_shards: int) -> AutoShardedClient:
+        client = AutoShardedClient(shard_ids=shard_ids, total_shards=total_shards)
+        client.load_extension("exts.commands")
+        return client
+
+    if __name__ == "__main__":
+        ClusterManager(create_client, token="...", clusters=4).start()
+    ```
+
+"""
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import math
+import multiprocessing
+import os
+import secrets
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+import attrs
+
+from interactions.api import events
+from interactions.api.gateway.identify import IdentifyScheduler
+from interactions.api.http.http_client import HTTPClient
+from interactions.client.const import MISSING, Absent, get_logger
+from interactions.client.utils.input_utils import FastJson
+from interactions.models.internal.listener import Listener
+
+if TYPE_CHECKING:
+    from multiprocessing.process import BaseProcess
+
+    from interactions.client.auto_shard_client import AutoShardedClient
+
+__all__ = ("ClusterState", "ClusterManager", "ClusterClient")
+
+ClientFactory = Callable[[list[int], int], "AutoShardedClient"]
+
+_STREAM_LIMIT = 2**24
+# how long a cluster waits for the supervisor to answer a request, on top of any time the request itself takes (seconds)
+_REQUEST_TIMEOUT = 30
+
+
+async def _send(writer: asyncio.StreamWriter, payload: dict) -> None:
+    writer.write(FastJson.dumps(payload).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class ClusterState:
+    """The supervisor's view of a cluster."""
+
+    cluster_id: int = attrs.field(repr=True)
+    """The ID of this cluster"""
+    shard_ids: list[int] = attrs.field(repr=True)
+    """The shards this cluster runs"""
+    process: "BaseProcess | None" = attrs.field(repr=False, default=None)
+    """The process currently running this cluster"""
+    ready: bool = attrs.field(repr=True, default=False)
+    """Whether this cluster's client is ready"""
+    latencies: dict[int, float] = attrs.field(repr=False, factory=dict)
+    """The latency of each of this cluster's shards"""
+    guild_count: int = attrs.field(repr=False, default=0)
+    """The number of guilds in this cluster"""
+    restarts: int = attrs.field(repr=False, default=0)
+    """The number of times this cluster has been restarted"""
+    started_at: float = attrs.field(repr=False, default=0)
+
+    _writer: asyncio.StreamWriter | None = attrs.field(repr=False, default=None)
+    _failures: int = attrs.field(repr=False, default=0)
+    _restarting: bool = attrs.field(repr=False, default=False)
+    _stopped: bool = attrs.field(repr=False, default=False)
+
+    @property
+    def alive(self) -> bool:
+        """Whether this cluster's process is running."""
+        return self.process is not None and self.process.exitcode is None
+
+
+def _run_cluster(
+    factory: ClientFactory,
+    token: str,
+    cluster_id: int,
+    shard_ids: list[int],
+    total_shards: int,
+    address: tuple[str, int],
+    secret: str,
+) -> None:
+    """The entrypoint of a cluster process."""
+
+    async def main() -> None:
+        client = factory(shard_ids, total_shards)
+        cluster = ClusterClient(client, cluster_id, address, secret)
+        await cluster.connect()
+        try:
+            await client.astart(token)
+        finally:
+            await cluster.close()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(main())
+
+
+class ClusterClient:
+    """
+    A cluster's connection to its supervisor.
+
+    This is available as `client.cluster` within a cluster process.
+
+    ??? Hint "Example Usage:"
+        ```python
+        @client.cluster.register_query()
+        async def member_count() -> int:
+            return sum(guild.member_count for guild in client.guilds)
+
+        # in any cluster
+        totals = await client.cluster.query("member_count")
+        ```
+
+    Attributes:
+        cluster_id: The ID of this cluster
+
+    """
+
+    def __init__(self, client: "AutoShardedClient", cluster_id: int, address: tuple[str, int], secret: str) -> None:
+        self.client = client
+        self.cluster_id = cluster_id
+        self._address = address
+        self._secret = secret
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._pending: dict[int, asyncio.Future] = {}
+        self._nonce = 0
+        self._queries: dict[str, Callable[..., Any]] = {
+            "guild_count": lambda: len(self.client.guilds) if self.client.user else 0,
+            "latencies": lambda: self.client.latencies,
+        }
+
+    async def connect(self) -> None:
+        """Connect to the supervisor, and attach this cluster to the client."""
+        self._reader, self._writer = await asyncio.open_connection(*self._address, limit=_STREAM_LIMIT)
+        await _send(self._writer, {"op": "hello", "cluster_id": self.cluster_id, "secret": self._secret})
+
+        self.client.cluster = self
+        self.client.identify_gate = self.request_identify
+
+        async def _on_ready(_event: events.Ready) -> None:
+            await self.send_status()
+
+        self.client.add_listener(Listener.create("ready")(_on_ready))
+
+        self._tasks = [
+            asyncio.create_task(self._receive(), name=f"interactions:: cluster {self.cluster_id} ipc"),
+            asyncio.create_task(self._report_status(), name=f"interactions:: cluster {self.cluster_id} status"),
+        ]
+
+    async def close(self) -> None:
+        """
+        Disconnect from the supervisor.
+
+        If the client was stopped, the supervisor is told so, and won't restart this cluster once it exits.
+        """
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._fail_pending(ConnectionError("The cluster client was closed"))
+        if self._writer is not None:
+            if self.client.is_closed:
+                with contextlib.suppress(ConnectionError):
+                    await _send(self._writer, {"op": "stopped"})
+            self._writer.close()
+            self._writer = None
+
+    def register_query(self, name: Absent[str] = MISSING) -> Callable[[Callable], Callable]:
+        """
+        Register a function that other clusters can query.
+
+        Args:
+            name: The name of the query, defaults to the name of the function
+
+        """
+
+        def wrapper(func: Callable) -> Callable:
+            self._queries[name or func.__name__] = func
+            return func
+
+        return wrapper
+
+    async def _request(self, op: str, data: dict, timeout: float) -> Any:
+        self._nonce += 1
+        nonce = self._nonce
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = future
+        try:
+            await _send(self._writer, {"op": op, "nonce": nonce, **data})
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(nonce, None)
+
+    def _fail_pending(self, exc: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(exc)
+        self._pending.clear()
+
+    async def request_identify(self, shard_id: int) -> None:
+        """
+        Wait until the supervisor allows a shard to identify.
+
+        Args:
+            shard_id: The ID of the shard that wants to identify
+
+        """
+        # at worst, every other shard is queued ahead of this one
+        scheduler = self.client.identify_scheduler or IdentifyScheduler()
+        timeout = scheduler.interval * self.client.total_shards + _REQUEST_TIMEOUT
+        await self._request("identify", {"shard_id": shard_id}, timeout)
+
+    async def broadcast(self, data: Any) -> None:
+        """
+        Send a message to every cluster, including this one. It's dispatched as a `ClusterMessage` event.
+
+        Args:
+            data: The json-serializable data to send
+
+        """
+        await _send(self._writer, {"op": "broadcast", "data": data})
+
+    async def query(self, name: str, *args: Any, timeout: float = 10) -> list[Any]:
+        """
+        Run a registered query on every cluster.
+
+        Args:
+            name: The name of the query
+            *args: The json-serializable arguments to pass to the query
+            timeout: How long to wait for each cluster to respond (seconds)
+
+        Returns:
+            The result from each cluster, or None for clusters that failed to respond
+
+        """
+        data = {"name": name, "args": args, "timeout": timeout}
+        # the supervisor waits up to the timeout for each cluster to respond
+        return await self._request("query", data, timeout + _REQUEST_TIMEOUT)
+
+    async def total_guild_count(self) -> int:
+        """Get the number of guilds across all clusters."""
+        return sum(count or 0 for count in await self.query("guild_count"))
+
+    async def send_status(self) -> None:
+        """Report the status of this cluster to the supervisor."""
+        if self._writer is None:
+            return
+        await _send(
+            self._writer,
+            {
+                "op": "status",
+                "ready": self.client.is_ready,
+                "latencies": {
+                    str(shard_id): latency if math.isfinite(latency) else None
+                    for shard_id, latency in self.client.latencies.items()
+                },
+                "guild_count": len(self.client.guilds) if self.client.user else 0,
+            },
+        )
+
+    async def _report_status(self) -> None:
+        while True:
+            await asyncio.sleep(5)
+            with contextlib.suppress(ConnectionError):
+                await self.send_status()
+
+    async def _run_query(self, nonce: int, name: str, args: list) -> None:
+        result = None
+        if func := self._queries.get(name):
+            try:
+                result = func(*args)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as e:
+                self.client.logger.error(f"Cluster query {name} failed: {e!r}")
+                result = None
+        else:
+            self.client.logger.warning(f"Received unknown cluster query: {name}")
+        await _send(self._writer, {"op": "result", "nonce": nonce, "data": result})
+
+    async def _receive(self) -> None:
+        while line := await self._reader.readline():
+            msg = FastJson.loads(line)
+            match msg["op"]:
+                case "reply":
+                    if future := self._pending.get(msg["nonce"]):
+                        if not future.done():
+                            future.set_result(msg.get("data"))
+                case "message":
+                    self.client.dispatch(events.ClusterMessage(data=msg["data"], cluster_id=msg["cluster_id"]))
+                case "query":
+                    _ = asyncio.create_task(self._run_query(msg["nonce"], msg["name"], msg["args"]))  # noqa: RUF006
+                case "stop":
+                    _ = asyncio.create_task(self.client.stop())  # noqa: RUF006
+
+        self.client.logger.warning("Lost connection to the cluster supervisor, stopping")
+        self._fail_pending(ConnectionError("Lost connection to the cluster supervisor"))
+        # without a supervisor, identifies can't be coordinated and the cluster wouldn't be restarted
+        if not self.client.is_closed:
+            _ = asyncio.create_task(self.client.stop())  # noqa: RUF006
+
+
+class ClusterManager:
+    """
+    Spawns and supervises clusters of shards.
+
+    Args:
+        factory: A function that creates the client for a cluster, given its shard IDs and the total number of shards. This must be importable (ie defined at module level), as it's passed to a new process
+        token: Your bot's token
+        total_shards: The total number of shards, defaults to discord's recommendation
+        clusters: The number of clusters to run, defaults to the number of CPUs
+        restart_delay: The initial delay before restarting a crashed cluster (seconds), which is doubled on consecutive crashes
+        max_restart_delay: The maximum delay before restarting a crashed cluster (seconds)
+        logger: The logger to use
+
+    """
+
+    def __init__(
+        self,
+        factory: ClientFactory,
+        token: str,
+        *,
+        total_shards: int | None = None,
+        clusters: int | None = None,
+        restart_delay: float = 5,
+        max_restart_delay: float = 300,
+        logger: logging.Logger = MISSING,
+    ) -> None:
+        self.factory = factory
+        self.token = token
+        self.total_shards = total_shards
+        self.cluster_count = clusters or os.cpu_count() or 1
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.logger = logger or get_logger()
+
+        self.identify_scheduler = IdentifyScheduler()
+        """The scheduler pacing identifies across every cluster"""
+        self.clusters: list[ClusterState] = []
+
+        self._secret = secrets.token_hex(16)
+        self._server: asyncio.Server | None = None
+        self._address: tuple[str, int] | None = None
+        self._context = multiprocessing.get_context("spawn")
+        self._pending: dict[int, asyncio.Future] = {}
+        self._nonce = 0
+        self._stopping = asyncio.Event()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether every cluster is ready."""
+        return bool(self.clusters) and all(cluster.ready for cluster in self.clusters)
+
+    @property
+    def latencies(self) -> dict[int, float]:
+        """The latency of every shard, keyed by shard ID."""
+        return {shard_id: latency for cluster in self.clusters for shard_id, latency in cluster.latencies.items()}
+
+    @property
+    def latency(self) -> float:
+        """The average latency of every shard."""
+        if latencies := [latency for latency in self.latencies.values() if latency is not None]:
+            return sum(latencies) / len(latencies)
+        return float("inf")
+
+    @property
+    def guild_count(self) -> int:
+        """The number of guilds across all clusters, as last reported."""
+        return sum(cluster.guild_count for cluster in self.clusters)
+
+    def start(self) -> None:
+        """Start the clusters, and supervise them until interrupted."""
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(self.astart())
+
+    async def astart(self) -> None:
+        """Asynchronous method to start and supervise the clusters."""
+        http = HTTPClient(logger=self.logger)
+        try:
+            await http.login(self.token)
+            data = await http.get_gateway_bot()
+        finally:
+            await http.close()
+
+        self.identify_scheduler = IdentifyScheduler(data["session_start_limit"]["max_concurrency"])
+        self.total_shards = self.total_shards or data["shards"]
+        self.cluster_count = min(self.cluster_count, self.total_shards)
+
+        per_cluster = math.ceil(self.total_shards / self.cluster_count)
+        shard_ids = list(range(self.total_shards))
+        self.clusters = [
+            ClusterState(cluster_id=i, shard_ids=shard_ids[i * per_cluster : (i + 1) * per_cluster])
+            for i in range(self.cluster_count)
+        ]
+        self.clusters = [cluster for cluster in self.clusters if cluster.shard_ids]
+
+        self._server = await asyncio.start_server(self._handle_connection, "127.0.0.1", 0, limit=_STREAM_LIMIT)
+        self._address = self._server.sockets[0].getsockname()[:2]
+        self.logger.info(
+            f"Starting {len(self.clusters)} clusters for {self.total_shards} shards "
+            f"with a max concurrency of {self.identify_scheduler.max_concurrency}"
+        )
+
+        for cluster in self.clusters:
+            self._spawn(cluster)
+
+        try:
+            await self._supervise()
+        finally:
+            await self.stop()
+
+    async def stop(self, timeout: float = 30) -> None:
+        """
+        Stop every cluster.
+
+        Clusters are asked to shut down cleanly, and are terminated if they haven't within the timeout.
+
+        Args:
+            timeout: How long to wait for clusters to shut down (seconds)
+
+        """
+        if self._stopping.is_set():
+            return
+        self._stopping.set()
+
+        for cluster in self.clusters:
+            if cluster._writer is not None:
+                with contextlib.suppress(ConnectionError):
+                    await _send(cluster._writer, {"op": "stop"})
+
+        deadline = time.monotonic() + timeout
+        for cluster in self.clusters:
+            if cluster.process is None:
+                continue
+            await asyncio.to_thread(cluster.process.join, max(0.0, deadline - time.monotonic()))
+            if cluster.alive:
+                self.logger.warning(f"Cluster {cluster.cluster_id} did not stop in time, terminating it")
+                cluster.process.terminate()
+
+        if self._server is not None:
+            self._server.close()
+
+    async def broadcast(self, data: Any) -> None:
+        """
+        Send a message to every cluster. It's dispatched as a `ClusterMessage` event.
+
+        Args:
+            data: The json-serializable data to send
+
+        """
+        await self._broadcast(data, origin=-1)
+
+    async def query(self, name: str, *args: Any, timeout: float = 10) -> list[Any]:
+        """
+        Run a registered query on every cluster.
+
+        Args:
+            name: The name of the query
+            *args: The json-serializable arguments to pass to the query
+            timeout: How long to wait for each cluster to respond (seconds)
+
+        Returns:
+            The result from each cluster, or None for clusters that failed to respond
+
+        """
+        return await asyncio.gather(*(self._query(cluster, name, args, timeout) for cluster in self.clusters))
+
+    def _spawn(self, cluster: ClusterState) -> None:
+        cluster.ready = False
+        cluster._stopped = False
+        cluster.latencies = {}
+        cluster.started_at = time.monotonic()
+        cluster.process = self._context.Process(
+            target=_run_cluster,
+            args=(
+                self.factory,
+                self.token,
+                cluster.cluster_id,
+                cluster.shard_ids,
+                self.total_shards,
+                self._address,
+                self._secret,
+            ),
+            name=f"interactions-cluster-{cluster.cluster_id}",
+        )
+        cluster.process.start()
+        self.logger.info(f"Started cluster {cluster.cluster_id} with shards {cluster.shard_ids}")
+
+    async def _restart(self, cluster: ClusterState) -> None:
+        if time.monotonic() - cluster.started_at > self.max_restart_delay:
+            # the cluster was stable for a while, so this isn't part of a crash loop
+            cluster._failures = 0
+        delay = min(self.restart_delay * 2**cluster._failures, self.max_restart_delay)
+        cluster._failures += 1
+
+        self.logger.warning(
+            f"Cluster {cluster.cluster_id} exited with code {cluster.process.exitcode}, restarting in {delay:.0f}s"
+        )
+        try:
+            await asyncio.wait_for(self._stopping.wait(), delay)
+        except asyncio.TimeoutError:
+            if cluster._stopped:
+                # the stop signal arrived after the process exited
+                return
+            cluster.restarts += 1
+            self._spawn(cluster)
+        finally:
+            cluster._restarting = False
+
+    async def _supervise(self) -> None:
+        while not self._stopping.is_set():
+            for cluster in self.clusters:
+                if cluster.process is None or cluster.alive or cluster._restarting:
+                    continue
+                cluster.ready = False
+                if cluster._stopped:
+                    # the client was stopped deliberately. The exit code can't tell us this, as shards that crash
+                    # still exit cleanly
+                    continue
+                cluster._restarting = True
+                _ = asyncio.create_task(self._restart(cluster))  # noqa: RUF006
+
+            if self.clusters and all(cluster._stopped and not cluster.alive for cluster in self.clusters):
+                self.logger.info("All clusters have stopped")
+                return
+            await asyncio.sleep(1)
+
+    async def _broadcast(self, data: Any, origin: int) -> None:
+        for cluster in self.clusters:
+            if cluster._writer is not None:
+                with contextlib.suppress(ConnectionError):
+                    await _send(cluster._writer, {"op": "message", "data": data, "cluster_id": origin})
+
+    async def _query(self, cluster: ClusterState, name: str, args: Any, timeout: float) -> Any:
+        if cluster._writer is None:
+            return None
+
+        self._nonce += 1
+        nonce = self._nonce
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = future
+        try:
+            await _send(cluster._writer, {"op": "query", "nonce": nonce, "name": name, "args": args})
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            return None
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def _reply(self, writer: asyncio.StreamWriter, nonce: int, coro: Awaitable) -> None:
+        data = await coro
+        with contextlib.suppress(ConnectionError):
+            await _send(writer, {"op": "reply", "nonce": nonce, "data": data})
+
+    async def _handle_message(self, cluster: ClusterState, writer: asyncio.StreamWriter, msg: dict) -> None:
+        match msg["op"]:
+            case "identify":
+                coro = self.identify_scheduler.acquire(msg["shard_id"])
+                _ = asyncio.create_task(self._reply(writer, msg["nonce"], coro))  # noqa: RUF006
+            case "status":
+                if msg["ready"] and not cluster.ready:
+                    self.logger.info(f"Cluster {cluster.cluster_id} is ready")
+                cluster.ready = msg["ready"]
+                cluster.latencies = {int(k): v for k, v in msg["latencies"].items()}
+                cluster.guild_count = msg["guild_count"]
+            case "broadcast":
+                await self._broadcast(msg["data"], origin=cluster.cluster_id)
+            case "query":
+                coro = self.query(msg["name"], *msg["args"], timeout=msg["timeout"])
+                _ = asyncio.create_task(self._reply(writer, msg["nonce"], coro))  # noqa: RUF006
+            case "result":
+                if (future := self._pending.get(msg["nonce"])) and not future.done():
+                    future.set_result(msg["data"])
+            case "stopped":
+                cluster._stopped = True
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        hello = FastJson.loads(await reader.readline() or b"{}")
+        if hello.get("op") != "hello" or not secrets.compare_digest(str(hello.get("secret")), self._secret):
+            writer.close()
+            return
+
+        cluster = next((c for c in self.clusters if c.cluster_id == hello["cluster_id"]), None)
+        if cluster is None:
+            writer.close()
+            return
+        cluster._writer = writer
+
+        try:
+            while line := await reader.readline():
+                await self._handle_message(cluster, writer, FastJson.loads(line))
+        except ConnectionError:
+            pass
+        finally:
+            if cluster._writer is writer:
+                cluster._writer = None
+                cluster.ready = False
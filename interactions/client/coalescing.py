@@ -0,0 +1,199 @@
+"""Coalescing of high frequency events, so listeners only receive the newest event per key in each time window."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Hashable
+
+from interactions.api.events.base import _dispatch_payload
+from interactions.client.const import MISSING, get_logger
+from interactions.client.utils.misc_utils import get_event_name
+
+if TYPE_CHECKING:
+    from interactions.api.events import BaseEvent
+    from interactions.client.client import Client
+    from interactions.models.internal.listener import Listener
+
+__all__ = ("EventCoalescer",)
+
+
+def _voice_state_key(event: "BaseEvent") -> tuple[Hashable, ...]:
+    state = event.after or event.before
+    # noinspection PyProtectedMember
+    return state.user_id, state._guild_id
+
+
+_COALESCE_KEYS: dict[str, Callable[["BaseEvent"], Hashable]] = {
+    "presence_update": lambda event: (event.user.id, event.guild_id),
+    "typing_start": lambda event: (event.author.id, event.channel.id),
+    "voice_state_update": _voice_state_key,
+    "member_update": lambda event: (event.guild_id, event.after.id),
+}
+
+
+class EventCoalescer:
+    """
+    Coalesces bursts of events, so listeners only receive the newest event per key in each time window.
+
+    The first event of a coalesced type opens a window. Events received during the window are keyed, ie by user and
+    guild, and replace the pending event with the same key. When the window closes, the newest event of every key is
+    delivered as one batch: inline listeners are run immediately, and every other listener invocation for the window
+    runs in a single task, in order. For events with a `before` state, such as `MemberUpdate`, the delivered event keeps
+    the `before` of the first event it replaced, so listeners see the whole change.
+
+    `PresenceUpdate`, `TypingStart`, `VoiceStateUpdate` and `MemberUpdate` are keyed by default, other events need a
+    key function.
+
+    ??? Hint "Example Usage:"
+        ```python
+        bot = Client(event_coalescer=EventCoalescer({PresenceUpdate: 5, TypingStart: 1}))
+        ```
+
+    Args:
+        events: The events to coalesce, and the length of their windows (seconds)
+        keys: Functions returning the key of an event, by event
+
+    """
+
+    def __init__(
+        self,
+        events: dict["str | type[BaseEvent]", float],
+        *,
+        keys: dict["str | type[BaseEvent]", Callable[["BaseEvent"], Hashable]] | None = None,
+    ) -> None:
+        self.windows: dict[str, float] = {get_event_name(event): window for event, window in events.items()}
+        """The length of each event's window (seconds), by event name"""
+        self.keys: dict[str, Callable[["BaseEvent"], Hashable]] = dict(_COALESCE_KEYS)
+        """Gets the key of an event, by event name"""
+        self.keys.update({get_event_name(event): key for event, key in (keys or {}).items()})
+        if missing := [name for name in self.windows if name not in self.keys]:
+            raise ValueError(f"No key function was given for: {', '.join(missing)}")
+
+        self.client: "Client | None" = None
+        self.received: dict[str, int] = dict.fromkeys(self.windows, 0)
+        """The number of events received, by event name"""
+        self.delivered: dict[str, int] = dict.fromkeys(self.windows, 0)
+        """The number of events dispatched at the end of a window, by event name"""
+        self.dropped: dict[str, int] = dict.fromkeys(self.windows, 0)
+        """The number of events replaced by a newer event with the same key, by event name"""
+
+        self._pending: dict[str, dict[Hashable, tuple["BaseEvent", tuple, dict, dict | None]]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self.logger: logging.Logger = get_logger()
+
+    @property
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """A snapshot of the counters of each coalesced event."""
+        return {
+            name: {
+                "received": self.received[name],
+                "delivered": self.delivered[name],
+                "dropped": self.dropped[name],
+                "pending": len(self._pending.get(name, ())),
+            }
+            for name in self.windows
+        }
+
+    def coalesce(self, event: "BaseEvent", args: tuple, kwargs: dict[str, Any]) -> bool:
+        """
+        Hold an event back until the end of its window.
+
+        Args:
+            event: The event being dispatched
+            args: The positional arguments it was dispatched with
+            kwargs: The keyword arguments it was dispatched with
+
+        Returns:
+            Whether the event was held back, if not it should be dispatched immediately
+
+        """
+        if self.client is None:
+            return False
+        name = event.resolved_name
+        try:
+            loop = asyncio.get_running_loop()
+            key = self.keys[name](event)
+        except RuntimeError:
+            return False
+        except Exception as e:
+            self.logger.debug(f"Failed to get the coalescing key of {name}, dispatching it immediately: {e!r}")
+            return False
+
+        self.received[name] += 1
+        pending = self._pending.setdefault(name, {})
+        if (previous := pending.get(key)) is not None:
+            self.dropped[name] += 1
+            older = previous[0]
+            if getattr(event, "changes", None) is not None and getattr(older, "changes", None) is not None:
+                # the older event's old values predate this event's, so take precedence
+                event.changes = event.changes | older.changes
+            # checked on the class, as reading a lazily built before would build it
+            if hasattr(type(event), "before") and hasattr(older, "before"):
+                # a lazily built before was already built, when this event's update was applied
+                before = older.before
+                if before is MISSING and getattr(event, "changes", None) is not None:
+                    # the object wasn't cached before the first update
+                    event.changes = None
+                event.before = before
+        # the payload is kept for filtered listeners, which are checked once the event is dispatched
+        pending[key] = (event, args, kwargs, _dispatch_payload.get())
+
+        if name not in self._timers:
+            self._timers[name] = loop.call_later(self.windows[name], self._flush, name)
+        return True
+
+    def _flush(self, name: str) -> None:
+        self._timers.pop(name, None)
+        pending = self._pending.pop(name, None)
+        if not pending:
+            return
+
+        self.delivered[name] += len(pending)
+        batch: list[tuple["Listener", "BaseEvent", tuple, dict]] = []
+        for event, args, kwargs, payload in pending.values():
+            token = _dispatch_payload.set(payload)
+            try:
+                self._deliver(event, args, kwargs, batch)
+            except Exception as e:
+                self.logger.error(f"Failed to dispatch coalesced {name}: {e!r}")
+            finally:
+                _dispatch_payload.reset(token)
+
+        if batch:
+            _ = asyncio.create_task(self._run_batch(batch), name=f"interactions:: coalesced {name}")  # noqa: RUF006
+
+    def _deliver(self, event: "BaseEvent", args: tuple, kwargs: dict, batch: list) -> None:
+        """Run an event's inline listeners, and add its other listeners to the window's batch."""
+        client = self.client
+        name = event.resolved_name
+        # noinspection PyProtectedMember
+        if listeners := client._get_dispatch_listeners(name, event):
+            event.bot = client
+            for listener in listeners:
+                if listener.inline:
+                    client._run_inline(listener, event, *args, **kwargs)
+                else:
+                    batch.append((listener, event, args, kwargs))
+
+        # noinspection PyProtectedMember
+        if client.waits.get(name) or client._keyed_waits.get(name):
+            client._queue_waits(event)
+        for listener in client.listeners.get("event", ()):
+            client._queue_task(listener, event, *args, **kwargs)
+
+    async def _run_batch(self, batch: list[tuple["Listener", "BaseEvent", tuple, dict]]) -> None:
+        for listener, event, args, kwargs in batch:
+            # noinspection PyProtectedMember
+            await self.client._run_listener(listener, event, *args, **kwargs)
+
+    def flush(self) -> None:
+        """Dispatch every pending event immediately, without waiting for their windows to close."""
+        for name in list(self._timers):
+            self._timers[name].cancel()
+            self._flush(name)
+
+    def stop(self) -> None:
+        """Discard every pending event."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._pending.clear()
@@ -0,0 +1,200 @@
+"""Event loop health monitoring, catching blocking callbacks before they cost the bot its gateway connections."""
+
+import asyncio
+import collections
+import logging
+import re
+import sys
+import threading
+import time
+import traceback
+from typing import TYPE_CHECKING
+
+from interactions.api import events
+from interactions.client.const import get_logger
+
+if TYPE_CHECKING:
+    from interactions.client.client import Client
+
+__all__ = ("LoopMonitor",)
+
+_task_number = re.compile(r"-\d+$")
+
+
+class LoopMonitor:
+    """
+    Watches the health of the event loop.
+
+    - **Lag**: How late the loop wakes a task that sleeps for `interval`. `EventLoopLag` is dispatched when it's
+      above `max_lag`.
+    - **Blocking**: A watchdog thread notices when the loop hasn't run for `block_threshold` seconds, and logs the task
+      blocking it with its stack, even if the loop never recovers. Once it does, `EventLoopBlocked` is dispatched.
+    - **Task census**: The pending tasks are counted every `census_interval` seconds, grouped by name, such as
+      `interactions:: message_create` for listeners. `TaskLimitExceeded` is dispatched when there are more than
+      `max_tasks`.
+
+    Blocked loops delay heartbeats, so discord will disconnect every shard if the loop is blocked for long enough.
+
+    ??? Hint "Example Usage:"
+        ```python
+        bot = Client(loop_monitor=LoopMonitor(block_threshold=0.5))
+
+        @listen(EventLoopBlocked)
+        async def on_blocked(event: EventLoopBlocked):
+            await alert(f"{event.task_name} blocked the loop for {event.duration:.1f}s")
+        ```
+
+    Args:
+        interval: How often to measure the loop's lag (seconds)
+        max_lag: The lag above which `EventLoopLag` is dispatched (seconds)
+        block_threshold: How long the loop may go without running before it's considered blocked (seconds)
+        census_interval: How often to count the pending tasks (seconds)
+        max_tasks: The number of pending tasks above which `TaskLimitExceeded` is dispatched
+
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.5,
+        max_lag: float = 0.25,
+        block_threshold: float = 1,
+        census_interval: float = 30,
+        max_tasks: int = 10_000,
+    ) -> None:
+        self.interval = interval
+        self.max_lag = max_lag
+        self.block_threshold = block_threshold
+        self.census_interval = census_interval
+        self.max_tasks = max_tasks
+
+        self.client: "Client | None" = None
+        self.lag: float = 0
+        """The most recently measured lag (seconds)"""
+        self.blocks: int = 0
+        """The number of times the loop was blocked"""
+        self.census: dict[str, int] = {}
+        """The most recent count of pending tasks, by name"""
+
+        self._lags: collections.deque[float] = collections.deque(maxlen=100)
+        self._tick: float = 0
+        self._blocked: tuple[str | None, str] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        self.logger: logging.Logger = get_logger()
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is watching the loop."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def average_lag(self) -> float:
+        """The average of the recently measured lags (seconds)."""
+        return sum(self._lags) / len(self._lags) if self._lags else 0
+
+    @property
+    def metrics(self) -> dict:
+        """A snapshot of the loop's health."""
+        return {
+            "lag": self.lag,
+            "average_lag": self.average_lag,
+            "blocks": self.blocks,
+            "tasks": sum(self.census.values()),
+        }
+
+    def start(self, client: "Client") -> None:
+        """
+        Start watching the loop the client is running in.
+
+        Args:
+            client: The client to dispatch events from
+
+        """
+        self.client = client
+        if self.running:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._tick = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._run(), name="interactions:: loop monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="interactions:: loop watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop watching the loop."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def take_census(self) -> dict[str, int]:
+        """
+        Count the pending tasks, grouped by name.
+
+        Returns:
+            {name: count}, largest first
+
+        """
+        counts = collections.Counter(_task_number.sub("", task.get_name()) for task in asyncio.all_tasks(self._loop))
+        self.census = dict(counts.most_common())
+        return self.census
+
+    async def _run(self) -> None:
+        next_census = time.monotonic() + self.census_interval
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._tick = now
+            self.lag = max(now - expected, 0)
+            self._lags.append(self.lag)
+
+            try:
+                self._check_lag()
+                if now >= next_census:
+                    next_census = now + self.census_interval
+                    self._check_census()
+            except Exception as e:
+                self.logger.error(f"Failed to check event loop health: {e!r}")
+
+    def _check_lag(self) -> None:
+        blocked, self._blocked = self._blocked, None
+        if blocked is not None or self.lag >= self.block_threshold:
+            self.blocks += 1
+            task_name, stack = blocked or (None, "")
+            self.client.dispatch(events.EventLoopBlocked(duration=self.lag, task_name=task_name, stack=stack))
+        elif self.lag > self.max_lag:
+            self.logger.warning(f"Event loop lag of {self.lag * 1000:.0f}ms")
+            self.client.dispatch(events.EventLoopLag(lag=self.lag))
+
+    def _check_census(self) -> None:
+        census = self.take_census()
+        total = sum(census.values())
+        if total > self.max_tasks:
+            largest = ", ".join(f"{name}: {count}" for name, count in list(census.items())[:5])
+            self.logger.warning(f"{total} tasks are pending ({largest})")
+            self.client.dispatch(events.TaskLimitExceeded(total=total, census=census))
+
+    def _watch(self) -> None:
+        """Runs in the watchdog thread, noticing when the loop stops running."""
+        reported = 0
+        while not self._stopped.wait(self.block_threshold / 4):
+            tick = self._tick
+            if time.monotonic() - tick < self.interval + self.block_threshold or reported == tick:
+                continue
+            reported = tick
+
+            task = asyncio.current_task(self._loop)
+            task_name = task.get_name() if task else None
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = "".join(traceback.format_stack(frame, limit=15)) if frame else ""
+            self._blocked = (task_name, stack)
+            self.logger.warning(
+                f"Event loop has been blocked for over {self.block_threshold}s by {task_name or 'a callback'}:\n{stack}"
+            )
@@ -1,5 +1,6 @@
 from logging import Logger
-from typing import Any, Dict, List, Type
+from typing import Any, Dict, List, Optional, Type
+from weakref import WeakKeyDictionary, WeakSet
 
 import attrs
 
@@ -8,6 +9,9 @@ import interactions.client.utils.serializer as serializer
 
 __all__ = ("DictSerializationMixin",)
 
+# objects with a lazily built `before` that has to be built before the object is updated again
+_pending_befores: "WeakKeyDictionary[Any, WeakSet]" = WeakKeyDictionary()
+
 
 @attrs.define(eq=False, order=False, hash=False, slots=False)
 class DictSerializationMixin:
@@ -80,21 +84,58 @@ class DictSerializationMixin:
         """
         return [cls.from_dict(data) for data in datas]
 
-    def update_from_dict(self: Type[const.T], data: Dict[str, Any]) -> const.T:
+    def update_from_dict(
+        self: Type[const.T], data: Dict[str, Any], changes: Optional[Dict[str, Any]] = None
+    ) -> const.T:
         """
         Updates object attribute(s) with new json data received from discord api.
 
         Args:
             data: The json data received from discord api.
+            changes: If given, the old values of the attributes that changed are added to it.
 
         Returns:
             The updated object class instance.
 
         """
         data = self._process_dict(data)
+        return self._apply_dict(data, changes)
+
+    def _defer_before(self, owner: Any) -> bool:
+        """
+        Have `owner._build_before()` called before this object is next updated.
+
+        Args:
+            owner: The object with a lazily built copy of this object's current state
+
+        Returns:
+            Whether the call was deferred, if not the copy should be built immediately
+
+        """
+        try:
+            _pending_befores.setdefault(self, WeakSet()).add(owner)
+        except TypeError:
+            return False
+        return True
+
+    def _apply_dict(self: const.T, data: Dict[str, Any], changes: Optional[Dict[str, Any]]) -> const.T:
+        """Set the attributes of processed dictionary data, recording the old values of those that changed."""
+        if _pending_befores and (pending := _pending_befores.get(self)):
+            del _pending_befores[self]
+            for owner in list(pending):
+                owner._build_before()
+
+        if changes is None:
+            for key, value in self._filter_kwargs(data, self._get_keys()).items():
+                setattr(self, key, value)
+            return self
+
         for key, value in self._filter_kwargs(data, self._get_keys()).items():
+            old = getattr(self, key, const.MISSING)
             setattr(self, key, value)
-
+            # compared after setting, so values are compared once any converter has run
+            if (new := getattr(self, key)) is not old and new != old:
+                changes.setdefault(key, old)
         return self
 
     def _check_object(self) -> None:
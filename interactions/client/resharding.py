@@ -0,0 +1,197 @@
+"""Live resharding, growing an `AutoShardedClient` to a new shard count without going offline."""
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Hashable
+
+from interactions.api.gateway.state import ConnectionState
+from interactions.client.const import get_logger
+from interactions.models.discord.snowflake import to_snowflake
+
+if TYPE_CHECKING:
+    from interactions.api.gateway.gateway import GatewayClient
+    from interactions.client.auto_shard_client import AutoShardedClient
+    from interactions.models.discord.snowflake import Snowflake_Type
+
+__all__ = ("Resharder",)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a payload value to a hashable equivalent, objects to sets of their fields and lists to tuples."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _dedupe_key(event: str, data: Any) -> int:
+    """Get a key identifying a dispatch by its whole payload, including nested objects, without serializing it."""
+    return hash((event, _freeze(data)))
+
+
+class Resharder:
+    """
+    Replaces the shards of an `AutoShardedClient` with a new set of shards, without missing events.
+
+    Resharding happens in three phases:
+
+    1. The new shards connect alongside the old ones. Their dispatches are dropped, as the old shards are still
+       keeping the cache up to date, until every new shard has received all of its guilds.
+    2. Both sets of shards deliver dispatches for `overlap` seconds, with duplicates suppressed.
+    3. The client switches to the new shards, and the old shards are closed. The new shards keep suppressing
+       duplicates for another `overlap` seconds, in case they received an event later than the old shards did.
+
+    Args:
+        client: The client to reshard
+        total_shards: The new number of shards
+        overlap: How long both sets of shards deliver dispatches for (seconds)
+        timeout: How long to wait for the new shards to be ready before aborting (seconds)
+        dedupe_size: How many recent distinct dispatches are remembered to suppress duplicates
+
+    """
+
+    def __init__(
+        self,
+        client: "AutoShardedClient",
+        total_shards: int,
+        *,
+        overlap: float = 5,
+        timeout: float = 600,
+        dedupe_size: int = 50_000,
+    ) -> None:
+        self.client = client
+        self.total_shards = total_shards
+        self.overlap = overlap
+        self.timeout = timeout
+        self.dedupe_size = dedupe_size
+
+        self.states: list[ConnectionState] = []
+        """The new shards"""
+        self.suppressed = 0
+        """The number of duplicate dispatches suppressed"""
+
+        self._expected: dict[ConnectionState, set["Snowflake_Type"]] = {}
+        self._warm: dict[ConnectionState, asyncio.Event] = {}
+        self._progress: dict[ConnectionState, asyncio.Event] = {}
+        # the number of each dispatch delivered by the old and new shards that the other set hasn't matched yet
+        self._seen: dict[int, list[int]] = {}
+        self.logger: logging.Logger = get_logger()
+
+    def _shadow_filter(self, gateway: "GatewayClient", seq: int | None, event: str, data: dict) -> bool:
+        # the new shards only track their session and guilds until they're warm, the old shards are still live
+        state = gateway.state
+        if event == "READY":
+            gateway.process_ready(data, seq)
+            self._expected[state] = {to_snowflake(guild["id"]) for guild in data["guilds"]}
+            self._progress[state].set()
+        elif event == "GUILD_CREATE" and (expected := self._expected.get(state)) is not None:
+            expected.discard(to_snowflake(data["id"]))
+            self._progress[state].set()
+        return False
+
+    def _dedupe_filter(self, gateway: "GatewayClient", seq: int | None, event: str, data: dict) -> bool:
+        if event in ("READY", "RESUMED"):
+            # these belong to a single connection, so are never duplicates
+            if event == "READY" and gateway.state in self._warm:
+                gateway.process_ready(data, seq)
+                return False
+            return True
+
+        # a dispatch is only a duplicate of one the other set of shards delivered, so a repeated state from the same
+        # shard, ie a presence going online -> idle -> online, is still delivered
+        key = _dedupe_key(event, data)
+        side = int(gateway.state in self._warm)
+        if (counts := self._seen.get(key)) is not None and counts[1 - side]:
+            counts[1 - side] -= 1
+            self.suppressed += 1
+            return False
+        if counts is None:
+            counts = self._seen[key] = [0, 0]
+            if len(self._seen) > self.dedupe_size:
+                del self._seen[next(iter(self._seen))]
+        counts[side] += 1
+        return True
+
+    @staticmethod
+    def _drop_filter(gateway: "GatewayClient", seq: int | None, event: str, data: dict) -> bool:
+        return False
+
+    async def _wait_until_warm(self, state: ConnectionState) -> None:
+        progress = self._progress[state]
+        # wait for READY
+        while state not in self._expected:
+            await progress.wait()
+            progress.clear()
+
+        # then for every guild, giving up on guilds that don't arrive, as discord may never send them
+        while self._expected[state]:
+            progress.clear()
+            try:
+                await asyncio.wait_for(progress.wait(), self.client.guild_event_timeout)
+            except asyncio.TimeoutError:
+                state.wrapped_logger(
+                    logging.WARNING, f"{len(self._expected[state])} guilds were not received while resharding"
+                )
+                break
+        self._warm[state].set()
+
+    async def run(self) -> None:
+        """
+        Reshard the client.
+
+        Raises:
+            asyncio.TimeoutError: If the new shards weren't ready in time, the old shards are left running
+
+        """
+        client = self.client
+        old_states = list(client._connection_states)
+        start = time.perf_counter()
+        self.logger.info(f"Resharding from {client.total_shards} to {self.total_shards} shards")
+
+        self.states = [
+            ConnectionState(client, client.intents, shard_id, total_shards=self.total_shards)
+            for shard_id in range(self.total_shards)
+        ]
+        for state in self.states:
+            state.dispatch_filter = self._shadow_filter
+            self._warm[state] = asyncio.Event()
+            self._progress[state] = asyncio.Event()
+
+        client._start_shards(self.states)
+
+        # phase 1: connect the new shards without dispatching anything
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._wait_until_warm(state) for state in self.states)), self.timeout
+            )
+        except asyncio.TimeoutError:
+            self.logger.error("New shards were not ready in time, aborting resharding")
+            await asyncio.gather(*(state.stop(save_session=False) for state in self.states))
+            raise
+
+        # phase 2: both sets of shards deliver dispatches
+        for state in (*old_states, *self.states):
+            state.dispatch_filter = self._dedupe_filter
+        await asyncio.sleep(self.overlap)
+
+        # phase 3: switch to the new shards
+        for state in old_states:
+            state.dispatch_filter = self._drop_filter
+        for state in self.states:
+            # noinspection PyProtectedMember
+            state._shard_ready.set()
+        client._connection_states = self.states
+        client.total_shards = self.total_shards
+        client._index_guilds()
+
+        await asyncio.gather(*(state.stop(save_session=False) for state in old_states))
+        self.logger.info(
+            f"Resharded to {self.total_shards} shards in {time.perf_counter() - start:.1f}s, "
+            f"suppressing {self.suppressed} duplicate dispatches"
+        )
+
+        await asyncio.sleep(self.overlap)
+        for state in self.states:
+            state.dispatch_filter = None
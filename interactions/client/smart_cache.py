@@ -1,3 +1,5 @@
+import asyncio
+import time
 from contextlib import suppress
 from logging import Logger
 from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
@@ -208,13 +210,19 @@ class GlobalCache:
         """
         return self.member_cache.get((to_optional_snowflake(guild_id), to_optional_snowflake(user_id)))
 
-    def place_member_data(self, guild_id: "Snowflake_Type", data: discord_typings.GuildMemberData) -> Member:
+    def place_member_data(
+        self,
+        guild_id: "Snowflake_Type",
+        data: discord_typings.GuildMemberData,
+        changes: Optional[Dict[str, Any]] = None,
+    ) -> Member:
         """
         Take json data representing a User, process it, and cache it.
 
         Args:
             guild_id: The ID of the guild this member belongs to
             data: json representation of the member
+            changes: If given, and the member was already cached, the old values of the fields that changed are added to it
 
         Returns:
             The processed member
@@ -233,7 +241,7 @@ class GlobalCache:
             member = Member.from_dict(data, self._client)
             self.member_cache[(guild_id, user_id)] = member
         else:
-            member.update_from_dict(data)
+            member.update_from_dict(data, changes)
 
         self.place_user_guild(user_id, guild_id)
         if guild := self.guild_cache.get(guild_id):
@@ -418,12 +426,15 @@ class GlobalCache:
         """
         return self.message_cache.get((to_optional_snowflake(channel_id), to_optional_snowflake(message_id)))
 
-    def place_message_data(self, data: discord_typings.MessageData) -> Message:
+    def place_message_data(
+        self, data: discord_typings.MessageData, changes: Optional[Dict[str, Any]] = None
+    ) -> Message:
         """
         Take json data representing a message, process it, and cache it.
 
         Args:
             data: json representation of the message
+            changes: If given, and the message was already cached, the old values of the fields that changed are added to it
 
         Returns:
             The processed message
@@ -436,7 +447,7 @@ class GlobalCache:
             message = Message.from_dict(data, self._client)
             self.message_cache[(channel_id, message_id)] = message
         else:
-            message.update_from_dict(data)
+            message.update_from_dict(data, changes)
         return message
 
     def delete_message(self, channel_id: "Snowflake_Type", message_id: "Snowflake_Type") -> None:
@@ -489,12 +500,15 @@ class GlobalCache:
         """
         return self.channel_cache.get(to_optional_snowflake(channel_id))
 
-    def place_channel_data(self, data: discord_typings.ChannelData) -> "TYPE_ALL_CHANNEL":
+    def place_channel_data(
+        self, data: discord_typings.ChannelData, changes: Optional[Dict[str, Any]] = None
+    ) -> "TYPE_ALL_CHANNEL":
         """
         Take json data representing a channel, process it, and cache it.
 
         Args:
             data: json representation of the channel
+            changes: If given, and the channel was already cached, the old values of the fields that changed are added to it
 
         Returns:
             The processed channel
@@ -518,7 +532,7 @@ class GlobalCache:
                 self.channel_cache.pop(channel_id)
                 channel = BaseChannel.from_dict_factory(data, self._client)
             else:
-                channel.update_from_dict(data)
+                channel.update_from_dict(data, changes)
                 if guild := getattr(channel, "guild", None):
                     guild._channel_gui_positions = {}
 
@@ -630,12 +644,13 @@ class GlobalCache:
         """
         return self.guild_cache.get(to_optional_snowflake(guild_id))
 
-    def place_guild_data(self, data: discord_typings.GuildData) -> Guild:
+    def place_guild_data(self, data: discord_typings.GuildData, changes: Optional[Dict[str, Any]] = None) -> Guild:
         """
         Take json data representing a guild, process it, and cache it.
 
         Args:
             data: json representation of the guild
+            changes: If given, and the guild was already cached, the old values of the fields that changed are added to it
 
         Returns:
             The processed guild
@@ -647,7 +662,67 @@ class GlobalCache:
             guild = Guild.from_dict(data, self._client)
             self.guild_cache[guild_id] = guild
         else:
-            guild.update_from_dict(data)
+            guild.update_from_dict(data, changes)
+        return guild
+
+    async def hydrate_guild_data(self, data: discord_typings.GuildData, *, time_budget: float = 0.005) -> Guild:
+        """
+        Take json data representing a guild, and cache it incrementally.
+
+        The guild itself is cached immediately, its roles, channels, threads, members and voice states are then cached
+        in batches, yielding to the event loop whenever `time_budget` is used up. `Guild.hydrating` is True until
+        every object has been cached.
+
+        Args:
+            data: json representation of the guild
+            time_budget: How long to cache objects for before yielding to the event loop (seconds)
+
+        Returns:
+            The processed guild
+
+        """
+        guild_id = to_snowflake(data["id"])
+        objects = {
+            key: data.pop(key, None) or [] for key in ("roles", "channels", "threads", "members", "voice_states")
+        }
+
+        guild = self.place_guild_data(data)
+        guild.hydrating = True
+        deadline = time.perf_counter() + time_budget
+
+        async def checkpoint() -> bool:
+            nonlocal deadline
+            if time.perf_counter() >= deadline:
+                await asyncio.sleep(0)
+                deadline = time.perf_counter() + time_budget
+                # the guild may have been deleted while we yielded
+                return guild_id in self.guild_cache
+            return True
+
+        try:
+            for role_data in objects["roles"]:
+                guild._role_ids.update(self.place_role_data(guild_id, [role_data]).keys())
+                if not await checkpoint():
+                    return guild
+            for channel_data in objects["channels"]:
+                channel_data["guild_id"] = guild_id
+                self.place_channel_data(channel_data)
+                if not await checkpoint():
+                    return guild
+            for thread_data in objects["threads"]:
+                self.place_channel_data(thread_data)
+                if not await checkpoint():
+                    return guild
+            for member_data in objects["members"]:
+                self.place_member_data(guild_id, member_data)
+                if not await checkpoint():
+                    return guild
+            for voice_state in objects["voice_states"]:
+                await self.place_voice_state_data(voice_state | {"guild_id": guild_id})
+                if not await checkpoint():
+                    return guild
+        finally:
+            guild.hydrating = False
         return guild
 
     def delete_guild(self, guild_id: "Snowflake_Type") -> None:
@@ -0,0 +1,308 @@
+"""Snapshots of the client's cache, allowing the bot to start with a warm cache."""
+
+import asyncio
+import io
+import logging
+import mmap
+import os
+import pickle
+import sys
+import time
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from interactions.client.const import GLOBAL_SCOPE, MENTION_PREFIX, MISSING, Sentinel, __version__, get_logger
+from interactions.client.utils.cache import LazyCache, NullCache, TTLCache
+
+if TYPE_CHECKING:
+    from interactions.client import Client
+    from interactions.models.discord.snowflake import Snowflake_Type
+
+__all__ = ("SNAPSHOT_VERSION", "SNAPSHOT_CACHES", "CacheSnapshot")
+
+SNAPSHOT_VERSION = 2
+"""The version of the snapshot format. Snapshots with a different version are ignored"""
+
+SNAPSHOT_CACHES = ("user_cache", "member_cache", "channel_cache", "guild_cache", "role_cache")
+"""The caches included in a snapshot"""
+
+_SENTINELS = {type(sentinel).__name__: sentinel for sentinel in (MISSING, GLOBAL_SCOPE, MENTION_PREFIX)}
+
+
+class _SnapshotPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, client: "Client") -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.client = client
+
+    def persistent_id(self, obj: Any) -> Any:
+        # objects that belong to the running process are stored by reference, and recreated when loading
+        if obj is self.client:
+            return "client"
+        if isinstance(obj, asyncio.Event):
+            return "event", obj.is_set()
+        if isinstance(obj, Sentinel):
+            return "sentinel", type(obj).__name__
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, client: "Client") -> None:
+        super().__init__(file)
+        self.client = client
+
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == "client":
+            return self.client
+
+        kind, value = pid
+        if kind == "event":
+            event = asyncio.Event()
+            if value:
+                event.set()
+            return event
+        if kind == "sentinel":
+            return _SENTINELS[value]
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid!r}")
+
+
+class CacheSnapshot:
+    """
+    Saves the client's cache to disk, and restores it when the bot starts.
+
+    Objects are compressed individually, and located by an index stored after the header. Restoring a snapshot reads the
+    index and memory-maps the rest of the file, and objects are only read, decompressed and unpickled when they are first
+    accessed, so most of the cost of a large snapshot isn't paid at startup. Snapshots are only restored if they were created by the same
+    bot, with the same version of the library.
+
+    !!! warning
+        Snapshots are stored using pickle. Never load a snapshot from an untrusted source.
+
+    Args:
+        client: The client whose cache should be snapshotted
+        path: The file to store the snapshot in
+        interval: How often to save a snapshot while the bot is running (seconds). If None, a snapshot is only saved when the bot stops
+
+    """
+
+    def __init__(self, client: "Client", path: str | Path, *, interval: float | None = None) -> None:
+        self.client = client
+        self.path = Path(path)
+        self.interval = interval
+
+        self.restored_guild_ids: set["Snowflake_Type"] = set()
+        """The guilds restored from the snapshot that haven't been confirmed by the gateway yet"""
+
+        self._task: asyncio.Task | None = None
+        self.logger: logging.Logger = get_logger()
+
+    def _dump(self, obj: Any) -> bytes:
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, self.client).dump(obj)
+        return zlib.compress(buffer.getvalue(), 1)
+
+    def _load(self, data: bytes | memoryview) -> Any:
+        return _SnapshotUnpickler(io.BytesIO(zlib.decompress(data)), self.client).load()
+
+    async def _freeze_cache(self, cache: dict, batch_size: int = 500) -> list[tuple[Any, bytes]]:
+        frozen = []
+        for i, key in enumerate(list(cache)):
+            if i % batch_size == 0:
+                # let the event loop breathe while snapshotting large caches
+                await asyncio.sleep(0)
+
+            if isinstance(cache, LazyCache) and (data := cache.get_frozen(key)) is not None:
+                # this object was never materialized, so it can be stored as-is
+                frozen.append((key, data))
+                continue
+
+            try:
+                frozen.append((key, self._dump(cache[key])))
+            except KeyError:
+                # removed from the cache while we were yielding
+                continue
+            except Exception as e:
+                self.logger.debug(f"Unable to snapshot {key} from cache: {e!r}")
+        return frozen
+
+    async def save(self) -> int:
+        """
+        Save a snapshot of the cache.
+
+        Returns:
+            The number of objects in the snapshot
+
+        """
+        if not self.client.cache.guild_cache or not self.client.user:
+            # there's nothing worth saving, and we don't want to overwrite a good snapshot
+            return 0
+
+        start = time.perf_counter()
+        body = {name: await self._freeze_cache(getattr(self.client.cache, name)) for name in SNAPSHOT_CACHES}
+        header = {
+            "version": SNAPSHOT_VERSION,
+            "library_version": __version__,
+            "user_id": int(self.client.user.id),
+            "created_at": time.time(),
+            "counts": {name: len(entries) for name, entries in body.items()},
+        }
+
+        await asyncio.to_thread(self._write, header, body)
+
+        count = sum(header["counts"].values())
+        self.logger.debug(f"Saved cache snapshot of {count} objects in {time.perf_counter() - start:.2f}s")
+        return count
+
+    def _write(self, header: dict, body: dict) -> None:
+        # the index maps each object to its offset and length in the data that follows it
+        index = {}
+        offset = 0
+        for name, entries in body.items():
+            index[name] = []
+            for key, data in entries:
+                index[name].append((key, offset, len(data)))
+                offset += len(data)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_name(f"{self.path.name}.tmp")
+        with temp.open("wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            for entries in body.values():
+                for _, data in entries:
+                    f.write(data)
+        os.replace(temp, self.path)
+
+    def read_header(self) -> dict | None:
+        """
+        Read the header of the snapshot, without loading any objects.
+
+        Returns:
+            The header of the snapshot, or None if there is no usable snapshot
+
+        """
+        try:
+            with self.path.open("rb") as f:
+                header = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Unable to read cache snapshot {self.path}: {e!r}")
+            return None
+
+        if header.get("version") != SNAPSHOT_VERSION or header.get("library_version") != __version__:
+            self.logger.info("Cache snapshot was created by a different version of the library, ignoring it")
+            return None
+        if self.client.user and header.get("user_id") != int(self.client.user.id):
+            self.logger.warning("Cache snapshot was created by a different bot, ignoring it")
+            return None
+        return header
+
+    def load(self) -> int:
+        """
+        Restore the cache from the snapshot.
+
+        This should be called after logging in, but before connecting to the gateway.
+        Objects already in the cache take priority over those in the snapshot.
+
+        Returns:
+            The number of objects restored
+
+        """
+        header = self.read_header()
+        if header is None:
+            return 0
+
+        start = time.perf_counter()
+        try:
+            with self.path.open("rb") as f:
+                pickle.load(f)
+                index = pickle.load(f)
+                start_of_data = f.tell()
+                if sys.platform == "win32":
+                    # a mapped file can't be replaced on windows, which would stop the snapshot from being saved again
+                    data = memoryview(f.read())
+                else:
+                    # objects are sliced out of the mapped file, so those that are never accessed are never read
+                    data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))[start_of_data:]
+        except Exception as e:
+            self.logger.warning(f"Unable to read cache snapshot {self.path}: {e!r}")
+            return 0
+
+        count = 0
+        for name in SNAPSHOT_CACHES:
+            entries = index.get(name)
+            cache = getattr(self.client.cache, name)
+            if not entries or isinstance(cache, NullCache):
+                continue
+
+            if isinstance(cache, TTLCache) or not isinstance(cache, dict):
+                # caches with limits need to track every entry, so they're restored eagerly
+                for key, offset, length in entries:
+                    if key not in cache:
+                        cache[key] = self._load(data[offset : offset + length])
+                        count += 1
+                continue
+
+            lazy = cache if isinstance(cache, LazyCache) else LazyCache(self._load)
+            for key, offset, length in entries:
+                if key not in cache:
+                    lazy.freeze(key, data[offset : offset + length])
+                    count += 1
+            if lazy is not cache:
+                lazy.update(cache)
+                setattr(self.client.cache, name, lazy)
+
+        self.restored_guild_ids = set(self.client.cache.guild_cache)
+        if self.client.user:
+            self.client.user._add_guilds(set(self.restored_guild_ids))
+
+        self.logger.info(f"Restored {count} objects from cache snapshot in {time.perf_counter() - start:.2f}s")
+        return count
+
+    def discard_missing_guilds(
+        self, guild_ids: set["Snowflake_Type"], shard_id: int = 0, total_shards: int = 1
+    ) -> None:
+        """
+        Remove restored guilds that the gateway no longer reports, ie guilds the bot left while offline.
+
+        Args:
+            guild_ids: The guilds reported by the gateway for this shard
+            shard_id: The ID of the shard that reported these guilds
+            total_shards: The total number of shards
+
+        """
+        stale = {
+            guild_id
+            for guild_id in self.restored_guild_ids
+            if (guild_id >> 22) % total_shards == shard_id and guild_id not in guild_ids
+        }
+        for guild_id in stale:
+            self.client.cache.delete_guild(guild_id)
+            self.client.user._guild_ids.discard(guild_id)
+        if stale:
+            self.logger.debug(f"Discarded {len(stale)} guilds from the cache snapshot that are no longer available")
+        self.restored_guild_ids -= stale | guild_ids
+
+    def start(self) -> None:
+        """Start periodically saving snapshots, if an interval is set."""
+        if self.interval and self._task is None:
+            self._task = asyncio.create_task(self._periodic_save(), name="interactions:: cache snapshot")
+
+    async def stop(self) -> None:
+        """Stop periodically saving snapshots, and save a final snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        try:
+            await self.save()
+        except Exception as e:
+            self.logger.error(f"Failed to save cache snapshot: {e!r}")
+
+    async def _periodic_save(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.save()
+            except Exception as e:
+                self.logger.error(f"Failed to save cache snapshot: {e!r}")
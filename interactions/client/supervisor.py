@@ -0,0 +1,262 @@
+"""Shard health supervision, restarting unhealthy shards of an `AutoShardedClient` independently of each other."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from interactions.api import events
+from interactions.client.const import get_logger
+
+if TYPE_CHECKING:
+    from interactions.api.gateway.gateway import GatewayClient
+    from interactions.api.gateway.state import ConnectionState
+    from interactions.client.auto_shard_client import AutoShardedClient
+
+__all__ = ("ShardSupervisor",)
+
+
+class ShardSupervisor:
+    """
+    Watches the health of each shard, and restarts unhealthy shards with a fresh session.
+
+    A shard is unhealthy if:
+
+    - it has disconnected, and isn't reconnecting
+    - it hasn't received anything from discord for `stall_timeout` seconds
+    - its heartbeat latency was above `max_latency` for `latency_checks` checks in a row
+    - it received fewer than `min_event_rate` dispatches per second since the last check
+    - it reconnected `max_reconnects` times within `reconnect_window` seconds
+
+    `ShardUnhealthy`, `ShardHealthy` and `ShardRestart` events are dispatched, so shard health can be alerted on.
+    Shards are restarted one at a time, each once the previously restarted shard is ready again, with jittered
+    exponential backoff, so a shard that keeps failing doesn't hammer discord, and the other shards are never
+    interrupted.
+
+    ??? Hint "Example Usage:"
+        ```python
+        bot = AutoShardedClient(shard_supervisor=ShardSupervisor(max_latency=2))
+
+        @listen(ShardUnhealthy)
+        async def on_shard_unhealthy(event: ShardUnhealthy):
+            await alert(f"Shard {event.shard_id} is unhealthy: {', '.join(event.reasons)}")
+        ```
+
+    Args:
+        interval: How often to check the shards (seconds)
+        max_latency: The heartbeat latency above which a shard is unhealthy (seconds)
+        latency_checks: How many checks in a row the latency must be too high for
+        stall_timeout: How long a connected shard may go without receiving anything (seconds)
+        min_event_rate: The minimum dispatches per second, disabled by default as idle bots receive few events
+        max_reconnects: How many reconnects within `reconnect_window` make a shard unhealthy
+        reconnect_window: The window reconnects are counted in (seconds)
+        restart: Whether to restart unhealthy shards, or only dispatch health events
+        backoff_base: The delay before the first restart of a shard (seconds)
+        backoff_max: The maximum delay before restarting a shard (seconds)
+
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 10,
+        max_latency: float = 1,
+        latency_checks: int = 3,
+        stall_timeout: float = 90,
+        min_event_rate: float | None = None,
+        max_reconnects: int = 5,
+        reconnect_window: float = 300,
+        restart: bool = True,
+        backoff_base: float = 2,
+        backoff_max: float = 300,
+    ) -> None:
+        self.interval = interval
+        self.max_latency = max_latency
+        self.latency_checks = latency_checks
+        self.stall_timeout = stall_timeout
+        self.min_event_rate = min_event_rate
+        self.max_reconnects = max_reconnects
+        self.reconnect_window = reconnect_window
+        self.restart = restart
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.client: "AutoShardedClient | None" = None
+        self.restarts = 0
+        """The number of shard restarts"""
+
+        self._unhealthy: dict["ConnectionState", list[str]] = {}
+        self._latency_breaches: dict["ConnectionState", int] = {}
+        self._frames: dict["ConnectionState", tuple[int, float]] = {}
+        self._events: dict["ConnectionState", tuple[int, float]] = {}
+        self._attempts: dict["ConnectionState", int] = {}
+        self._restarted_at: dict["ConnectionState", float] = {}
+        # the shard currently being restarted, and the connection it had before the restart
+        self._restarting: "tuple[ConnectionState, GatewayClient | None] | None" = None
+        self._task: asyncio.Task | None = None
+        self.logger: logging.Logger = get_logger()
+
+    @property
+    def running(self) -> bool:
+        """Whether the supervisor is watching the shards."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def health(self) -> dict[int, dict]:
+        """
+        The health of every shard.
+
+        Returns:
+            {shard_id: health}
+
+        """
+        if self.client is None:
+            return {}
+        return {state.shard_id: self._get_health(state) for state in self.client.shards}
+
+    def start(self, client: "AutoShardedClient") -> None:
+        """
+        Start watching the shards of a client.
+
+        Args:
+            client: The client to supervise
+
+        """
+        self.client = client
+        if not self.running:
+            self._task = asyncio.create_task(self._run(), name="interactions:: shard supervisor")
+
+    def stop(self) -> None:
+        """Stop watching the shards."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _get_health(self, state: "ConnectionState") -> dict:
+        gateway = state.gateway
+        now = time.time()
+        since = max(now - self.reconnect_window, self._restarted_at.get(state, 0))
+        return {
+            "status": "unhealthy" if state in self._unhealthy else "healthy",
+            "reasons": self._unhealthy.get(state, []),
+            "connected": bool(gateway and gateway._ready.is_set()),
+            "latency": gateway.latency if gateway else float("inf"),
+            "events_per_second": state.telemetry.total_events_per_second,
+            "reconnects": sum(1 for timestamp, *_ in state.telemetry.reconnect_history if timestamp > since),
+            "restarts": self._attempts.get(state, 0),
+        }
+
+    def _check(self, state: "ConnectionState") -> list[str] | None:
+        """Get the reasons a shard is unhealthy, or None if it can't be judged right now."""
+        now = time.monotonic()
+        # noinspection PyProtectedMember
+        task = self.client._shard_tasks.get(state)
+        if task is None or task.done():
+            return ["disconnected"]
+
+        gateway = state.gateway
+        # noinspection PyProtectedMember
+        if not gateway or not gateway._ready.is_set() or not state._shard_ready.is_set():
+            # still connecting, which is covered by the identify retries and reconnect counts
+            self._frames.pop(state, None)
+            self._events.pop(state, None)
+            return None
+
+        reasons = []
+        telemetry = state.telemetry
+
+        frames, changed_at = self._frames.get(state, (-1, now))
+        if telemetry.frames != frames:
+            self._frames[state] = (telemetry.frames, now)
+        elif now - changed_at >= self.stall_timeout:
+            reasons.append(f"nothing received for {now - changed_at:.0f}s")
+
+        if gateway.latency != float("inf") and gateway.latency > self.max_latency:
+            self._latency_breaches[state] = self._latency_breaches.get(state, 0) + 1
+            if self._latency_breaches[state] >= self.latency_checks:
+                reasons.append(f"latency of {gateway.latency * 1000:.0f}ms")
+        else:
+            self._latency_breaches.pop(state, None)
+
+        if self.min_event_rate is not None:
+            total = sum(telemetry.events.values())
+            if (previous := self._events.get(state)) is not None:
+                rate = (total - previous[0]) / max(now - previous[1], 1e-9)
+                if rate < self.min_event_rate:
+                    reasons.append(f"{rate:.2f} events per second")
+            self._events[state] = (total, now)
+
+        health = self._get_health(state)
+        if health["reconnects"] >= self.max_reconnects:
+            reasons.append(f"{health['reconnects']} reconnects in {self.reconnect_window:.0f}s")
+
+        return reasons
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            # noinspection PyProtectedMember
+            if self.client._closed or self.client._reshard_lock.locked():
+                continue
+
+            for state in list(self.client.shards):
+                try:
+                    self._supervise(state)
+                except Exception as e:
+                    state.wrapped_logger(logging.ERROR, f"Failed to check shard health: {e!r}")
+
+    def _supervise(self, state: "ConnectionState") -> None:
+        reasons = self._check(state)
+        if reasons is None:
+            return
+
+        if not reasons:
+            if state in self._unhealthy:
+                del self._unhealthy[state]
+                state.wrapped_logger(logging.INFO, "Shard is healthy again")
+                self.client.dispatch(events.ShardHealthy(shard_id=state.shard_id, health=self._get_health(state)))
+            if time.time() - self._restarted_at.get(state, 0) > self.reconnect_window:
+                self._attempts.pop(state, None)
+            return
+
+        if state not in self._unhealthy:
+            state.wrapped_logger(logging.WARNING, f"Shard is unhealthy: {', '.join(reasons)}")
+            self.client.dispatch(
+                events.ShardUnhealthy(shard_id=state.shard_id, reasons=reasons, health=self._get_health(state))
+            )
+        self._unhealthy[state] = reasons
+
+        if self.restart and not self._restart_in_progress():
+            self._restart(state, reasons)
+
+    def _restart_in_progress(self) -> bool:
+        """Whether a restarted shard hasn't finished connecting yet."""
+        if self._restarting is None:
+            return False
+
+        state, previous = self._restarting
+        # noinspection PyProtectedMember
+        task = self.client._shard_tasks.get(state)
+        # noinspection PyProtectedMember
+        if task is None or task.done() or (state.gateway is not previous and state._shard_ready.is_set()):
+            self._restarting = None
+            return False
+        return True
+
+    def _restart(self, state: "ConnectionState", reasons: list[str]) -> None:
+        attempt = self._attempts.get(state, 0)
+        delay = min(self.backoff_base * 2**attempt, self.backoff_max) * random.uniform(0.5, 1)
+        self._attempts[state] = attempt + 1
+        self._restarted_at[state] = time.time()
+        self._latency_breaches.pop(state, None)
+        self._frames.pop(state, None)
+        self._events.pop(state, None)
+        self._restarting = (state, state.gateway)
+        self.restarts += 1
+
+        state.wrapped_logger(logging.WARNING, f"Restarting shard in {delay:.1f}s (attempt {attempt + 1})")
+        self.client.dispatch(
+            events.ShardRestart(shard_id=state.shard_id, reasons=reasons, attempt=attempt + 1, delay=delay)
+        )
+        self.client.restart_shard(state.shard_id, delay=delay)
@@ -0,0 +1,314 @@
+"""
+Tracing of the work done for each gateway dispatch, from the gateway through processors and commands to REST requests.
+
+A trace starts when a shard dispatches an event, and every span opened while handling it, including in the tasks it
+creates, shares the trace's ID so the time spent in each step can be correlated.
+"""
+
+import random
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from typing import Any, Coroutine, TypeVar
+
+import attrs
+
+from interactions.client.const import get_logger
+
+__all__ = (
+    "Span",
+    "SpanExporter",
+    "InMemorySpanExporter",
+    "OpenTelemetryExporter",
+    "Tracer",
+    "current_trace_id",
+    "span",
+    "traced",
+)
+
+T = TypeVar("T")
+
+_current_span: ContextVar["Span | None"] = ContextVar("_current_span", default=None)
+
+
+@attrs.define(eq=False, order=False, hash=False, kw_only=True)
+class Span:
+    """A timed step of handling a gateway dispatch."""
+
+    name: str = attrs.field()
+    """The name of this step"""
+    trace_id: str = attrs.field()
+    """The ID shared by every span of a trace, correlating them"""
+    span_id: str = attrs.field()
+    """The ID of this span"""
+    parent_id: str | None = attrs.field(default=None)
+    """The ID of the span this span was opened in, if any"""
+    attributes: dict[str, Any] = attrs.field(factory=dict)
+    """Details of this step"""
+    start_time: float = attrs.field(factory=time.time)
+    """When this span started, as a unix timestamp"""
+    duration: float | None = attrs.field(default=None)
+    """How long this span took (seconds), or None if it hasn't ended"""
+    error: str | None = attrs.field(default=None)
+    """The exception this span ended with, if any"""
+
+    tracer: "Tracer" = attrs.field(repr=False)
+    _start: float = attrs.field(repr=False, factory=time.perf_counter)
+    _token: Any = attrs.field(repr=False, default=None)
+
+    @property
+    def end_time(self) -> float | None:
+        """When this span ended, as a unix timestamp."""
+        return None if self.duration is None else self.start_time + self.duration
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set a detail of this step.
+
+        Args:
+            key: The name of the detail
+            value: The value of the detail
+
+        """
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        """End this span, exporting it."""
+        if self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        self.tracer._export(self)
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_val is not None:
+            self.error = repr(exc_val)
+        _current_span.reset(self._token)
+        self.end()
+
+
+class _NoSpan:
+    """Stands in for a span when nothing is being traced."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+class SpanExporter(ABC):
+    """Receives the spans of a tracer. Subclass this to send spans elsewhere."""
+
+    def start(self, span: Span) -> None:
+        """
+        Called when a span starts.
+
+        Args:
+            span: The span that started
+
+        """
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """
+        Called when a span ends.
+
+        Args:
+            span: The span that ended
+
+        """
+        ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """
+    Keeps ended spans in memory, for tests and debugging.
+
+    Args:
+        max_spans: The number of spans to keep, the oldest are discarded
+
+    """
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        self.max_spans = max_spans
+        self.spans: list[Span] = []
+        """The ended spans, oldest first"""
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+        if len(self.spans) > self.max_spans:
+            del self.spans[: len(self.spans) - self.max_spans]
+
+    def get_trace(self, trace_id: str) -> list[Span]:
+        """
+        Get the ended spans of a trace.
+
+        Args:
+            trace_id: The ID of the trace
+
+        Returns:
+            The spans of the trace, in the order they started
+
+        """
+        return sorted((span for span in self.spans if span.trace_id == trace_id), key=lambda span: span.start_time)
+
+    def clear(self) -> None:
+        """Discard every span."""
+        self.spans.clear()
+
+
+class OpenTelemetryExporter(SpanExporter):
+    """
+    Mirrors spans to OpenTelemetry, requires `opentelemetry-api` and a configured tracer provider.
+
+    Args:
+        tracer_name: The name of the OpenTelemetry tracer to use
+        max_parents: The number of span contexts kept so late spans can be parented, such as a processor's span which outlives the gateway's dispatch span
+
+    """
+
+    def __init__(self, tracer_name: str = "interactions.py", *, max_parents: int = 10_000) -> None:
+        try:
+            from opentelemetry import trace
+        except ModuleNotFoundError:
+            get_logger().error(
+                "opentelemetry-api not installed, cannot export traces to OpenTelemetry. "
+                "Install with `pip install opentelemetry-api`"
+            )
+            raise
+
+        self._trace = trace
+        self._tracer = trace.get_tracer(tracer_name)
+        self.max_parents = max_parents
+        self._spans: dict[str, Any] = {}
+        self._contexts: dict[str, Any] = {}
+
+    @staticmethod
+    def _attributes(span: Span) -> dict[str, str | bool | int | float]:
+        # opentelemetry only accepts primitive attributes
+        return {k: v for k, v in span.attributes.items() if isinstance(v, (str, bool, int, float))}
+
+    def start(self, span: Span) -> None:
+        context = None
+        if span.parent_id is not None and (parent := self._contexts.get(span.parent_id)) is not None:
+            context = self._trace.set_span_in_context(self._trace.NonRecordingSpan(parent))
+        otel_span = self._tracer.start_span(
+            span.name, context=context, attributes=self._attributes(span), start_time=int(span.start_time * 1e9)
+        )
+        self._spans[span.span_id] = otel_span
+        self._contexts[span.span_id] = otel_span.get_span_context()
+        if len(self._contexts) > self.max_parents:
+            del self._contexts[next(iter(self._contexts))]
+
+    def export(self, span: Span) -> None:
+        if (otel_span := self._spans.pop(span.span_id, None)) is None:
+            return
+        otel_span.set_attributes(self._attributes(span))
+        if span.error is not None:
+            otel_span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, span.error))
+        otel_span.end(end_time=int(span.end_time * 1e9))
+
+
+class Tracer:
+    """
+    Traces the handling of gateway dispatches, passing each span to an exporter.
+
+    ??? Hint "Example Usage:"
+        ```python
+        exporter = InMemorySpanExporter()
+        bot = Client(tracer=Tracer(exporter))
+        ```
+
+    Args:
+        exporter: Receives the spans
+
+    """
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.exporter = exporter
+        self.logger = get_logger()
+
+    def start_span(self, name: str, attributes: dict[str, Any] | None = None, *, root: bool = False) -> Span:
+        """
+        Start a span, in the current span's trace unless `root` is set.
+
+        Use the span as a context manager to make it the current span until it ends.
+
+        Args:
+            name: The name of the step
+            attributes: Details of the step
+            root: Start a new trace, rather than continuing the current one
+
+        Returns:
+            The started span
+
+        """
+        parent = None if root else _current_span.get()
+        new = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes or {},
+            tracer=self,
+        )
+        try:
+            self.exporter.start(new)
+        except Exception as e:
+            self.logger.error(f"Failed to start span {name}: {e!r}")
+        return new
+
+    def _export(self, span: Span) -> None:
+        try:
+            self.exporter.export(span)
+        except Exception as e:
+            self.logger.error(f"Failed to export span {span.name}: {e!r}")
+
+
+def span(name: str, **attributes: Any) -> Span | _NoSpan:
+    """
+    Open a span in the current trace, or do nothing if nothing is being traced.
+
+    Args:
+        name: The name of the step
+        **attributes: Details of the step
+
+    Returns:
+        A context manager for the span
+
+    """
+    if (parent := _current_span.get()) is None:
+        return _NO_SPAN
+    return parent.tracer.start_span(name, attributes)
+
+
+async def traced(name: str, coro: Coroutine[Any, Any, T], **attributes: Any) -> T:
+    """
+    Run a coroutine in a span of the current trace.
+
+    Args:
+        name: The name of the step
+        coro: The coroutine to run
+        **attributes: Details of the step
+
+    Returns:
+        The result of the coroutine
+
+    """
+    with span(name, **attributes):
+        return await coro
+
+
+def current_trace_id() -> str | None:
+    """Get the ID of the current trace, if anything is being traced."""
+    return current.trace_id if (current := _current_span.get()) else None
@@ -2,6 +2,7 @@ from .attr_utils import define, docs, field, str_validator
 from .cache import NullCache, TTLCache, TTLItem
 from .attr_converters import list_converter, optional, timestamp_converter
 from .input_utils import FastJson, get_args, get_first_word, response_decode, unpack_helper
+from .log_utils import LogSampler
 from .misc_utils import (
     escape_mentions,
     find,
@@ -63,6 +64,7 @@ __all__ = (
     "get_args",
     "get_first_word",
     "response_decode",
+    "LogSampler",
     "escape_mentions",
     "find",
     "find_all",
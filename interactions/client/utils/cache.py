@@ -5,7 +5,7 @@ from typing import Any, Callable, Generic, Iterator, Optional, Tuple, TypeVar
 
 import attrs
 
-__all__ = ("TTLItem", "TTLCache", "NullCache")
+__all__ = ("TTLItem", "TTLCache", "NullCache", "LazyCache")
 
 KT = TypeVar("KT")
 VT = TypeVar("VT")
@@ -131,6 +131,119 @@ class TTLCache(OrderedDict[KT, TTLItem[VT]]):
             self.on_expire(key, value)
 
 
+class _Frozen:
+    """A cached value that has not been materialized yet."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+
+class LazyCache(dict):
+    """
+    A cache whose values are materialized on first access.
+
+    Used to restore cache snapshots, so objects are only unpickled once they're needed.
+
+    Args:
+        loader: A callable that materializes a frozen value
+
+    """
+
+    def __init__(self, loader: Callable[[Any], Any]) -> None:
+        super().__init__()
+        self.loader = loader
+
+    @property
+    def frozen_count(self) -> int:
+        """The number of values that have not been materialized yet."""
+        return sum(isinstance(v, _Frozen) for v in super().values())
+
+    def freeze(self, key: KT, data: Any) -> None:
+        """
+        Store a value to be materialized when it is first accessed.
+
+        Args:
+            key: The key of the value
+            data: The data the loader will materialize the value from
+
+        """
+        super().__setitem__(key, _Frozen(data))
+
+    def get_frozen(self, key: KT) -> Any:
+        """
+        Get the data of a value that has not been materialized yet.
+
+        Args:
+            key: The key of the value
+
+        Returns:
+            The frozen data, or None if the value has been materialized
+
+        """
+        value = super().get(key)
+        return value.data if isinstance(value, _Frozen) else None
+
+    def _thaw(self, key: KT, value: Any) -> Any:
+        if isinstance(value, _Frozen):
+            value = self.loader(value.data)
+            super().__setitem__(key, value)
+        return value
+
+    def __getitem__(self, key: KT) -> VT:
+        return self._thaw(key, super().__getitem__(key))
+
+    def get(self, key: KT, default: Optional[VT] = None) -> VT:
+        value = super().get(key, _Frozen)
+        if value is _Frozen:
+            return default
+        return self._thaw(key, value)
+
+    def pop(self, key: KT, default=attrs.NOTHING) -> VT:
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+
+        if default is attrs.NOTHING:
+            raise KeyError(key)
+
+        return default
+
+    def setdefault(self, key: KT, default: Optional[VT] = None) -> VT:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def popitem(self) -> Tuple[KT, VT]:
+        key, value = super().popitem()
+        return key, self.loader(value.data) if isinstance(value, _Frozen) else value
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def values(self) -> ValuesView[VT]:
+        return _LazyValuesView(self)
+
+    def items(self) -> ItemsView:
+        return _LazyItemsView(self)
+
+
+class _LazyValuesView(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        # materializing a value replaces an existing key, which is safe during iteration
+        for key in self._mapping:
+            yield self._mapping[key]
+
+
+class _LazyItemsView(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        for key in self._mapping:
+            yield key, self._mapping[key]
+
+
 class _CacheValuesView(ValuesView):
     def __contains__(self, value) -> bool:
         for key in self._mapping:
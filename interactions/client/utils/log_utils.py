@@ -0,0 +1,52 @@
+from collections import Counter
+
+__all__ = ("LogSampler",)
+
+
+class LogSampler:
+    """
+    Samples high volume log messages, only logging 1 in N messages of a category.
+
+    The library samples these categories:
+
+    - `dispatch`: "Dispatching Event" debug messages
+    - `gateway`: Payloads sent to the gateway
+    - `http`: The ratelimit state after each successful request
+    - `ratelimit`: Warnings that a route or the bot has been ratelimited
+
+    ??? Hint "Example Usage:"
+        ```python
+        bot = Client(log_sampling={"ratelimit": 10, "dispatch": 100})
+        ```
+
+    Args:
+        rates: How many messages of each category are logged per message, as the N of 1 in N. Categories without a rate are always logged
+
+    """
+
+    def __init__(self, rates: dict[str, int] | None = None) -> None:
+        self.rates: dict[str, int] = dict(rates or {})
+        """The sampling rate of each category, as the N of 1 in N"""
+        self.suppressed: Counter[str] = Counter()
+        """The number of messages that were not logged, by category"""
+        self._counts: dict[str, int] = {}
+
+    def sample(self, category: str) -> bool:
+        """
+        Decide whether to log a message of a category.
+
+        Args:
+            category: The category of the message
+
+        Returns:
+            Whether the message should be logged
+
+        """
+        if (rate := self.rates.get(category, 1)) <= 1:
+            return True
+        count = self._counts.get(category, 0)
+        self._counts[category] = count + 1
+        if count % rate == 0:
+            return True
+        self.suppressed[category] += 1
+        return False
@@ -281,9 +281,7 @@ class PrefixedManager:
         if not message:
             try:
                 # i think 2 seconds is a very generous timeout limit
-                msg_event: MessageCreate = await self.client.wait_for(
-                    MessageCreate, checks=lambda e: int(e.message.id) == int(data["id"]), timeout=2
-                )
+                msg_event: MessageCreate = await self.client.wait_for(MessageCreate, key=int(data["id"]), timeout=2)
                 message = msg_event.message
             except TimeoutError:
                 return
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
 import attrs
 
@@ -40,12 +40,9 @@ class ClientObject(DictSerializationMixin):
     def from_list(cls: Type[T], datas: List[Dict[str, Any]], client: "Client") -> List[T]:
         return [cls.from_dict(data, client) for data in datas]
 
-    def update_from_dict(self, data) -> T:
+    def update_from_dict(self, data, changes: Optional[Dict[str, Any]] = None) -> T:
         data = self._process_dict(data, self._client)
-        for key, value in self._filter_kwargs(data, self._get_keys()).items():
-            setattr(self, key, value)
-
-        return self
+        return self._apply_dict(data, changes)
 
 
 @attrs.define(eq=False, order=False, hash=False, slots=False)
@@ -40,6 +40,7 @@ from .enums import (
     ForumLayoutType,
     ForumSortOrder,
     IntegrationExpireBehaviour,
+    Intents,
     MFALevel,
     NSFWLevel,
     Permissions,
@@ -260,6 +261,8 @@ class Guild(BaseGuild):
     """Stage instances in the guild."""
     chunked = attrs.field(repr=False, factory=asyncio.Event, metadata=no_export_meta)
     """An event that is fired when this guild has been chunked"""
+    hydrating: bool = attrs.field(repr=False, default=False, metadata=no_export_meta)
+    """True while this guild's channels, roles and members are still being cached from GUILD_CREATE"""
     command_permissions: dict[Snowflake_Type, CommandPermissions] = attrs.field(
         repr=False, factory=dict, metadata=no_export_meta
     )
@@ -535,6 +538,60 @@ class Guild(BaseGuild):
         """
         return self._client.cache.get_member(self.id, member_id)
 
+    async def resolve_members(
+        self, member_ids: List[Snowflake_Type], *, timeout: float = 10
+    ) -> Dict[Snowflake_Type, "models.Member"]:
+        """
+        Resolve many members of this guild at once.
+
+        Cached members are returned directly. The rest are requested over the gateway in batches of 100, falling back
+        to the REST API if the gateway doesn't respond in time.
+
+        ??? Hint "Example Usage:"
+            ```python
+            members = await guild.resolve_members([m.id for m in message.mentions])
+            ```
+
+        !!! note
+            Requesting members over the gateway requires the `GUILD_MEMBERS` intent, without it the REST API is used.
+
+        Args:
+            member_ids: The IDs of the members
+            timeout: How long to wait for each gateway request before falling back to the REST API (seconds)
+
+        Returns:
+            The members that were found, keyed by their ID. Members that aren't in this guild are omitted
+
+        """
+        resolved: Dict[Snowflake_Type, "models.Member"] = {}
+        missing: List[Snowflake_Type] = []
+        for member_id in dict.fromkeys(to_snowflake(m_id) for m_id in member_ids):
+            if member := self._client.cache.get_member(self.id, member_id):
+                resolved[member_id] = member
+            else:
+                missing.append(member_id)
+
+        if not missing:
+            return resolved
+
+        async def fetch(batch: List[Snowflake_Type]) -> None:
+            ws = self._client.get_guild_websocket(self.id)
+            if ws and Intents.GUILD_MEMBERS in ws.state.intents:
+                try:
+                    members, _ = await ws.request_members(self.id, batch, timeout=timeout)
+                except asyncio.TimeoutError:
+                    self.logger.debug(f"Timed out resolving members of {self.id} over the gateway, using REST")
+                else:
+                    resolved.update({member.id: member for member in members})
+                    return
+
+            for member in await asyncio.gather(*(self.fetch_member(member_id) for member_id in batch)):
+                if member is not None:
+                    resolved[member.id] = member
+
+        await asyncio.gather(*(fetch(missing[i : i + 100]) for i in range(0, len(missing), 100)))
+        return resolved
+
     async def fetch_owner(self, *, force: bool = False) -> "models.Member":
         """
         Return the Guild owner, fetching from the API if necessary.
@@ -711,7 +768,7 @@ class Guild(BaseGuild):
                 s = time.monotonic()
 
         total_time = time.perf_counter() - start_time
-        self.chunk_cache = []
+        self._chunk_cache = []
         self.logger.info(f"Cached members for {self.id} in {total_time:.2f} seconds")
         self.chunked.set()
 
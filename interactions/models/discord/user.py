@@ -367,11 +367,11 @@ class Member(DiscordObject, _SendDMMixin):
 
         return data
 
-    def update_from_dict(self, data) -> None:
+    def update_from_dict(self, data, changes: Optional[Dict[str, Any]] = None) -> None:
         if "guild_id" not in data:
             data["guild_id"] = self._guild_id
         data["_role_ids"] = data.pop("roles", [])
-        return super().update_from_dict(data)
+        return super().update_from_dict(data, changes)
 
     @property
     def user(self) -> "User":
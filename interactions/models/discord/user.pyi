@@ -120,7 +120,7 @@ class Member(FakeUserMixin):
     _user_ref: frozenset
     @classmethod
     def _process_dict(cls, data: Dict[str, Any], client: Client) -> Dict[str, Any]: ...
-    def update_from_dict(self, data) -> None: ...
+    def update_from_dict(self, data, changes: Optional[Dict[str, Any]] = None) -> None: ...
     @property
     def user(self) -> User: ...
     def __str__(self) -> str: ...
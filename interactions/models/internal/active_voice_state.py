@@ -118,9 +118,6 @@ class ActiveVoiceState(VoiceState):
         _ = asyncio.create_task(self._ws_connect())  # noqa: RUF006
         await self.ws.wait_until_ready()
 
-    def _guild_predicate(self, event) -> bool:
-        return int(event.data["guild_id"]) == self._guild_id
-
     async def connect(self, timeout: int = 5) -> None:
         """
         Establish the voice connection.
@@ -140,12 +137,8 @@ class ActiveVoiceState(VoiceState):
             raise RuntimeError("Cannot connect to voice without the GUILD_VOICE_STATES intent.")
 
         tasks = [
-            asyncio.create_task(
-                self._client.wait_for("raw_voice_state_update", self._guild_predicate, timeout=timeout)
-            ),
-            asyncio.create_task(
-                self._client.wait_for("raw_voice_server_update", self._guild_predicate, timeout=timeout)
-            ),
+            asyncio.create_task(self._client.wait_for("raw_voice_state_update", key=self._guild_id, timeout=timeout)),
+            asyncio.create_task(self._client.wait_for("raw_voice_server_update", key=self._guild_id, timeout=timeout)),
         ]
 
         await self.gateway.voice_state_update(self._guild_id, self._channel_id, self.self_mute, self.self_deaf)
@@ -184,7 +177,7 @@ class ActiveVoiceState(VoiceState):
 
             self.logger.debug("Waiting for voice connection data...")
             try:
-                await self._client.wait_for("raw_voice_state_update", self._guild_predicate, timeout=timeout)
+                await self._client.wait_for("raw_voice_state_update", key=self._guild_id, timeout=timeout)
             except asyncio.TimeoutError:
                 await self._close_connection()
                 raise VoiceConnectionTimeout from None
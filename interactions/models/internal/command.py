@@ -16,6 +16,7 @@ from typing import (
 
 import attrs
 
+from interactions.client import tracing
 from interactions.client.const import MISSING, AsyncCallable
 from interactions.client.errors import CommandOnCooldown, CommandCheckFailure, MaxConcurrencyReached
 from interactions.client.mixins.serialization import DictSerializationMixin
@@ -116,6 +117,11 @@ class BaseCommand(DictSerializationMixin, CallbackObject):
             kwargs: Any
 
         """
+        name = getattr(self, "resolved_name", None) or getattr(self, "name", None)
+        with tracing.span("command", command=str(name)):
+            await self._run(context, *args, **kwargs)
+
+    async def _run(self, context: "BaseContext", *args, **kwargs) -> None:
         # signals if a semaphore has been acquired, for exception handling
         # if present assume one will be acquired
         max_conc_acquired = self.max_concurrency is not MISSING
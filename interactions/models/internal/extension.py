@@ -174,7 +174,7 @@ class Extension:
                     if self.bot.interactions_by_scope.get(scope):
                         self.bot.interactions_by_scope[scope].pop(func.resolved_name, [])
         for func in self.listeners:
-            self.bot.listeners[func.event].remove(func)
+            self.bot.remove_listener(func)
 
         self.bot.ext.pop(self.name, None)
         self.bot.dispatch(events.ExtensionUnload(extension=self))
@@ -1,6 +1,6 @@
 import asyncio
 import inspect
-from typing import Callable
+from typing import Any, Callable, Iterator
 
 from interactions.api.events.internal import BaseEvent
 from interactions.client.const import MISSING, Absent, AsyncCallable
@@ -10,6 +10,28 @@ from interactions.models.internal.callback import CallbackObject
 __all__ = ("Listener", "listen")
 
 
+def _filter_values(value: Any) -> frozenset:
+    """Get the raw payload values a filter accepts, snowflakes are strings in payloads, but other integers aren't."""
+    values = set()
+    for v in value if isinstance(value, (list, tuple, set, frozenset)) else (value,):
+        if hasattr(v, "id"):
+            v = v.id
+        if isinstance(v, int) and not isinstance(v, bool):
+            values.add(str(v))
+            v = int(v)
+        values.add(v)
+    return frozenset(values)
+
+
+def _get_field(payload: dict, path: tuple[str, ...]) -> Any:
+    """Get a field of a raw payload by its path, or None if it doesn't exist or can't be matched."""
+    for part in path:
+        if not isinstance(payload, dict):
+            return None
+        payload = payload.get(part)
+    return None if isinstance(payload, (dict, list)) else payload
+
+
 class Listener(CallbackObject):
     event: str
     """Name of the event to listen to."""
@@ -21,6 +43,10 @@ class Listener(CallbackObject):
     """Whether this listener supersedes default listeners.  If true, any default listeners will be unregistered."""
     delay_until_ready: bool
     """whether to delay the event until the client is ready"""
+    inline: bool
+    """Whether this listener is called directly when the event is dispatched, rather than in a task"""
+    filters: dict[str, frozenset]
+    """The raw payload fields, and the values they must have, for this listener to be called"""
 
     def __init__(
         self,
@@ -31,17 +57,24 @@ class Listener(CallbackObject):
         is_default_listener: bool = False,
         disable_default_listeners: bool = False,
         pass_event_object: Absent[bool] = MISSING,
+        inline: bool = False,
+        filters: dict[str, Any] | None = None,
     ) -> None:
         super().__init__()
 
         if is_default_listener:
             disable_default_listeners = False
+        if inline and delay_until_ready:
+            raise ValueError("Inline listeners cannot be delayed until the client is ready")
 
         self.event = event
         self.callback = func
         self.delay_until_ready = delay_until_ready
         self.is_default_listener = is_default_listener
         self.disable_default_listeners = disable_default_listeners
+        self.inline = inline
+        self.filters = {key: _filter_values(value) for key, value in (filters or {}).items()}
+        self._filter_paths = [(tuple(key.split(".")), values) for key, values in self.filters.items()]
 
         self._params = inspect.signature(func).parameters.copy()
         self.pass_event_object = pass_event_object
@@ -50,6 +83,19 @@ class Listener(CallbackObject):
     def __repr__(self) -> str:
         return f"<Listener event={self.event!r} callback={self.callback!r}>"
 
+    def matches(self, payload: dict) -> bool:
+        """
+        Check if a raw gateway payload passes this listener's filters.
+
+        Args:
+            payload: The data of the gateway dispatch
+
+        Returns:
+            Whether the listener should be called
+
+        """
+        return all(_get_field(payload, path) in values for path, values in self._filter_paths)
+
     @classmethod
     def create(
         cls,
@@ -58,6 +104,8 @@ class Listener(CallbackObject):
         delay_until_ready: bool = False,
         is_default_listener: bool = False,
         disable_default_listeners: bool = False,
+        inline: bool = False,
+        filters: dict[str, Any] | None = None,
     ) -> Callable[[AsyncCallable], "Listener"]:
         """
         Decorator for creating an event listener.
@@ -67,7 +115,8 @@ class Listener(CallbackObject):
             delay_until_ready: Whether to delay the listener until the client is ready.
             is_default_listener: Whether this listener is provided automatically by the library, and might be unwanted by users.
             disable_default_listeners: Whether this listener supersedes default listeners.  If true, any default listeners will be unregistered.
-
+            inline: Call the listener directly when the event is dispatched, without creating a task. Inline listeners must be regular functions that don't block.
+            filters: Only call the listener if these fields of the raw gateway payload have these values, e.g. `{"channel_id": LOG_CHANNEL}`. Nested fields are separated by dots, e.g. `author.id`, and a list of values matches any of them.
 
         Returns:
             A listener object.
@@ -75,7 +124,10 @@ class Listener(CallbackObject):
         """
 
         def wrapper(coro: AsyncCallable) -> "Listener":
-            if not asyncio.iscoroutinefunction(coro):
+            if inline:
+                if asyncio.iscoroutinefunction(coro):
+                    raise TypeError("Inline listeners must not be coroutines")
+            elif not asyncio.iscoroutinefunction(coro):
                 raise TypeError("Listener must be a coroutine")
 
             name = event_name
@@ -99,10 +151,18 @@ class Listener(CallbackObject):
                 delay_until_ready=delay_until_ready,
                 is_default_listener=is_default_listener,
                 disable_default_listeners=disable_default_listeners,
+                inline=inline,
+                filters=filters,
             )
 
         return wrapper
 
+    def call_inline(self, *args, **kwargs) -> Any:
+        """Call an inline listener's callback."""
+        if self._binding:
+            return self.callback(self._binding, *args, **kwargs)
+        return self.callback(*args, **kwargs)
+
     def lazy_parse_params(self):
         """Process the parameters of this listener."""
         if self.pass_event_object is not MISSING:
@@ -121,6 +181,8 @@ def listen(
     delay_until_ready: bool = False,
     is_default_listener: bool = False,
     disable_default_listeners: bool = False,
+    inline: bool = False,
+    filters: dict[str, Any] | None = None,
 ) -> Callable[[AsyncCallable], Listener]:
     """
     Decorator to make a function an event listener.
@@ -130,6 +192,8 @@ def listen(
         delay_until_ready: Whether to delay the listener until the client is ready.
         is_default_listener: Whether this listener is provided automatically by the library, and might be unwanted by users.
         disable_default_listeners: Whether this listener supersedes default listeners.  If true, any default listeners will be unregistered.
+        inline: Call the listener directly when the event is dispatched, without creating a task. Inline listeners must be regular functions that don't block.
+        filters: Only call the listener if these fields of the raw gateway payload have these values, e.g. `{"channel_id": LOG_CHANNEL}`. Nested fields are separated by dots, e.g. `author.id`, and a list of values matches any of them.
 
 
     Returns:
@@ -141,4 +205,79 @@ def listen(
         delay_until_ready=delay_until_ready,
         is_default_listener=is_default_listener,
         disable_default_listeners=disable_default_listeners,
+        inline=inline,
+        filters=filters,
     )
+
+
+class FilteredListeners:
+    """
+    The filtered listeners of an event, indexed by the values of their first filter.
+
+    Matching a payload costs a lookup per distinct indexed field, rather than a check per listener.
+
+    """
+
+    def __init__(self) -> None:
+        self.listeners: list[Listener] = []
+        self._index: dict[tuple[str, ...], dict[Any, list[Listener]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.listeners)
+
+    def __iter__(self) -> Iterator[Listener]:
+        return iter(self.listeners)
+
+    def __contains__(self, listener: Listener) -> bool:
+        return listener in self.listeners
+
+    def add(self, listener: Listener) -> None:
+        """
+        Add a filtered listener.
+
+        Args:
+            listener: The listener to add
+
+        """
+        # noinspection PyProtectedMember
+        path, values = listener._filter_paths[0]
+        index = self._index.setdefault(path, {})
+        for value in values:
+            index.setdefault(value, []).append(listener)
+        self.listeners.append(listener)
+
+    def remove(self, listener: Listener) -> None:
+        """
+        Remove a filtered listener.
+
+        Args:
+            listener: The listener to remove
+
+        """
+        self.listeners.remove(listener)
+        # noinspection PyProtectedMember
+        path, values = listener._filter_paths[0]
+        index = self._index[path]
+        for value in values:
+            index[value].remove(listener)
+            if not index[value]:
+                del index[value]
+        if not index:
+            del self._index[path]
+
+    def match(self, payload: dict) -> list[Listener]:
+        """
+        Get the listeners whose filters a raw gateway payload passes.
+
+        Args:
+            payload: The data of the gateway dispatch
+
+        Returns:
+            The matching listeners
+
+        """
+        matched = []
+        for path, index in self._index.items():
+            if candidates := index.get(_get_field(payload, path)):
+                matched.extend(listener for listener in candidates if listener.matches(payload))
+        return matched
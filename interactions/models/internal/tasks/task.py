@@ -90,9 +90,9 @@ class Task:
     def _fire(self, fire_time: datetime, *args, **kwargs) -> asyncio.Task:
         """Called when the task is being fired."""
         self.trigger.set_last_call_time(fire_time)
-        task = asyncio.create_task(self(*args, **kwargs))
+        # incremented first, as an eager task factory runs the callback before create_task returns
         self.iteration += 1
-        return task
+        return asyncio.create_task(self(*args, **kwargs))
 
     async def _task_loop(self, *args, **kwargs) -> None:
         """The main task loop to fire the task at the specified time based on triggers configured."""
@@ -15,7 +15,8 @@ class Wait:
         self.future: Future = future
 
     async def __call__(self, *args, **kwargs) -> bool:
-        if self.future.cancelled():
+        if self.future.done():
+            # cancelled, or already resolved through another key
             return True
 
         if self.check:
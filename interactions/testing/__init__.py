@@ -0,0 +1,4 @@
+from .benchmarks import benchmark_dispatch, run_benchmarks
+from .fake_discord import FakeDiscord, FakeGatewaySession
+
+__all__ = ("benchmark_dispatch", "run_benchmarks", "FakeDiscord", "FakeGatewaySession")
@@ -0,0 +1,584 @@
+import asyncio
+import contextlib
+import itertools
+import time
+import uuid
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from interactions.client.const import DISCORD_EPOCH, __api_version__, get_logger
+from interactions.client.utils.input_utils import FastJson
+from interactions.models.discord.enums import WebSocketOPCode as OPCODE
+
+__all__ = ("FakeDiscord", "FakeGatewaySession")
+
+
+class _FakeConnection:
+    """A websocket connection to the fake gateway, with its own zlib stream."""
+
+    def __init__(self, ws: web.WebSocketResponse, compress: bool) -> None:
+        self.ws = ws
+        self._compressor = zlib.compressobj() if compress else None
+        self._lock = asyncio.Lock()
+
+    async def send(self, payload: dict) -> None:
+        if self.ws.closed:
+            return
+        async with self._lock:
+            data = FastJson.dumps(payload)
+            if self._compressor is not None:
+                frame = self._compressor.compress(data.encode("utf-8")) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+                await self.ws.send_bytes(frame)
+            else:
+                await self.ws.send_str(data)
+
+
+class FakeGatewaySession:
+    """A gateway session on the fake server, which may outlive the connection that created it."""
+
+    def __init__(self, shard: tuple[int, int]) -> None:
+        self.session_id = uuid.uuid4().hex
+        self.shard = shard
+        self.sequence = 0
+        self.connection: _FakeConnection | None = None
+
+        # dispatches are kept so they can be replayed when this session is resumed
+        self.history: deque[dict] = deque(maxlen=5000)
+
+    @property
+    def connected(self) -> bool:
+        """Whether this session has an open websocket."""
+        return self.connection is not None and not self.connection.ws.closed
+
+    async def send(self, payload: dict) -> None:
+        """Send a payload over this session's websocket."""
+        if self.connected:
+            await self.connection.send(payload)
+
+    async def dispatch(self, event: str, data: dict) -> None:
+        """Send a dispatch, recording it so it can be replayed on resume."""
+        self.sequence += 1
+        payload = {"op": OPCODE.DISPATCH, "t": event, "s": self.sequence, "d": data}
+        self.history.append(payload)
+        await self.send(payload)
+
+
+class FakeDiscord:
+    """
+    A local server that imitates discord's gateway, and the handful of REST endpoints needed to start a client.
+
+    It supports HELLO, IDENTIFY/READY, heartbeats, RESUME, RECONNECT, INVALID_SESSION, member chunking and
+    zlib-stream compression, and generates synthetic guilds, members and message traffic. This is intended for
+    benchmarking and testing clients without connecting to discord.
+
+    ??? Hint "Example Usage:"
+        ```python
+        async with FakeDiscord(guilds=100, members_per_guild=500, message_rate=1000) as fake:
+            client = AutoShardedClient(
+                token=fake.token, total_shards=4, api_url=fake.api_url, gateway_url=fake.gateway_url
+            )
+            await client.astart()
+        ```
+
+    Args:
+        guilds: The number of guilds the bot is in
+        members_per_guild: The number of members in each guild
+        channels_per_guild: The number of text channels in each guild
+        message_rate: The number of messages to send to each shard per second
+        shards: The number of shards `/gateway/bot` recommends
+        max_concurrency: The max concurrency `/gateway/bot` reports
+        heartbeat_interval: The heartbeat interval sent in HELLO (seconds)
+        large_threshold: Guilds with more members than this only send the bot's member in GUILD_CREATE
+        token: The token the server accepts
+        host: The host to listen on
+        port: The port to listen on, 0 picks a free port
+
+    """
+
+    def __init__(
+        self,
+        *,
+        guilds: int = 10,
+        members_per_guild: int = 50,
+        channels_per_guild: int = 5,
+        message_rate: float = 0,
+        shards: int = 1,
+        max_concurrency: int = 1,
+        heartbeat_interval: float = 41.25,
+        large_threshold: int = 250,
+        token: str = "fake-token",
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.guild_count = guilds
+        self.members_per_guild = members_per_guild
+        self.channels_per_guild = channels_per_guild
+        self.message_rate = message_rate
+        self.shards = shards
+        self.max_concurrency = max_concurrency
+        self.heartbeat_interval = heartbeat_interval
+        self.large_threshold = large_threshold
+        self.token = token
+        self.host = host
+        self.port = port
+
+        self.sessions: dict[str, FakeGatewaySession] = {}
+        self.stats: dict[str, int] = dict.fromkeys(
+            ("connections", "identifies", "resumes", "invalid_sessions", "heartbeats", "messages", "member_requests"), 0
+        )
+
+        self._ids = itertools.count()
+        self._start_ms = int(time.time() * 1000) - DISCORD_EPOCH - 10_000_000
+        self.bot_user = self._user(self._snowflake(), "fake-bot", bot=True)
+        self.application_id = self._snowflake()
+        self.guilds: list[dict] = [self._generate_guild(i) for i in range(guilds)]
+
+        self._runner: web.AppRunner | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.logger = get_logger()
+
+    # region Synthetic data
+
+    def _snowflake(self, timestamp_offset: int = 0) -> str:
+        return str(((self._start_ms + timestamp_offset) << 22) | (next(self._ids) & 0xFFF))
+
+    @staticmethod
+    def _user(user_id: str, username: str, bot: bool = False) -> dict:
+        return {
+            "id": user_id,
+            "username": username,
+            "discriminator": "0",
+            "global_name": None,
+            "avatar": None,
+            "bot": bot,
+            "verified": True,
+            "mfa_enabled": False,
+        }
+
+    def _member(self, user: dict) -> dict:
+        return {
+            "user": user,
+            "roles": [],
+            "joined_at": datetime.now(tz=timezone.utc).isoformat(),
+            "deaf": False,
+            "mute": False,
+            "flags": 0,
+        }
+
+    def _generate_guild(self, index: int) -> dict:
+        # guild ids are spread across timestamps, so guilds are spread evenly across shards
+        guild_id = self._snowflake(timestamp_offset=index)
+        members = [self._member(self.bot_user)]
+        members += [
+            self._member(self._user(self._snowflake(), f"user-{index}-{i}")) for i in range(self.members_per_guild - 1)
+        ]
+        channels = [
+            {
+                "id": self._snowflake(),
+                "type": 0,
+                "name": f"channel-{i}",
+                "position": i,
+                "permission_overwrites": [],
+                "nsfw": False,
+                "topic": None,
+                "last_message_id": None,
+                "rate_limit_per_user": 0,
+                "parent_id": None,
+            }
+            for i in range(self.channels_per_guild)
+        ]
+        return {
+            "id": guild_id,
+            "name": f"guild-{index}",
+            "icon": None,
+            "splash": None,
+            "discovery_splash": None,
+            "owner_id": self.bot_user["id"],
+            "afk_channel_id": None,
+            "afk_timeout": 300,
+            "verification_level": 0,
+            "default_message_notifications": 0,
+            "explicit_content_filter": 0,
+            "roles": [
+                {
+                    "id": guild_id,
+                    "name": "@everyone",
+                    "color": 0,
+                    "hoist": False,
+                    "position": 0,
+                    "permissions": "0",
+                    "managed": False,
+                    "mentionable": False,
+                    "flags": 0,
+                }
+            ],
+            "emojis": [],
+            "stickers": [],
+            "features": [],
+            "mfa_level": 0,
+            "system_channel_id": None,
+            "system_channel_flags": 0,
+            "rules_channel_id": None,
+            "vanity_url_code": None,
+            "description": None,
+            "banner": None,
+            "premium_tier": 0,
+            "preferred_locale": "en-US",
+            "public_updates_channel_id": None,
+            "nsfw_level": 0,
+            "premium_progress_bar_enabled": False,
+            "member_count": len(members),
+            "large": len(members) > self.large_threshold,
+            "joined_at": datetime.now(tz=timezone.utc).isoformat(),
+            "unavailable": False,
+            "channels": channels,
+            "threads": [],
+            "voice_states": [],
+            "presences": [],
+            "stage_instances": [],
+            "guild_scheduled_events": [],
+            "_members": members,
+        }
+
+    def guilds_for_shard(self, shard: tuple[int, int]) -> list[dict]:
+        """
+        Get the guilds that belong to a shard.
+
+        Args:
+            shard: The shard's ID and the total number of shards
+
+        Returns:
+            The guilds of the shard
+
+        """
+        shard_id, total_shards = shard
+        return [guild for guild in self.guilds if (int(guild["id"]) >> 22) % total_shards == shard_id]
+
+    def guild_create_payload(self, guild: dict) -> dict:
+        """
+        Get the GUILD_CREATE payload of a guild.
+
+        Args:
+            guild: The guild
+
+        Returns:
+            The payload
+
+        """
+        payload = {k: v for k, v in guild.items() if k != "_members"}
+        payload["members"] = guild["_members"][: 1 if guild["large"] else None]
+        return payload
+
+    def message_payload(self, guild: dict) -> dict:
+        """
+        Generate a MESSAGE_CREATE payload in a guild.
+
+        Args:
+            guild: The guild to send the message in
+
+        Returns:
+            The payload
+
+        """
+        member = guild["_members"][next(self._ids) % len(guild["_members"])]
+        channel = guild["channels"][next(self._ids) % len(guild["channels"])]
+        return {
+            "id": self._snowflake(),
+            "type": 0,
+            "channel_id": channel["id"],
+            "guild_id": guild["id"],
+            "author": member["user"],
+            "member": {k: v for k, v in member.items() if k != "user"},
+            "content": "Hello world",
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+        }
+
+    # endregion Synthetic data
+
+    @property
+    def url(self) -> str:
+        """The base url of this server."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def api_url(self) -> str:
+        """The url of the fake REST api."""
+        return f"{self.url}/api/v{__api_version__}"
+
+    @property
+    def gateway_url(self) -> str:
+        """The url of the fake gateway."""
+        return f"ws://{self.host}:{self.port}/gateway"
+
+    async def start(self) -> None:
+        """Start the server."""
+        app = web.Application()
+        app.router.add_get("/gateway", self._handle_gateway)
+        app.router.add_route("*", "/api/v{version}/{path:.*}", self._handle_api)
+
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop the server, closing every connection."""
+        for task in self._tasks:
+            task.cancel()
+        for session in self.sessions.values():
+            if session.connected:
+                await session.connection.ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeDiscord":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.stop()
+
+    # region Control
+
+    async def reconnect_all(self) -> None:
+        """Ask every connected session to reconnect."""
+        for session in list(self.sessions.values()):
+            await session.send({"op": OPCODE.RECONNECT, "d": None})
+
+    async def invalidate_all(self, resumable: bool = False) -> None:
+        """
+        Invalidate every connected session.
+
+        Args:
+            resumable: Whether the sessions may be resumed
+
+        """
+        for session in list(self.sessions.values()):
+            if not resumable:
+                self.sessions.pop(session.session_id, None)
+            await session.send({"op": OPCODE.INVALIDATE_SESSION, "d": resumable})
+            self.stats["invalid_sessions"] += 1
+
+    async def disconnect_all(self, code: int = 4000) -> None:
+        """
+        Close every connection, as discord does during an outage.
+
+        Args:
+            code: The close code to send
+
+        """
+        for session in list(self.sessions.values()):
+            if session.connected:
+                await session.connection.ws.close(code=code)
+
+    # endregion Control
+
+    # region Gateway
+
+    async def _handle_gateway(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        self.stats["connections"] += 1
+
+        connection = _FakeConnection(ws, request.query.get("compress") == "zlib-stream")
+        await connection.send({"op": OPCODE.HELLO, "d": {"heartbeat_interval": int(self.heartbeat_interval * 1000)}})
+
+        session: FakeGatewaySession | None = None
+        traffic: asyncio.Task | None = None
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                payload = FastJson.loads(msg.data)
+                match payload["op"]:
+                    case OPCODE.HEARTBEAT:
+                        self.stats["heartbeats"] += 1
+                        await connection.send({"op": OPCODE.HEARTBEAT_ACK})
+
+                    case OPCODE.IDENTIFY:
+                        if payload["d"]["token"] != self.token:
+                            await ws.close(code=4004)
+                            break
+                        session = FakeGatewaySession(tuple(payload["d"].get("shard", (0, 1))))
+                        session.connection = connection
+                        self.sessions[session.session_id] = session
+                        self.stats["identifies"] += 1
+                        await self._ready(session)
+                        traffic = self._spawn(self._generate_traffic(session))
+
+                    case OPCODE.RESUME:
+                        resumed = self.sessions.get(payload["d"]["session_id"])
+                        if resumed is None or payload["d"]["token"] != self.token:
+                            await connection.send({"op": OPCODE.INVALIDATE_SESSION, "d": False})
+                            self.stats["invalid_sessions"] += 1
+                            continue
+                        session = resumed
+                        session.connection = connection
+                        self.stats["resumes"] += 1
+                        # replay everything the client missed
+                        for missed in [p for p in session.history if p["s"] > (payload["d"]["seq"] or 0)]:
+                            await session.send(missed)
+                        await session.dispatch("RESUMED", {})
+                        traffic = self._spawn(self._generate_traffic(session))
+
+                    case OPCODE.REQUEST_MEMBERS if session is not None:
+                        self.stats["member_requests"] += 1
+                        self._spawn(self._send_member_chunks(session, payload["d"]))
+
+                    case _:
+                        pass
+        finally:
+            if traffic is not None:
+                traffic.cancel()
+        return ws
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _ready(self, session: FakeGatewaySession) -> None:
+        guilds = self.guilds_for_shard(session.shard)
+        await session.dispatch(
+            "READY",
+            {
+                "v": __api_version__,
+                "user": self.bot_user,
+                "guilds": [{"id": guild["id"], "unavailable": True} for guild in guilds],
+                "session_id": session.session_id,
+                "resume_gateway_url": self.gateway_url,
+                "shard": list(session.shard),
+                "application": {"id": self.application_id, "flags": 0},
+            },
+        )
+        for guild in guilds:
+            await session.dispatch("GUILD_CREATE", self.guild_create_payload(guild))
+
+    async def _send_member_chunks(self, session: FakeGatewaySession, data: dict) -> None:
+        guild = next((g for g in self.guilds if g["id"] == str(data["guild_id"])), None)
+        if guild is None:
+            return
+
+        members = guild["_members"]
+        not_found = []
+        if user_ids := data.get("user_ids"):
+            user_ids = {str(user_id) for user_id in user_ids}
+            members = [m for m in members if m["user"]["id"] in user_ids]
+            not_found = list(user_ids - {m["user"]["id"] for m in members})
+        elif query := data.get("query"):
+            members = [m for m in members if m["user"]["username"].startswith(query)]
+        if limit := data.get("limit"):
+            members = members[:limit]
+
+        chunks = [members[i : i + 1000] for i in range(0, len(members), 1000)] or [[]]
+        for index, chunk in enumerate(chunks):
+            payload = {
+                "guild_id": guild["id"],
+                "members": chunk,
+                "chunk_index": index,
+                "chunk_count": len(chunks),
+            }
+            if not_found and index == 0:
+                payload["not_found"] = not_found
+            if data.get("nonce"):
+                payload["nonce"] = data["nonce"]
+            await session.dispatch("GUILD_MEMBERS_CHUNK", payload)
+
+    async def _generate_traffic(self, session: FakeGatewaySession) -> None:
+        guilds = self.guilds_for_shard(session.shard)
+        if not self.message_rate or not guilds:
+            return
+
+        tick = 0.01
+        pending = 0.0
+        last = time.perf_counter()
+        while session.connected:
+            await asyncio.sleep(tick)
+            now = time.perf_counter()
+            pending += (now - last) * self.message_rate
+            last = now
+
+            while pending >= 1 and session.connected:
+                pending -= 1
+                guild = guilds[next(self._ids) % len(guilds)]
+                with contextlib.suppress(ConnectionError):
+                    await session.dispatch("MESSAGE_CREATE", self.message_payload(guild))
+                self.stats["messages"] += 1
+
+    # endregion Gateway
+
+    # region REST
+
+    @staticmethod
+    def _json(data: Any, status: int = 200) -> web.Response:
+        # discord's content type has no charset, which the http client relies on
+        return web.Response(
+            body=FastJson.dumps(data).encode("utf-8"), status=status, headers={"Content-Type": "application/json"}
+        )
+
+    async def _handle_api(self, request: web.Request) -> web.Response:
+        path = "/" + request.match_info["path"]
+        method = request.method
+
+        if request.headers.get("Authorization") != f"Bot {self.token}":
+            return self._json({"message": "401: Unauthorized", "code": 0}, status=401)
+
+        match method, path:
+            case "GET", "/users/@me":
+                return self._json(self.bot_user)
+            case "GET", "/oauth2/applications/@me" | "/applications/@me":
+                return self._json(
+                    {
+                        "id": self.application_id,
+                        "name": self.bot_user["username"],
+                        "icon": None,
+                        "description": "",
+                        "summary": "",
+                        "bot_public": True,
+                        "bot_require_code_grant": False,
+                        "verify_key": "",
+                        "owner": self.bot_user,
+                        "flags": 0,
+                    }
+                )
+            case "GET", "/gateway":
+                return self._json({"url": self.gateway_url})
+            case "GET", "/gateway/bot":
+                return self._json(
+                    {
+                        "url": self.gateway_url,
+                        "shards": self.shards,
+                        "session_start_limit": {
+                            "total": 1000,
+                            "remaining": 1000,
+                            "reset_after": 0,
+                            "max_concurrency": self.max_concurrency,
+                        },
+                    }
+                )
+
+        if path.startswith(f"/applications/{self.application_id}/") and "commands" in path:
+            # application commands are accepted, but never stored
+            if method == "GET":
+                return self._json([])
+            if method == "PUT":
+                return self._json(await request.json())
+
+        return self._json({"message": "404: Not Found", "code": 0}, status=404)
+
+    # endregion REST
@@ -1,12 +1,33 @@
+import asyncio
+import copy
+import mmap
+import sys
+
 import discord_typings
 import pytest
 
+from interactions.api.events import GuildUpdate, RawGatewayEvent
 from interactions.client.client import Client
+from interactions.client.utils.cache import LazyCache
+from interactions.models.internal.listener import Listener
 from interactions.models.discord.channel import DM, GuildText
+from interactions.models.discord.guild import Guild
+from interactions.models.discord.user import ClientUser
 from interactions.models.discord.snowflake import to_snowflake
+from interactions.testing import FakeDiscord
 from tests.consts import SAMPLE_DM_DATA, SAMPLE_GUILD_DATA, SAMPLE_USER_DATA
 
-__all__ = ("bot", "test_dm_channel", "test_get_user_from_dm", "test_guild_channel", "test_update_guild")
+__all__ = (
+    "bot",
+    "test_dm_channel",
+    "test_get_user_from_dm",
+    "test_guild_channel",
+    "test_update_guild",
+    "test_update_guild_changes",
+    "test_update_guild_lazy_before",
+    "test_cache_snapshot",
+    "test_hydrate_guild",
+)
 
 
 @pytest.fixture()
@@ -56,3 +77,111 @@ def test_update_guild(bot: Client) -> None:
     data["mfa_level"] = 1
     bot.cache.place_guild_data(data)
     assert guild.mfa_level == 1
+
+
+@pytest.mark.asyncio
+async def test_update_guild_changes(bot: Client) -> None:
+    guild = bot.cache.place_guild_data(SAMPLE_GUILD_DATA())
+    updates = []
+    bot.add_listener(Listener.create(GuildUpdate, inline=True)(updates.append))
+
+    data = SAMPLE_GUILD_DATA()
+    data["mfa_level"] = 1
+    await bot._on_raw_guild_update.callback(bot, RawGatewayEvent(data, override_name="raw_guild_update"))
+    await bot._on_raw_guild_update.callback(bot, RawGatewayEvent(data, override_name="raw_guild_update"))
+    data = data | {"description": "updated"}
+    await bot._on_raw_guild_update.callback(bot, RawGatewayEvent(data, override_name="raw_guild_update"))
+
+    assert updates[0].after is guild
+    assert updates[0].changes == {"mfa_level": 0}
+    assert (updates[0].before.mfa_level, updates[0].before.name) == (0, guild.name)
+    assert updates[0].before is not guild
+    assert updates[1].changes == {}
+    # later updates to the guild don't leak into an earlier event's before
+    assert updates[0].before.description is None
+    assert updates[2].before.description is None
+    assert (updates[2].before.mfa_level, updates[2].after.description) == (1, "updated")
+
+
+@pytest.mark.asyncio
+async def test_update_guild_lazy_before(bot: Client, monkeypatch) -> None:
+    guild = bot.cache.place_guild_data(SAMPLE_GUILD_DATA())
+    updates = []
+    bot.add_listener(Listener.create(GuildUpdate, inline=True)(updates.append))
+    copied = []
+    shallow_copy = copy.copy
+    monkeypatch.setattr(copy, "copy", lambda obj: copied.append(obj) or shallow_copy(obj))
+
+    data = SAMPLE_GUILD_DATA()
+    data["mfa_level"] = 1
+    await bot._on_raw_guild_update.callback(bot, RawGatewayEvent(data, override_name="raw_guild_update"))
+    # before is never read, so the guild is never copied
+    del updates[0]
+    await bot._on_raw_guild_update.callback(
+        bot, RawGatewayEvent(data | {"mfa_level": 2}, override_name="raw_guild_update")
+    )
+    assert copied == []
+
+    assert updates[0].before.mfa_level == 1
+    assert copied == [guild]
+
+
+@pytest.mark.asyncio
+async def test_cache_snapshot(tmp_path) -> None:
+    bot = Client(cache_snapshot_path=tmp_path / "cache.snapshot")
+    bot._user = ClientUser.from_dict(SAMPLE_USER_DATA() | {"verified": True, "mfa_enabled": False}, bot)
+    guild = bot.cache.place_guild_data(SAMPLE_GUILD_DATA())
+    guild.chunked.set()
+    bot.cache.place_channel_data(SAMPLE_DM_DATA())
+    assert await bot.cache_snapshot.save() == 3
+
+    new_bot = Client(cache_snapshot_path=tmp_path / "cache.snapshot")
+    new_bot._user = ClientUser.from_dict(SAMPLE_USER_DATA() | {"verified": True, "mfa_enabled": False}, new_bot)
+    assert new_bot.cache_snapshot.load() == 3
+
+    # objects are only materialized when accessed
+    assert isinstance(new_bot.cache.guild_cache, LazyCache)
+    assert new_bot.cache.guild_cache.frozen_count == 1
+    if sys.platform != "win32":
+        # frozen objects are views of the mapped snapshot, rather than copies read into memory
+        assert isinstance(new_bot.cache.guild_cache.get_frozen(guild.id).obj, mmap.mmap)
+    # objects that were never materialized are saved as they were loaded
+    assert await new_bot.cache_snapshot.save() == 3
+    assert new_bot.cache.guild_cache.frozen_count == 1
+
+    restored = new_bot.get_guild(guild.id)
+    assert isinstance(restored, Guild)
+    assert restored is not guild
+    assert restored.name == guild.name
+    assert restored._client is new_bot
+    assert restored.chunked.is_set()
+    assert new_bot.cache.guild_cache.frozen_count == 0
+    assert new_bot.guilds == [restored]
+
+    # guilds the gateway no longer reports are discarded
+    new_bot.cache_snapshot.discard_missing_guilds(set())
+    assert new_bot.get_guild(guild.id) is None
+
+
+@pytest.mark.asyncio
+async def test_hydrate_guild(bot: Client) -> None:
+    fake = FakeDiscord(guilds=1, members_per_guild=500, channels_per_guild=20)
+    data = fake.guild_create_payload(fake.guilds[0])
+    data["members"] = fake.guilds[0]["_members"]
+    observed = []
+
+    async def observe() -> None:
+        while (guild := bot.cache.get_guild(to_snowflake(data["id"]))) is None or guild.hydrating:
+            if guild is not None:
+                observed.append(len(guild._member_ids))
+            await asyncio.sleep(0)
+
+    observer = asyncio.create_task(observe())
+    guild = await bot.cache.hydrate_guild_data(data, time_budget=0.0005)
+    await observer
+
+    assert not guild.hydrating
+    assert observed
+    assert len(guild._member_ids) == 500
+    assert len(guild._channel_ids) == 20
+    assert len(guild._role_ids) == 1
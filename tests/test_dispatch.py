@@ -0,0 +1,325 @@
+import asyncio
+import logging
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from interactions import Client, Listener
+from interactions.api.events import (
+    Error,
+    EventLoopBlocked,
+    MemberUpdate,
+    RawGatewayEvent,
+    TaskLimitExceeded,
+    TypingStart,
+)
+from interactions.api.events.base import _dispatch_payload
+from interactions.client.coalescing import EventCoalescer
+from interactions.client.const import get_logger
+from interactions.client.loop_monitor import LoopMonitor
+from interactions.testing import benchmark_dispatch
+from interactions.testing.benchmarks import BenchmarkEvent
+
+__all__ = (
+    "test_inline_listeners",
+    "test_batch_listeners",
+    "test_dispatch_benchmark",
+    "test_keyed_waits",
+    "test_demanded_processors",
+    "test_filtered_listeners",
+    "test_event_coalescing",
+    "test_loop_monitor",
+    "test_log_sampling",
+    "test_eager_tasks",
+)
+
+
+@pytest.mark.asyncio
+async def test_inline_listeners() -> None:
+    bot = Client()
+    received = []
+    errors = []
+
+    def on_event(event: BenchmarkEvent) -> None:
+        received.append(event.value)
+        if event.value == 2:
+            raise ValueError("inline listener failed")
+
+    async def on_error(event: Error) -> None:
+        errors.append(event.error)
+
+    bot.add_listener(Listener.create(BenchmarkEvent, inline=True)(on_event))
+    bot.add_listener(Listener.create(Error)(on_error))
+
+    for i in range(3):
+        bot.dispatch(BenchmarkEvent(i))
+    # inline listeners run before dispatch returns
+    assert received == [0, 1, 2]
+
+    await asyncio.sleep(0)
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+    with pytest.raises(TypeError):
+        Listener.create(BenchmarkEvent, inline=True)(on_error)
+    with pytest.raises(ValueError):
+        Listener.create(BenchmarkEvent, inline=True, delay_until_ready=True)(on_event)
+    # meta listeners are awaited, so they can't be inline
+    with pytest.raises(ValueError):
+        bot.add_listener(Listener.create("event", inline=True)(on_event))
+
+
+@pytest.mark.asyncio
+async def test_batch_listeners() -> None:
+    bot = Client(batch_listeners=True)
+    order = []
+
+    async def first(event: BenchmarkEvent) -> None:
+        await asyncio.sleep(0)
+        order.append(("first", event.value))
+
+    async def second(event: BenchmarkEvent) -> None:
+        order.append(("second", event.value))
+
+    bot.add_listener(Listener.create(BenchmarkEvent)(first))
+    bot.add_listener(Listener.create(BenchmarkEvent)(second))
+
+    tasks = len(asyncio.all_tasks())
+    bot.dispatch(BenchmarkEvent(1))
+    # one task for both listeners, and none for waits as nothing is waiting
+    assert len(asyncio.all_tasks()) == tasks + 1
+
+    await asyncio.sleep(0.01)
+    # listeners of an event run one after another
+    assert order == [("first", 1), ("second", 1)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["task", "batch", "inline"])
+async def test_dispatch_benchmark(mode: str) -> None:
+    result = await benchmark_dispatch(events=1000, listeners=2, mode=mode)
+    assert result["events"] == 1000
+    assert result["events_per_second"] > 0
+    assert result["cpu_time"] > 0
+
+    level = get_logger().level
+    result = await benchmark_dispatch(events=1000, listeners=2, mode=mode, debug_logging=True)
+    assert result["debug_logging"] and result["cpu_time"] > 0
+    assert get_logger().level == level
+
+
+@pytest.mark.asyncio
+async def test_keyed_waits() -> None:
+    bot = Client()
+    bot.wait_keys["benchmark_event"] = lambda event: (event.value,)
+
+    waits = [asyncio.ensure_future(bot.wait_for(BenchmarkEvent, key=i, timeout=1)) for i in range(1000)]
+    predicate = asyncio.ensure_future(bot.wait_for(BenchmarkEvent, checks=lambda e: e.value == 5, timeout=1))
+    multiple = asyncio.ensure_future(bot.wait_for(BenchmarkEvent, key={5000, 5}, timeout=1))
+    await asyncio.sleep(0)
+
+    bot.dispatch(BenchmarkEvent(5))
+    assert (await waits[5]).value == 5
+    assert (await predicate).value == 5
+    assert (await multiple).value == 5
+    assert not any(wait.done() for i, wait in enumerate(waits) if i != 5)
+    # resolved waits are removed from every key they were registered with
+    assert 5 not in bot._keyed_waits["benchmark_event"]
+    assert 5000 not in bot._keyed_waits["benchmark_event"]
+    assert bot.waits["benchmark_event"] == []
+
+    for wait in waits:
+        wait.cancel()
+    await asyncio.sleep(0.01)
+    assert not bot._keyed_waits["benchmark_event"]
+
+    with pytest.raises(ValueError):
+        await bot.wait_for("some_event", key=1)
+
+
+@pytest.mark.asyncio
+async def test_demanded_processors() -> None:
+    bot = Client()
+    typing = RawGatewayEvent({}, override_name="raw_typing_start")
+    # processors that don't declare what they produce always do their full work
+    assert bot.is_demanded(RawGatewayEvent({}, override_name="raw_guild_create"))
+    assert not bot.has_listeners(TypingStart)
+    assert not bot.is_demanded(typing)
+
+    wait = asyncio.ensure_future(bot.wait_for(TypingStart, timeout=1))
+    await asyncio.sleep(0)
+    assert bot.is_demanded(typing)
+    wait.cancel()
+
+    async def on_typing(event: TypingStart) -> None: ...
+
+    bot.add_listener(Listener.create(TypingStart)(on_typing))
+    assert bot.has_listeners("typing_start")
+    assert bot.is_demanded(typing)
+
+
+@pytest.mark.asyncio
+async def test_filtered_listeners() -> None:
+    bot = Client()
+    received = []
+
+    for channel_id in range(1000):
+
+        def on_event(event: BenchmarkEvent, channel_id: int = channel_id) -> None:
+            received.append(channel_id)
+
+        bot.add_listener(Listener.create(BenchmarkEvent, inline=True, filters={"channel_id": channel_id})(on_event))
+
+    def on_author(event: BenchmarkEvent) -> None:
+        received.append("author")
+
+    author = Listener.create(BenchmarkEvent, inline=True, filters={"channel_id": [5, 6], "author.id": 10})(on_author)
+    bot.add_listener(author)
+
+    def dispatch(payload: dict | None) -> list:
+        received.clear()
+        token = _dispatch_payload.set(payload)
+        try:
+            bot.dispatch(BenchmarkEvent())
+        finally:
+            _dispatch_payload.reset(token)
+        return received
+
+    assert dispatch({"channel_id": "5", "author": {"id": "10"}}) == [5, "author"]
+    assert dispatch({"channel_id": "6", "author": {"id": "11"}}) == [6]
+    assert dispatch({"channel_id": "1234"}) == []
+    # filters can't be checked without a payload
+    assert dispatch(None) == []
+
+    typing = RawGatewayEvent({"channel_id": "2"}, override_name="raw_typing_start")
+    on_typing = Listener.create(TypingStart, inline=True, filters={"channel_id": 1})(lambda: None)
+    bot.add_listener(on_typing)
+    assert bot.has_listeners(TypingStart)
+    assert not bot.is_demanded(typing)
+    assert bot.is_demanded(RawGatewayEvent({"channel_id": "1"}, override_name="raw_typing_start"))
+
+    bot.remove_listener(author)
+    assert dispatch({"channel_id": "5", "author": {"id": "10"}}) == [5]
+    bot.remove_listener(on_typing)
+    assert not bot.has_listeners(TypingStart)
+
+
+@pytest.mark.asyncio
+async def test_event_coalescing() -> None:
+    coalescer = EventCoalescer({BenchmarkEvent: 0.05, MemberUpdate: 0.05}, keys={BenchmarkEvent: lambda e: e.value % 3})
+    bot = Client(event_coalescer=coalescer)
+    received = []
+    updates = []
+    bot.add_listener(Listener.create(BenchmarkEvent, inline=True)(lambda event: received.append(event.value)))
+    bot.add_listener(Listener.create(MemberUpdate, inline=True)(updates.append))
+    batches = []
+
+    async def on_event(event: BenchmarkEvent) -> None:
+        batches.append(asyncio.current_task())
+
+    bot.add_listener(Listener.create(BenchmarkEvent)(on_event))
+
+    for i in range(30):
+        bot.dispatch(BenchmarkEvent(i))
+    for i in range(3):
+        member = SimpleNamespace(id=1, nick=str(i))
+        bot.dispatch(MemberUpdate(guild_id=2, before=SimpleNamespace(id=1, nick=str(i - 1)), after=member))
+    assert received == []
+
+    await asyncio.sleep(0.1)
+    assert sorted(received) == [27, 28, 29]
+    assert coalescer.metrics["benchmark_event"] == {"received": 30, "delivered": 3, "dropped": 27, "pending": 0}
+    # the window's listener invocations run in one task
+    assert len(batches) == 3 and len(set(batches)) == 1
+    # the delivered update spans the whole burst
+    assert len(updates) == 1
+    assert (updates[0].before.nick, updates[0].after.nick) == ("-1", "2")
+
+    bot.dispatch(BenchmarkEvent(1))
+    coalescer.flush()
+    assert received[-1] == 1
+
+    with pytest.raises(ValueError):
+        EventCoalescer({BenchmarkEvent: 1})
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor() -> None:
+    monitor = LoopMonitor(interval=0.01, block_threshold=0.1, census_interval=0.01, max_tasks=0)
+    bot = Client(loop_monitor=monitor)
+    blocked = []
+    census = []
+    bot.add_listener(Listener.create(EventLoopBlocked, inline=True)(blocked.append))
+    bot.add_listener(Listener.create(TaskLimitExceeded, inline=True)(census.append))
+
+    async def block() -> None:
+        time.sleep(0.3)
+
+    monitor.start(bot)
+    try:
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(block(), name="blocking task")
+        await asyncio.sleep(0.05)
+    finally:
+        monitor.stop()
+
+    assert monitor.blocks == 1
+    assert blocked[0].duration >= 0.1
+    assert blocked[0].task_name == "blocking task"
+    assert "time.sleep" in blocked[0].stack
+    assert census
+    assert census[-1].census["interactions:: loop monitor"] == 1
+    # unnamed tasks are counted together, without their numbers
+    assert "Task" in census[-1].census
+    assert census[-1].total == sum(census[-1].census.values())
+
+
+@pytest.mark.asyncio
+async def test_log_sampling(caplog) -> None:
+    bot = Client(log_sampling={"dispatch": 10})
+    bot.add_listener(Listener.create(BenchmarkEvent, inline=True)(lambda event: None))
+
+    with caplog.at_level(logging.DEBUG, logger=bot.logger.name):
+        for i in range(100):
+            bot.dispatch(BenchmarkEvent(i))
+    assert sum(record.getMessage() == "Dispatching Event: benchmark_event" for record in caplog.records) == 10
+    assert bot.log_sampler.suppressed["dispatch"] == 90
+
+    # nothing is sampled, or formatted, while debug logging is off
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger=bot.logger.name):
+        bot.dispatch(BenchmarkEvent(0))
+    assert not caplog.records
+    assert bot.log_sampler.suppressed["dispatch"] == 90
+
+
+@pytest.mark.asyncio
+async def test_eager_tasks() -> None:
+    bot = Client(eager_tasks=True)
+    received = []
+
+    def first(event: BenchmarkEvent) -> None:
+        received.append("first")
+        bot.remove_listener(listener)
+
+    async def second(event: BenchmarkEvent) -> None:
+        received.append("second")
+
+    listener = Listener.create(BenchmarkEvent, inline=True)(first)
+    bot.add_listener(listener)
+    bot.add_listener(Listener.create(BenchmarkEvent)(second))
+
+    # listeners that remove themselves mid-dispatch don't cause the next listener to be skipped
+    bot.dispatch(BenchmarkEvent(0))
+    await asyncio.sleep(0)
+    assert received == ["first", "second"]
+
+    if sys.version_info >= (3, 12):
+        bot._enable_eager_tasks()
+        try:
+            bot.dispatch(BenchmarkEvent(1))
+            # the listener's task ran without waiting for the loop
+            assert received == ["first", "second", "second"]
+        finally:
+            asyncio.get_running_loop().set_task_factory(None)
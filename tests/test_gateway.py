@@ -0,0 +1,646 @@
+import asyncio
+import copy
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from interactions import AutoShardedClient, Client, Intents, Listener
+from interactions.api.events import RawGatewayEvent, ShardHealthy, ShardRestart, ShardUnhealthy, TypingStart
+from interactions.api.gateway import gateway as gateway_module
+from interactions.api.gateway.gateway import GatewayClient
+from interactions.api.gateway.identify import IdentifyScheduler
+from interactions.api.gateway.recorder import GatewayRecorder, GatewayReplayer
+from interactions.api.gateway.session import FileSessionStore, GatewaySession
+from interactions.client.cluster import ClusterClient, ClusterManager, ClusterState
+from interactions.client.resharding import Resharder
+from interactions.client.supervisor import ShardSupervisor
+from interactions.client.tracing import InMemorySpanExporter, Tracer
+from interactions.testing import FakeDiscord
+from tests.consts import SAMPLE_GUILD_DATA, SAMPLE_USER_DATA
+
+__all__ = ()
+
+
+def _gateway(client: Client) -> GatewayClient:
+    return GatewayClient(client._connection_state, (0, 1))
+
+
+@pytest.mark.asyncio
+async def test_pipeline_preserves_guild_order() -> None:
+    bot = Client(dispatch_workers=4, dispatch_queue_size=100)
+    received: dict[str, list[int]] = {}
+
+    @bot.add_event_processor("raw_test_event")
+    async def _process(event: RawGatewayEvent) -> None:
+        await asyncio.sleep(random.random() / 1000)
+        received.setdefault(event.data["guild_id"], []).append(event.data["index"])
+
+    gateway = _gateway(bot)
+    pipeline = gateway.dispatch_pipeline
+    pipeline.start()
+    try:
+        for index in range(50):
+            for guild_id in ("1", "2", "3"):
+                await pipeline.put({"guild_id": guild_id, "index": index}, index, "TEST_EVENT")
+        await pipeline.join()
+    finally:
+        await pipeline.stop()
+
+    assert received == {guild_id: list(range(50)) for guild_id in ("1", "2", "3")}
+    assert pipeline.processed == 150
+    assert pipeline.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backpressure() -> None:
+    bot = Client(dispatch_workers=1, dispatch_queue_size=2)
+    gateway = _gateway(bot)
+    pipeline = gateway.dispatch_pipeline
+
+    await pipeline.put({"guild_id": "1"}, 1, "TEST_EVENT")
+    await pipeline.put({"guild_id": "1"}, 2, "TEST_EVENT")
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(pipeline.put({"guild_id": "1"}, 3, "TEST_EVENT"), 0.1)
+
+    assert pipeline.saturated == 1
+    assert pipeline.depth == 2
+    await pipeline.stop()
+    assert pipeline.depth == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stop_keeps_unprocessed() -> None:
+    bot = Client(dispatch_workers=2, dispatch_queue_size=100)
+    release = asyncio.Event()
+
+    @bot.add_event_processor("raw_test_event")
+    async def _process(event: RawGatewayEvent) -> None:
+        if event.data["guild_id"] == 2:
+            await release.wait()
+
+    gateway = _gateway(bot)
+    pipeline = gateway.dispatch_pipeline
+    pipeline.start()
+    for seq in range(1, 11):
+        await pipeline.put({"guild_id": 1 if seq % 2 else 2}, seq, "TEST_EVENT")
+
+    # integer guild ids are hashed deterministically, so each guild has its own worker. Guild 2 never finishes,
+    # so its dispatches are discarded once the timeout expires
+    await pipeline.stop(timeout=0.1)
+    assert pipeline.oldest_unprocessed == 2
+    assert pipeline.processed == 5
+
+    pipeline.start()
+    release.set()
+    for seq in range(11, 14):
+        await pipeline.put({"guild_id": 2}, seq, "TEST_EVENT")
+    await pipeline.stop(timeout=1)
+    assert pipeline.oldest_unprocessed is None
+    assert pipeline.processed == 8
+
+
+@pytest.mark.asyncio
+async def test_file_session_store(tmp_path) -> None:
+    store = FileSessionStore(tmp_path, max_age=60)
+    assert await store.pop(0, 1) is None
+
+    bot = Client()
+    gateway = GatewayClient(
+        bot._connection_state,
+        (0, 1),
+        session=GatewaySession(shard_id=0, total_shards=1, session_id="abc", sequence=42, resume_url="wss://resume"),
+    )
+    session = gateway.get_session()
+    await store.save(session)
+
+    # sessions are stored per shard count
+    assert await store.pop(0, 2) is None
+
+    loaded = await store.pop(0, 1)
+    assert loaded.session_id == "abc"
+    assert loaded.sequence == 42
+    assert loaded.resume_url == "wss://resume"
+    # a session is never resumed twice
+    assert await store.pop(0, 1) is None
+
+    session.saved_at -= 120
+    await store.save(session)
+    assert await store.pop(0, 1) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sharded", [False, True])
+async def test_resume_persisted_session(tmp_path, sharded: bool) -> None:
+    store = FileSessionStore(tmp_path)
+    kwargs = {"total_shards": 2} if sharded else {}
+    client_cls = AutoShardedClient if sharded else Client
+    async with FakeDiscord(guilds=4, max_concurrency=2) as fake:
+        bot = client_cls(
+            token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, session_store=store, **kwargs
+        )
+        task = asyncio.create_task(bot.astart())
+        await asyncio.wait_for(bot._ready.wait(), 10)
+        await bot.stop()
+        await task
+
+        # the cache is warm, as it would be if the bot kept it between restarts
+        resumed = client_cls(
+            token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, session_store=store, **kwargs
+        )
+        for guild in fake.guilds:
+            resumed.cache.place_guild_data(copy.deepcopy(fake.guild_create_payload(guild)))
+        task = asyncio.create_task(resumed.astart())
+        try:
+            await asyncio.wait_for(resumed._ready.wait(), 10)
+            assert fake.stats["resumes"] == (2 if sharded else 1)
+            assert resumed.user._guild_ids == {int(guild["id"]) for guild in fake.guilds}
+            if sharded:
+                assert sum(len(resumed.get_shards_guild(shard_id)) for shard_id in (0, 1)) == 4
+        finally:
+            await resumed.stop()
+            await task
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_processed_dispatches(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(gateway_module, "_PIPELINE_DRAIN_TIMEOUT", 0.1)
+    store = FileSessionStore(tmp_path)
+    async with FakeDiscord(guilds=2) as fake:
+
+        async def run(block: bool) -> list[int]:
+            bot = Client(
+                token=fake.token,
+                api_url=fake.api_url,
+                gateway_url=fake.gateway_url,
+                session_store=store,
+                dispatch_workers=2,
+            )
+            for guild in fake.guilds:
+                bot.cache.place_guild_data(copy.deepcopy(fake.guild_create_payload(guild)))
+            processed = []
+
+            @bot.add_event_processor("raw_test_event")
+            async def _process(event: RawGatewayEvent) -> None:
+                if block and event.data["guild_id"] == 2:
+                    # this guild's partition is slow, so its dispatches are still queued when the bot stops
+                    await asyncio.Event().wait()
+                processed.append(event.data["n"])
+
+            task = asyncio.create_task(bot.astart())
+            try:
+                await asyncio.wait_for(bot._ready.wait(), 10)
+                if block:
+                    session = next(iter(fake.sessions.values()))
+                    for n in range(1, 7):
+                        # integer guild ids are hashed deterministically, so each guild has its own worker
+                        await session.dispatch("TEST_EVENT", {"guild_id": 1 if n % 2 else 2, "n": n})
+                    while len(processed) < 3:
+                        await asyncio.sleep(0.01)
+                else:
+                    while len(processed) < 3:
+                        await asyncio.sleep(0.01)
+                    await asyncio.sleep(0.1)
+            finally:
+                await bot.stop()
+                await task
+            return processed
+
+        assert sorted(await asyncio.wait_for(run(block=True), 10)) == [1, 3, 5]
+        # the resume replays everything from the first unprocessed dispatch, but only those are processed again
+        assert sorted(await asyncio.wait_for(run(block=False), 10)) == [2, 4, 6]
+        assert fake.stats["resumes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cluster_ipc() -> None:
+    manager = ClusterManager(lambda shard_ids, total_shards: None, "token", total_shards=2)
+    manager.clusters = [ClusterState(cluster_id=0, shard_ids=[0]), ClusterState(cluster_id=1, shard_ids=[1])]
+    manager._server = await asyncio.start_server(manager._handle_connection, "127.0.0.1", 0)
+    address = manager._server.sockets[0].getsockname()[:2]
+
+    received = []
+    workers = []
+    for cluster in manager.clusters:
+        bot = AutoShardedClient(shard_ids=cluster.shard_ids, total_shards=2)
+        bot.dispatch = received.append
+        worker = ClusterClient(bot, cluster.cluster_id, address, manager._secret)
+        await worker.connect()
+        worker.register_query("shards")(lambda b=bot: b.shard_ids)
+        workers.append(worker)
+
+    try:
+        assert await workers[0].query("shards") == [[0], [1]]
+        assert await workers[1].total_guild_count() == 0
+
+        await workers[0].broadcast({"hello": "world"})
+        await asyncio.sleep(0.1)
+        assert [(e.data, e.cluster_id) for e in received] == [({"hello": "world"}, 0)] * 2
+
+        manager.clusters[1].guild_count = -1
+        await workers[1].send_status()
+        await asyncio.sleep(0.1)
+        assert manager.clusters[1].guild_count == 0
+        assert not manager.is_ready
+
+        # shards in the same identify bucket are spaced out
+        await workers[0].request_identify(0)
+        pending = asyncio.create_task(workers[1].request_identify(2))
+        await asyncio.sleep(0.1)
+        assert not pending.done()
+
+        # losing the supervisor fails pending requests, rather than leaving them waiting forever
+        manager.clusters[1]._writer.close()
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(pending, 1)
+
+        # a deliberately stopped cluster isn't restarted, whatever its exit code
+        workers[0].client._closed = True
+        await workers[0].close()
+        await asyncio.sleep(0.1)
+        assert manager.clusters[0]._stopped
+        assert not manager.clusters[1]._stopped
+    finally:
+        for worker in workers:
+            await worker.close()
+        manager._server.close()
+
+
+@pytest.mark.asyncio
+async def test_identify_scheduler() -> None:
+    scheduler = IdentifyScheduler(max_concurrency=4, interval=0.2)
+    assert scheduler.expected_duration(range(16)) == pytest.approx(0.6)
+
+    granted: dict[int, float] = {}
+
+    async def identify(shard_id: int) -> None:
+        await scheduler.acquire(shard_id)
+        granted[shard_id] = time.monotonic()
+
+    start = time.monotonic()
+    await asyncio.gather(*(identify(shard_id) for shard_id in range(8)))
+
+    # every key identifies in the first window
+    assert all(granted[shard_id] - start < 0.1 for shard_id in range(4))
+    # and each key only identifies once per window
+    assert all(granted[shard_id + 4] - granted[shard_id] >= 0.19 for shard_id in range(4))
+    assert scheduler.identify_count == 8
+    assert scheduler.actual_duration == pytest.approx(0.2, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_record_and_replay(tmp_path) -> None:
+    recorder = GatewayRecorder(tmp_path / "traffic.jsonl.gz")
+    ready = {
+        "user": SAMPLE_USER_DATA() | {"verified": True, "mfa_enabled": False},
+        "guilds": [{"id": SAMPLE_GUILD_DATA()["id"], "unavailable": True}],
+        "session_id": "abc",
+        "resume_gateway_url": "wss://resume",
+    }
+    recorder.record(0, 1, "READY", ready)
+    recorder.record(0, 2, "GUILD_CREATE", SAMPLE_GUILD_DATA() | {"channels": [], "members": [], "threads": []})
+    recorder.close()
+
+    bot = Client()
+    received = []
+
+    async def on_guild_create(event: RawGatewayEvent) -> None:
+        await asyncio.sleep(0.1)
+        received.append(event)
+
+    bot.add_listener(Listener.create("raw_guild_create")(on_guild_create))
+
+    stats = await GatewayReplayer(bot, recorder.path, speed=None).run()
+
+    # the replay waits for the tasks the dispatches started
+    assert len(received) == 1
+    assert stats.duration >= 0.1
+    assert stats.frames == 2
+    assert stats.events == {"READY": 1, "GUILD_CREATE": 1}
+    assert bot.user.id == int(SAMPLE_USER_DATA()["id"])
+    assert bot.get_guild(SAMPLE_GUILD_DATA()["id"]) is not None
+
+
+@pytest.mark.asyncio
+async def test_fake_discord() -> None:
+    async with FakeDiscord(guilds=6, members_per_guild=5, message_rate=200, max_concurrency=2) as fake:
+        bot = AutoShardedClient(token=fake.token, total_shards=2, api_url=fake.api_url, gateway_url=fake.gateway_url)
+        messages = []
+
+        @bot.listen("message_create")
+        async def _on_message(event) -> None:
+            messages.append(event.message)
+
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            assert len(bot.guilds) == 6
+            assert sum(len(bot.get_shards_guild(shard_id)) for shard_id in (0, 1)) == 6
+            assert {len(state.client.cache.guild_cache) for state in bot._connection_states} == {6}
+
+            await asyncio.sleep(0.2)
+            assert messages
+
+            await fake.reconnect_all()
+            await asyncio.sleep(0.5)
+            assert fake.stats["identifies"] == 2
+            assert fake.stats["resumes"] == 2
+
+            telemetry = bot.telemetry
+            assert all(shard["reconnects"] == {"requested by gateway": 1} for shard in telemetry.values())
+            assert all(shard["resumes"] == 1 for shard in telemetry.values())
+            assert sum(shard["events"]["MESSAGE_CREATE"] for shard in telemetry.values()) >= len(messages)
+            assert all(shard["decompressed_bytes"] > shard["compressed_bytes"] > 0 for shard in telemetry.values())
+            assert bot.get_busiest_shard() in bot.shards
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_offloaded_payloads() -> None:
+    async with FakeDiscord(guilds=3, members_per_guild=300, message_rate=500) as fake:
+        # every payload is offloaded, so the zlib stream must still be decompressed in order
+        bot = Client(token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, gateway_offload_threshold=1)
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            assert len(bot.guilds) == 3
+            await asyncio.sleep(0.2)
+
+            # stop the traffic and let everything already sent come through
+            fake.message_rate = 0
+            telemetry = bot._connection_state.telemetry
+
+            async def drained() -> None:
+                while telemetry.events["MESSAGE_CREATE"] < fake.stats["messages"]:
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(drained(), 5)
+            assert telemetry.events["MESSAGE_CREATE"] > 0
+            assert telemetry.payloads == telemetry.frames
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_background_chunking() -> None:
+    async with FakeDiscord(guilds=3, members_per_guild=300) as fake:
+        bot = Client(
+            token=fake.token,
+            api_url=fake.api_url,
+            gateway_url=fake.gateway_url,
+            intents=Intents.DEFAULT | Intents.GUILD_MEMBERS,
+            fetch_members=True,
+            chunk_in_background=True,
+        )
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            scheduler = bot._connection_state.chunk_scheduler
+            # ready doesn't wait for chunking
+            assert scheduler.completed < 3
+
+            await asyncio.wait_for(scheduler.wait_until_complete(), 10)
+            assert scheduler.progress["completed"] == 3
+            assert all(len(guild.members) == 300 for guild in bot.guilds)
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_sharded_background_chunking() -> None:
+    async with FakeDiscord(guilds=3, members_per_guild=300) as fake:
+        bot = AutoShardedClient(
+            token=fake.token,
+            api_url=fake.api_url,
+            gateway_url=fake.gateway_url,
+            total_shards=2,
+            intents=Intents.DEFAULT | Intents.GUILD_MEMBERS,
+            fetch_members=True,
+            chunk_in_background=True,
+            chunk_filter=lambda guild: False,
+        )
+        task = asyncio.create_task(bot.astart())
+        try:
+            # skipped guilds never finish chunking, so ready can't wait for them
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            assert len(bot.guilds) == 3
+            assert not any(guild.chunked.is_set() for guild in bot.guilds)
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_resolve_members() -> None:
+    async with FakeDiscord(guilds=1, members_per_guild=300) as fake:
+        bot = Client(
+            token=fake.token,
+            api_url=fake.api_url,
+            gateway_url=fake.gateway_url,
+            intents=Intents.DEFAULT | Intents.GUILD_MEMBERS,
+        )
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            guild = bot.guilds[0]
+            # large guilds only include the bot in GUILD_CREATE
+            assert len(guild._member_ids) == 1
+
+            ids = [member["user"]["id"] for member in fake.guilds[0]["_members"][:150]]
+            resolved = await guild.resolve_members([*ids, "1234567890"])
+            assert set(resolved) == {int(member_id) for member_id in ids}
+            # the bot was cached, the other 149 members are requested in two batches
+            assert fake.stats["member_requests"] == 2
+            assert len(guild._member_ids) == 150
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+def test_reshard_dedupe() -> None:
+    resharder = Resharder(AutoShardedClient(total_shards=1), 2)
+    old, new = SimpleNamespace(state=object()), SimpleNamespace(state=object())
+    resharder._warm[new.state] = asyncio.Event()
+    member = {"guild_id": "1", "user": {"id": "2"}, "nick": "a", "roles": ["3"]}
+
+    def deliver(gateway: SimpleNamespace, data: dict, event: str = "GUILD_MEMBER_UPDATE") -> bool:
+        return resharder._dedupe_filter(gateway, None, event, copy.deepcopy(data))
+
+    assert deliver(old, member)
+    # the same update from the other set of shards is suppressed
+    assert not deliver(new, member)
+    assert deliver(new, member | {"nick": "b"})
+    assert deliver(old, member | {"nick": "b", "roles": ["4", "3"]})
+    assert resharder.suppressed == 1
+
+    # a presence flapping during the overlap is delivered once per change, by whichever shard sends it first
+    online = {"guild_id": "1", "user": {"id": "2"}, "status": "online", "activities": [{"name": "a", "type": 0}]}
+    idle = online | {"status": "idle"}
+    playing = online | {"activities": [{"name": "b", "type": 0}]}
+    assert [deliver(old, presence, "PRESENCE_UPDATE") for presence in (online, idle, online, playing)] == [True] * 4
+    assert [deliver(new, presence, "PRESENCE_UPDATE") for presence in (online, idle, online, playing)] == [False] * 4
+    assert resharder.suppressed == 5
+
+
+@pytest.mark.asyncio
+async def test_reshard() -> None:
+    async with FakeDiscord(guilds=6, message_rate=50) as fake:
+        bot = AutoShardedClient(token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, total_shards=1)
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            old_shard = bot.shards[0]
+            bot.identify_scheduler.interval = 0
+
+            await asyncio.wait_for(bot.reshard(2, overlap=0.2), 10)
+            assert bot.total_shards == 2
+            assert [shard.shard_id for shard in bot.shards] == [0, 1]
+            assert old_shard.gateway is None
+            assert len(bot.guilds) == 6
+            assert not task.done()
+
+            # events are delivered by the new shards
+            await asyncio.sleep(0.5)
+            assert all(shard.telemetry.events["MESSAGE_CREATE"] for shard in bot.shards)
+            assert all(shard.dispatch_filter is None for shard in bot.shards)
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_shard_supervisor() -> None:
+    async with FakeDiscord(guilds=4, shards=2, max_concurrency=2, heartbeat_interval=0.1) as fake:
+        supervisor = ShardSupervisor(interval=0.1, backoff_base=0.01)
+        bot = AutoShardedClient(
+            token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, shard_supervisor=supervisor
+        )
+        received = []
+
+        async def record(event) -> None:
+            received.append(event)
+
+        for event in (ShardUnhealthy, ShardRestart, ShardHealthy):
+            bot.add_listener(Listener.create(event)(record))
+
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            bot.identify_scheduler.interval = 0
+            healthy, dead = bot.shards
+            session_id = healthy.gateway.session_id
+
+            # kill a shard, the supervisor should restart it without touching the other
+            dead.gateway.close()
+            await asyncio.sleep(0.05)
+            await asyncio.wait_for(dead._shard_ready.wait(), 10)
+
+            assert healthy.gateway.session_id == session_id
+            assert supervisor.restarts == 1
+            assert [type(e) for e in received[:2]] == [ShardUnhealthy, ShardRestart]
+            assert received[0].shard_id == 1 and received[0].reasons == ["disconnected"]
+
+            await asyncio.sleep(0.3)
+            assert isinstance(received[-1], ShardHealthy)
+            assert all(health["status"] == "healthy" for health in supervisor.health.values())
+            assert not task.done()
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_shard_supervisor_restarts_one_at_a_time() -> None:
+    async with FakeDiscord(guilds=4, shards=2, max_concurrency=2, heartbeat_interval=0.1) as fake:
+        supervisor = ShardSupervisor(interval=0.05, backoff_base=0.01)
+        bot = AutoShardedClient(
+            token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, shard_supervisor=supervisor
+        )
+        ready_at_restart = []
+
+        async def record(event: ShardRestart) -> None:
+            ready_at_restart.append({shard.shard_id for shard in bot.shards if shard._shard_ready.is_set()})
+
+        bot.add_listener(Listener.create(ShardRestart)(record))
+
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            bot.identify_scheduler.interval = 0
+
+            for shard in bot.shards:
+                shard.gateway.close()
+            await asyncio.sleep(0.05)
+            await asyncio.wait_for(asyncio.gather(*(shard._shard_ready.wait() for shard in bot.shards)), 10)
+            await asyncio.sleep(0.05)
+
+            assert supervisor.restarts == 2
+            # the second shard is only restarted once the first is back
+            assert len(ready_at_restart[1]) == 1
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_shard_guild_index() -> None:
+    async with FakeDiscord(guilds=8, shards=2, max_concurrency=2) as fake:
+        bot = AutoShardedClient(token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url)
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            for shard in bot.shards:
+                assert bot.get_shard(shard.shard_id) is shard
+                expected = {int(guild["id"]) for guild in fake.guilds_for_shard((shard.shard_id, 2))}
+                assert shard.guild_ids == expected
+                assert {guild.id for guild in bot.get_shards_guild(shard.shard_id)} == expected
+                assert all(bot.get_guild_shard(guild_id) is shard for guild_id in expected)
+                assert all(bot.get_guild_websocket(guild_id) is shard.gateway for guild_id in expected)
+
+            guild = bot.get_shards_guild(1)[0]
+            session = next(session for session in fake.sessions.values() if session.shard == (1, 2))
+            await session.dispatch("GUILD_DELETE", {"id": str(guild.id), "unavailable": True})
+            await session.dispatch("GUILD_DELETE", {"id": str(bot.get_shards_guild(1)[1].id)})
+            await asyncio.sleep(0.1)
+            # unavailable guilds are still indexed
+            assert guild.id in bot.get_shard(1).guild_ids
+            assert len(bot.get_shards_guild(1)) == len(fake.guilds_for_shard((1, 2))) - 1
+        finally:
+            await bot.stop()
+            task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_tracing() -> None:
+    async with FakeDiscord(guilds=1) as fake:
+        exporter = InMemorySpanExporter()
+        bot = Client(token=fake.token, api_url=fake.api_url, gateway_url=fake.gateway_url, tracer=Tracer(exporter))
+
+        async def on_typing(event: TypingStart) -> None: ...
+
+        bot.add_listener(Listener.create(TypingStart)(on_typing))
+        task = asyncio.create_task(bot.astart())
+        try:
+            await asyncio.wait_for(bot._ready.wait(), 10)
+            exporter.clear()
+            session = next(iter(fake.sessions.values()))
+            # the user isn't cached, so the processor fetches them, which the fake rejects
+            await session.dispatch("TYPING_START", {"channel_id": "1", "user_id": "2", "timestamp": 0})
+            await asyncio.sleep(0.2)
+
+            root = next(span for span in exporter.spans if span.name == "gateway TYPING_START")
+            assert root.parent_id is None and root.attributes["event"] == "TYPING_START"
+            processor, http = exporter.get_trace(root.trace_id)[1:]
+            assert processor.name == "processor raw_typing_start" and processor.parent_id == root.span_id
+            assert processor.error is not None
+            assert http.name == "http" and http.parent_id == processor.span_id
+            assert http.attributes["route"] == "/users/{user_id}"
+            assert http.duration > 0
+        finally:
+            await bot.stop()
+            task.cancel()